@@ -1,21 +1,36 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from .api import *
+from .asyncapi import *
 from .color import *
+from .commandbatch import *
 from .const import *
 from .device import *
+from .devicecollection import *
+from .deviceregistry import *
+from .devicepoller import *
+from .deviceevents import *
 from .hardware import *
+from .hardwaretypes import *
 from .notification import *
 from .roomplan import *
 from .server import *
+from .asyncserver import *
 from .scene import *
+from .sceneregistry import *
+from .updatepipeline import *
 from .user import *
 from .uservariable import *
 from .utilities import *
 from .setting import *
 from .settings import Settings
+from .sun import *
 from .translation import *
+from .transport import *
 from .devicetimer import *
 from .setpointtimer import *
 from .scenetimer import *
 from .basetimer import *
+from .timerindex import *
+from .timerschedule import *
+from .timersync import *
@@ -1,10 +1,129 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import Future
 import urllib.parse as parse
-import requests
 import base64
+import codecs
 import json
+import threading
+import time
+
+# Optional faster JSON parsers, all parse the bytes of the response directly
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_backend = "orjson"
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+        _json_backend = "ujson"
+    except ImportError:
+        _json_loads = json.loads
+        _json_backend = "json"
+
+
+class _PerThread:
+    """Attribute of the API with a separate value for each thread"""
+
+    def __init__(self, default=None):
+        self._default = default
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj._local, self._name, self._default)
+
+    def __set__(self, obj, value):
+        setattr(obj._local, self._name, value)
+
+
+class _ResultStream:
+    """Incremental parser of a response, yields the items of the result list one at a time
+
+    The other values of the response are stored in data as soon as they are parsed.
+    Only the part of the response that is not parsed yet is kept in memory.
+    """
+
+    _decoder = json.JSONDecoder()
+    _whitespace = " \t\n\r"
+
+    def __init__(self, chunks, data):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._data = data
+
+    def __iter__(self):
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == API.RESULT and self._peek() == "[":
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self._data[key] = self._value()
+            if self._expect(",}") == "}":
+                return
+
+    def _more(self):
+        # Add the next chunk to the buffer and drop the parsed part
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            chunk = b""
+            self._eof = True
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(chunk, final=self._eof)
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        # Next character after whitespace, "" at the end of the response
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._whitespace:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._more():
+                return ""
+
+    def _expect(self, chars):
+        c = self._peek()
+        if c == "" or c not in chars:
+            raise ValueError("Unexpected {!r} in response".format(c))
+        self._pos += 1
+        return c
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except ValueError:
+                if self._eof:
+                    raise
+            self._more()
 
 
 class API:
@@ -16,6 +135,30 @@ class API:
         PROTOCOL_HTTPS,
     }
 
+    # JSON parser used for the responses: "orjson", "ujson" or "json"
+    JSON_BACKEND = _json_backend
+
+    # Size of the chunks read from a streamed response
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Calls that only read from Domoticz: type -> the params that read, None for any param.
+    # Besides these type=command&param=get... reads. Identical concurrent reads share
+    # one request, and the response is reused within the cache window. Any other call,
+    # also one that is not known here, is a write: it empties the cache and is not retried.
+    READ_TYPES = {
+        "devices": None,
+        "events": {"currentstates", "list"},
+        "hardware": None,
+        "plans": None,
+        "scenes": None,
+        "scenetimers": None,
+        "setpointtimers": None,
+        "settings": None,
+        "timers": None,
+        "users": None,
+    }
+    DEFAULT_CACHE_WINDOW = 0.5
+
     # type parameter
     TYPE = "type={}"
     TYPE_COMMAND = TYPE.format("command")
@@ -42,20 +185,37 @@ class API:
         UNKNOWN,
     }
 
+    # The status of the last call is maintained for each thread, so calls from
+    # other threads don't overwrite it.
+    _data = _PerThread()
+    _message = _PerThread()
+    _payload = _PerThread()
+    _querystring = _PerThread()
+    _status = _PerThread(UNKNOWN)
+    _title = _PerThread()
+
     def __init__(self, server):
         """ API class to maintain status of the API calls
 
+            The API object can be shared between threads. Each call returns an
+            :obj:`APIResponse` and the properties show the last call of the current thread.
+
             Args:
                 server (:obj:`Server`): Domoticz server object where to maintain the device            
         """
-        self._message = None
-        self._querystring = None
-        self._payload = None
+        self._local = threading.local()
         self._protocol = server.protocol
         self._server = server
-        self._status = self.UNKNOWN
-        self._title = None
-        self._session = None              # Session Object for Http Session
+        self._cache_window = getattr(server, "_cache_window", None)
+        if self._cache_window is None:
+            self._cache_window = self.DEFAULT_CACHE_WINDOW
+        # Responses of reads: querystring -> (time, APIResponse)
+        self._cache = {}
+        # Reads in progress: (querystring, generation) -> Future
+        self._flights = {}
+        # Incremented by each write, so reads started before it are not shared or cached
+        self._generation = 0
+        self._flights_lock = threading.Lock()
 
     def __str__(self):
         """
@@ -74,42 +234,244 @@ class API:
         else:
             return ""
 
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _auth(self):
+        if self._server._rights == self._server.RIGHTS_LOGIN_REQUIRED:
+            # TODO: check if base64 is required
+            return (self._server._user, self._server._password)
+        return None
+
+    def _request(self, url, headers=None, stream=False, retry=False):
+        # Blocking GET of the url through the transport of the server, returns the response.
+        # Only a GET that changes nothing may be retried after it reached Domoticz.
+        return self._server.transport.get(url, auth=self._auth(), headers=headers, stream=stream, retry=retry)
+
+    def _post(self, url, data):
+        # Blocking POST to the url, returns the content of the response
+        self.invalidate()
+        response = self._server.transport.post(url, data=data, auth=self._auth())
+        if response.status_code != 200:
+            raise Exception('post', response.reason)
+        return response.content
+
+    def _fetch(self, querystring):
+        try:
+            return APIResponse(querystring, self._decode(self._get(self._url(querystring),
+                                                                   retry=self._is_read(querystring))))
+        except Exception:
+            return APIResponse(querystring)
+
+    def _cached(self, querystring):
+        # Cached response of a read within the cache window, or None
+        entry = self._cache.get(querystring)
+        if entry is not None:
+            if time.monotonic() - entry[0] < self._cache_window:
+                return entry[1]
+            self._cache.pop(querystring, None)
+        return None
+
+    def _shared_fetch(self, querystring):
+        # Single-flight: concurrent identical reads wait for the response of the first one.
+        # The response is only copied when it is shared: each waiter and each use of the
+        # cache gets a copy, and the leader too when the original is kept in the cache.
+        with self._flights_lock:
+            response = self._cached(querystring)
+            if response is not None:
+                return response._copy()
+            generation = self._generation
+            key = (querystring, generation)
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                # [future, number of waiters]
+                flight = [Future(), 0]
+                self._flights[key] = flight
+            else:
+                flight[1] += 1
+        future = flight[0]
+        if not leader:
+            response = future.result()
+            return response._copy() if response is not None else APIResponse(querystring)
+        response = None
+        shared = False
+        try:
+            response = self._fetch(querystring)
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+                # No waiters can be added anymore
+                shared = flight[1] > 0
+                if response is not None and response.is_OK() and self._cache_window > 0 \
+                        and generation == self._generation:
+                    now = time.monotonic()
+                    # Don't keep expired responses, they may be large
+                    self._cache = {key: entry for key, entry in self._cache.items()
+                                   if now - entry[0] < self._cache_window}
+                    self._cache[querystring] = (now, response)
+                    shared = True
+            future.set_result(response)
+        return response._copy() if shared else response
+
+    @classmethod
+    def _is_read(cls, querystring):
+        if not querystring:
+            return False
+        params = dict(param.partition("=")[::2] for param in querystring.split("&"))
+        type = params.get("type")
+        if type == "command":
+            return params.get("param", "").startswith("get")
+        if type not in cls.READ_TYPES:
+            return False
+        read_params = cls.READ_TYPES[type]
+        return read_params is None or params.get("param") in read_params
+
+    def _get(self, url, retry=False):
+        # Blocking GET of the url, returns the content of the response
+        response = self._request(url, retry=retry)
+        if response.status_code != 200:
+            raise Exception('call', response.reason)
+        return response.content
+
+    def _url(self, querystring):
+        if querystring is None:
+            return None
+        else:
+            return ("{}{}?{}".format(
+                self.endpoint,
+                self.URL,
+                parse.quote(querystring, safe="&=")
+            ))
+
+    @staticmethod
+    def _decode(content):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            # Some endpoints of older Domoticz versions return single quotes
+            return API._decode_legacy(content)
+
+    @staticmethod
+    def _decode_legacy(content):
+        strContent = content.decode('utf8').replace("'", '"')
+        return json.loads(strContent)
+
+    @classmethod
+    def _check_status(cls, value):
+        if value is None:
+            return cls.ERROR
+        else:
+            # Sometimes ERROR is returned, so truncated to first 3 characters
+            value = value[:3]
+            if value in cls.RESULTS:
+                return value
+            else:
+                # Sometimes the status contains error text!!!
+                return cls.ERROR
+
+    def _set(self, response):
+        self._querystring = response.querystring
+        self._data = response.data
+        self._message = response.message
+        self._payload = response.payload
+        self._status = response.status
+        self._title = response.title
+        return response
+
     # ..........................................................................
     # Public methods
     # ..........................................................................
-    def call(self):
-        """Call the Domoticz API"""
+    def call(self, querystring=None):
+        """Call the Domoticz API
+
+        Args:
+            querystring (:obj:`str`, optional): querystring for this call. Default the querystring property.
+
+        Returns:
+            :obj:`APIResponse`
+        """
+        if querystring is None:
+            querystring = self._querystring
+        response = None
         if self._server is not None:
-            try:
-                if self._session == None:
-                    self._session = requests.Session()
-
-                if self._server._rights == self._server.RIGHTS_LOGIN_REQUIRED:
-                    # TODO: check if base64 is required
-                    self._session.auth = (
-                        self._server._user, self._server._password)
-                response = self._session.get(self.url,
-                                             verify=False)  # bad fix for invalid domoticz certificate
-                if response.status_code != 200:
-                    raise Exception('call', response.reason)
-
-                strContent = response.content.decode('utf8').replace("'", '"')
-                data = json.loads(strContent)
-                self._data = data
-                self._message = data.get(self.MESSAGE)
-                self._payload = data.get(self.RESULT)
-                self.status = data.get(self.STATUS)  # set correct value
-                self._title = data.get(self.TITLE)
-            except Exception as e:
-                self._data = {}
-                self._message = "Invalid call"
-                self._payload = None
-                self._status = None
-                self._title = None
+            if not querystring:
+                response = APIResponse(querystring)
+            elif self._is_read(querystring):
+                response = self._shared_fetch(querystring)
+            else:
+                self.invalidate()
+                response = self._fetch(querystring)
+                # The write may have changed what reads started meanwhile return
+                self.invalidate()
+            self._set(response)
+        return response
+
+    def get_file(self, path, headers=None):
+        """Get a file from the Domoticz webserver, using the same session as the API calls
+
+        Args:
+            path (:obj:`str`): path of the file, eg. "i18n/domoticz-nl.json"
+            headers (:obj:`dict`, optional): extra request headers, eg. "If-None-Match"
+
+        Returns:
+            :obj:`requests.Response`, or None if Domoticz could not be reached
+        """
+        if self._server is None:
+            return None
+        try:
+            return self._request("{}{}".format(self.endpoint, path), headers=headers, retry=True)
+        except Exception:
+            return None
 
     def has_payload(self):
         return self._payload is not None
 
+    def iter_payload(self, querystring, data=None):
+        """Call the Domoticz API and yield the items of the result one at a time, while the response is received
+
+        Stop iterating when the item is found: the connection is closed and the rest
+        of the response is not received and parsed. The properties of the last call
+        are only set when all items are yielded.
+
+        Args:
+            querystring (:obj:`str`): querystring for this call
+            data (:obj:`dict`, optional): filled with the other values of the response, eg. "ActTime".
+                Domoticz returns these values before the result.
+        """
+        if data is None:
+            data = {}
+        if self._server is None:
+            return
+        response = self._cached(querystring) if self._is_read(querystring) else None
+        if response is not None:
+            response = response._copy()
+            data.update((key, value) for key, value in response.data.items() if key != self.RESULT)
+            self._set(response)
+            yield from response.payload or []
+            return
+        try:
+            response = self._request(self._url(querystring), stream=True, retry=self._is_read(querystring))
+        except Exception:
+            self._set(APIResponse(querystring))
+            return
+        try:
+            if response.status_code != 200:
+                self._set(APIResponse(querystring))
+                return
+            yield from _ResultStream(response.iter_content(self.STREAM_CHUNK_SIZE), data)
+            self._set(APIResponse(querystring, data))
+        except ValueError:
+            self._set(APIResponse(querystring))
+        finally:
+            response.close()
+
+    def invalidate(self):
+        """Forget the cached responses, the next reads are sent to Domoticz"""
+        with self._flights_lock:
+            self._generation += 1
+            self._cache.clear()
+
     def is_OK(self):
         return self._status == self.OK
 
@@ -119,6 +481,16 @@ class API:
     # ..........................................................................
     # Properties
     # ..........................................................................
+    @property
+    def cache_window(self):
+        """Seconds a response of a read is reused. 0 disables the cache, concurrent reads are still shared"""
+        return self._cache_window
+
+    @cache_window.setter
+    def cache_window(self, value):
+        self._cache_window = value
+        self.invalidate()
+
     @property
     def data(self):
         """ The complete response from the call """
@@ -187,16 +559,7 @@ class API:
 
     @status.setter
     def status(self, value):
-        if value is None:
-            self._status = self.ERROR
-        else:
-            # Sometimes ERROR is returned, so truncated to first 3 characters
-            value = value[:3]
-            if value in self.RESULTS:
-                self._status = value
-            else:
-                # Sometimes the status contains error text!!!
-                self._status = self.ERROR
+        self._status = self._check_status(value)
 
     @property
     def title(self):
@@ -210,11 +573,109 @@ class API:
     @property
     def url(self):
         """ The complete url used to call the Domoticz json/API """
-        if self._querystring is None:
-            return None
+        return self._url(self._querystring)
+
+
+class APIResponse:
+
+    __slots__ = (
+        "_data",
+        "_message",
+        "_payload",
+        "_querystring",
+        "_status",
+        "_title",
+    )
+
+    def __init__(self, querystring, data=None):
+        """ Result of one call to the Domoticz API. The attributes can not be set.
+            data and payload are the decoded response; a response of a shared or
+            cached read is a copy for each caller, so changing it affects no other caller.
+
+            Args:
+                querystring (:obj:`str`): querystring used in the call
+                data (:obj:`dict`, optional): the complete response. None for an invalid call.
+        """
+        object.__setattr__(self, "_querystring", querystring)
+        if data is None:
+            object.__setattr__(self, "_data", {})
+            object.__setattr__(self, "_message", "Invalid call")
+            object.__setattr__(self, "_payload", None)
+            object.__setattr__(self, "_status", None)
+            object.__setattr__(self, "_title", None)
         else:
-            return ("{}{}?{}".format(
-                self.endpoint,
-                self.URL,
-                parse.quote(self._querystring, safe="&=")
-            ))
+            object.__setattr__(self, "_data", data)
+            object.__setattr__(self, "_message", data.get(API.MESSAGE))
+            object.__setattr__(self, "_payload", data.get(API.RESULT))
+            object.__setattr__(self, "_status", API._check_status(data.get(API.STATUS)))
+            object.__setattr__(self, "_title", data.get(API.TITLE))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} can not be changed".format(self.__class__.__name__))
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    @classmethod
+    def _copy_value(cls, value):
+        # Copy of a decoded JSON value, much faster than copy.deepcopy
+        if type(value) is dict:
+            return {key: cls._copy_value(item) if type(item) in (dict, list) else item
+                    for key, item in value.items()}
+        if type(value) is list:
+            return [cls._copy_value(item) if type(item) in (dict, list) else item for item in value]
+        return value
+
+    def _copy(self):
+        # Response with its own data, for one caller of a shared read
+        if self._status is None and not self._data:
+            return APIResponse(self._querystring)
+        return APIResponse(self._querystring, self._copy_value(self._data))
+
+    def __str__(self):
+        return "{}({}): {}-{}".format(self.__class__.__name__, self._querystring, self._title, self._status)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def has_payload(self):
+        return self._payload is not None
+
+    def is_OK(self):
+        return self._status == API.OK
+
+    def is_ERR(self):
+        return self._status == API.ERROR
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def data(self):
+        """ The complete response from the call """
+        return self._data
+
+    @property
+    def message(self):
+        """ Sometimes a message is returned """
+        return self._message
+
+    @property
+    def payload(self):
+        """ The payload (result) part of the response """
+        return self._payload
+
+    @property
+    def querystring(self):
+        """ The querystring used in the call """
+        return self._querystring
+
+    @property
+    def status(self):
+        """ API.OK, API.ERROR, or None for an invalid call """
+        return self._status
+
+    @property
+    def title(self):
+        """ Title returned in the response """
+        return self._title
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .api import (API, APIResponse)
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:
+    # Without aiohttp the calls of the blocking API are done in the default executor of the event loop
+    aiohttp = None
+
+
+class AsyncAPI(API):
+
+    def __init__(self, server):
+        """ API class for asyncio. Uses aiohttp when available.
+
+            Args:
+                server (:obj:`AsyncServer`): Domoticz server object
+        """
+        super().__init__(server)
+        self._aiosession = None
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    async def _aget(self, url):
+        if self._aiosession is None:
+            # Same pool size, keep-alive and timeouts as the transport of the server
+            transport = self._server.transport
+            connector = aiohttp.TCPConnector(limit=transport.pool_size,
+                                             force_close=not transport.keep_alive)
+            timeout = aiohttp.ClientTimeout(sock_connect=transport.connect_timeout,
+                                            sock_read=transport.read_timeout)
+            self._aiosession = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        auth = None
+        if self._server._rights == self._server.RIGHTS_LOGIN_REQUIRED:
+            auth = aiohttp.BasicAuth(self._server._user, self._server._password)
+        async with self._aiosession.get(url,
+                                        auth=auth,
+                                        ssl=False) as response:  # bad fix for invalid domoticz certificate
+            if response.status != 200:
+                raise Exception('call', response.reason)
+            return await response.read()
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    async def call(self, querystring=None):
+        """Call the Domoticz API
+
+        Args:
+            querystring (:obj:`str`, optional): querystring for this call. Default the querystring property.
+
+        Returns:
+            :obj:`APIResponse`. Use this instead of the properties when calls are
+            running concurrently.
+
+        With aiohttp, concurrent identical reads are not shared and responses are not
+        reused, as the blocking API does; a write still clears the responses of the
+        blocking API. Without aiohttp the call is done by the blocking API of the
+        server in the default executor, so it shares its reads and cache.
+        """
+        if querystring is None:
+            querystring = self._querystring
+        response = None
+        if self._server is not None:
+            if aiohttp is None:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(None, self._server.api.call, querystring)
+            else:
+                try:
+                    response = APIResponse(querystring, self._decode(await self._aget(self._url(querystring))))
+                except Exception as e:
+                    response = APIResponse(querystring)
+                if not self._is_read(querystring):
+                    # The responses cached by the blocking API may be changed by this call
+                    self._server.api.invalidate()
+            self._set(response)
+        return response
+
+    async def close(self):
+        """Close the aiohttp session"""
+        if self._aiosession is not None:
+            await self._aiosession.close()
+            self._aiosession = None
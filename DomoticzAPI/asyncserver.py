@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .asyncapi import AsyncAPI
+from .server import Server
+from .device import Device
+from .hardware import Hardware
+from .scene import Scene
+from .const import ONOFF
+import asyncio
+
+
+class AsyncServer(Server):
+
+    def __init__(self, address=Server.DEFAULT_ADDRESS, port=Server.DEFAULT_PORT, **kwargs):
+        """The AsyncServer class represents the Domoticz server for use with asyncio
+
+            No calls are done while creating the object. Use:
+
+                async with AsyncServer() as server:
+                    dev = await server.device(idx=12)
+                    await dev.update_switch(Device.SWITCH_ON)
+
+            or call `await server.connect()` and `await server.close()`.
+
+            Args:
+                Same as :obj:`Server`
+        """
+        self._initConnection(address, port, **kwargs)
+        # The same state as Server. The blocking API is still available for the
+        # (blocking) methods of the objects
+        self._initState(**kwargs)
+        self._aapi = AsyncAPI(self)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    async def _get_hardware(self):
+        # Hardware and hardware types are needed to create Device objects without blocking calls
+        # Stored in the same server caches as used by the blocking methods
+        if self._hardware_cache is None:
+            hardware, types = await asyncio.gather(
+                self.call(Hardware._querystring_hardware()),
+                self.call(Hardware._querystring_hardwaretypes()))
+            if types.is_OK():
+                self.hardware_types._fill(types.payload or [], self._version)
+            self._hardware_cache = {}
+            for result_dict in hardware.payload or []:
+                hw = Hardware(self,
+                              payload=result_dict,
+                              type_name=self.hardware_types._by_idx.get(result_dict.get("Type")))
+                self._hardware_cache[hw.idx] = hw
+        return self._hardware_cache
+
+    async def _devices(self, querystring, idx=None, name=None):
+        result = []
+        response, hardware = await asyncio.gather(
+            self.call(querystring),
+            self._get_hardware())
+        if response.is_OK():
+            self._setServerData(response.data)
+            for result_dict in response.payload or []:
+                if (idx is None or int(result_dict.get("idx")) == idx) \
+                        and (name is None or result_dict.get("Name") == name):
+                    hardwareid = result_dict.get("HardwareID")
+                    dev = Device(self,
+                                 payload=result_dict,
+                                 hardware=hardware.get(int(hardwareid)) if hardwareid is not None else None)
+                    result.append(AsyncDevice(self, dev))
+        return result
+
+    async def _scenes(self, idx=None, name=None):
+        result = []
+        response = await self.call(Scene._querystring_scenes())
+        if response.is_OK():
+            self._setServerData(response.data)
+            for result_dict in response.payload or []:
+                if (idx is None or int(result_dict.get("idx")) == idx) \
+                        and (name is None or result_dict.get("Name") == name):
+                    result.append(AsyncScene(self, Scene(self, payload=result_dict)))
+        return result
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    async def call(self, querystring):
+        """Call the Domoticz API
+
+        Returns:
+            :obj:`APIResponse`
+        """
+        return await self._aapi.call(querystring)
+
+    async def close(self):
+        """Close the connection to Domoticz"""
+        await self._aapi.close()
+
+    async def connect(self):
+        """Check if Domoticz exists and get the server properties
+
+        Returns:
+            True if the Domoticz server exists
+        """
+        # /json.htm?type=command&param=getauth
+        response = await self.call("type=command&param={}".format(self._param_getauth))
+        if response.data:
+            self._rights = response.data.get("rights")
+        self._exists = response.is_OK()
+        if self._rights == self.RIGHTS_LOGGED_IN or (
+                self._rights == self.RIGHTS_LOGIN_REQUIRED and self._user is not None):
+            # /json.htm?type=command&param=getversion
+            # /json.htm?type=command&param=getSunRiseSet
+            version, sun = await asyncio.gather(
+                self.call("type=command&param={}".format(self._param_version)),
+                self.call("type=command&param={}".format(self._param_sun)))
+            self._setVersion(version.data)
+            self._version_loaded = True
+            if self._rights == self.RIGHTS_LOGIN_REQUIRED and self._domoticzupdateurl is None:
+                self._aapi.status = self._aapi.ERROR
+                self._aapi.message = "Invalid login"
+            else:
+                self._setSunRiseSet(sun.data, sun.is_OK())
+        return self._exists
+
+    async def device(self, idx=None, name=None):
+        """Get a device
+
+        Args:
+            idx (:obj:`int`, optional): ID of an existing device
+            name (:obj:`str`, optional): Name of an existing device
+
+        Returns:
+            :obj:`AsyncDevice` or None if not found
+        """
+        if idx is not None:
+            result = await self._devices(Device._querystring_device(idx), idx=int(idx))
+        else:
+            result = await self._devices(Device._querystring_devices(), name=name)
+        return result[0] if result else None
+
+    async def devices(self, filter=None, used=None, favorite=None, plan=None):
+        """:obj:`list` of :obj:`AsyncDevice`: Devices, retrieved with one call. The filters are done by Domoticz,
+        see :meth:`Server.devices`"""
+        return await self._devices(Device._querystring_devices(filter=filter,
+                                                               used=used,
+                                                               favorite=favorite,
+                                                               plan=plan))
+
+    async def logmessage(self, text):
+        """ Send text to the Domoticz log """
+        # /json.htm?type=command&param=addlogmessage&message=MESSAGE
+        if self._exists:
+            await self.call("type=command&param={}&message={}".format(
+                self._param_log,
+                text))
+
+    async def scene(self, idx=None, name=None):
+        """Get a scene or group
+
+        Args:
+            idx (:obj:`int`, optional): ID of an existing scene or group
+            name (:obj:`str`, optional): Name of an existing scene or group
+
+        Returns:
+            :obj:`AsyncScene` or None if not found
+        """
+        result = await self._scenes(idx=int(idx) if idx is not None else None, name=name)
+        return result[0] if result else None
+
+    async def scenes(self):
+        """:obj:`list` of :obj:`AsyncScene`: All scenes and groups, retrieved with one call"""
+        return await self._scenes()
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def aapi(self):
+        """:obj:`AsyncAPI`"""
+        return self._aapi
+
+
+class AsyncDevice:
+
+    def __init__(self, server, device):
+        """Device for use with AsyncServer
+
+        All properties of the Device are available. The methods calling Domoticz are coroutines.
+        Setting a property sets it on the Device, eg. dev.level = 50, which is a blocking
+        call to Domoticz: in a coroutine use `await dev.set_level(50)`.
+
+        Args:
+            server (:obj:`AsyncServer`): Domoticz server
+            device (:obj:`Device`): Device created from the payload
+        """
+        self._server = server
+        self._device = device
+
+    def __str__(self):
+        return "{}({}, {}: \"{}\")".format(self.__class__.__name__,
+                                           str(self._server),
+                                           self._device.idx,
+                                           self._device.name)
+
+    def __getattr__(self, item):
+        return getattr(self._device, item)
+
+    def __setattr__(self, name, value):
+        if name in ("_server", "_device"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._device, name, value)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    async def _command(self, querystring):
+        response = await self._server.call(querystring)
+        if response.is_OK():
+            await self.refresh()
+        return response.is_OK()
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    async def refresh(self):
+        """Retrieve the device from Domoticz again"""
+        response = await self._server.call(Device._querystring_device(self._device.idx))
+        if response.is_OK():
+            self._server._setServerData(response.data)
+            for result_dict in response.payload or []:
+                if int(result_dict.get("idx")) == self._device.idx:
+                    self._device._fill(result_dict)
+                    break
+
+    async def set_color(self, color):
+        """Set the :obj:`Color` of the device
+
+        Returns:
+            True if successful
+        """
+        if self._device.exists() and self._device.is_switch():
+            return await self._command(Device._querystring_color(self._device.idx, color, self._device.level))
+        return False
+
+    async def set_level(self, value):
+        """Set the level of the switch
+
+        Returns:
+            True if successful
+        """
+        if self._device.is_switch():
+            return await self._command(Device._querystring_level(self._device.idx, value))
+        return False
+
+    async def update(self, nvalue, svalue, battery=None, rssi=None):
+        """Update the values of the device
+
+        Returns:
+            True if successful
+        """
+        if self._device.exists() and (nvalue is not None or svalue is not None):
+            return await self._command(Device._querystring_update(self._device.idx, nvalue, svalue, battery, rssi))
+        return False
+
+    async def update_switch(self, value):
+        """Switch the device with Device.SWITCH_ON, Device.SWITCH_OFF or Device.SWITCH_TOGGLE
+
+        Returns:
+            True if successful
+        """
+        if self._device.exists() and self._device.is_switch() and value in Device.SWITCH_LIGHT_VALUES:
+            return await self._command(Device._querystring_switch(self._device.idx, value))
+        return False
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def device(self):
+        """:obj:`Device`"""
+        return self._device
+
+
+class AsyncScene:
+
+    def __init__(self, server, scene):
+        """Scene/Group for use with AsyncServer
+
+        All properties of the Scene are available. The methods calling Domoticz are coroutines.
+        Setting a property sets it on the Scene, which may be a blocking call to Domoticz.
+
+        Args:
+            server (:obj:`AsyncServer`): Domoticz server
+            scene (:obj:`Scene`): Scene created from the payload
+        """
+        self._server = server
+        self._scene = scene
+
+    def __str__(self):
+        return "{}({}, {}: \"{}\")".format(self.__class__.__name__,
+                                           str(self._server),
+                                           self._scene.idx,
+                                           self._scene.name)
+
+    def __getattr__(self, item):
+        return getattr(self._scene, item)
+
+    def __setattr__(self, name, value):
+        if name in ("_server", "_scene"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._scene, name, value)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    async def refresh(self):
+        """Retrieve the scene/group from Domoticz again"""
+        response = await self._server.call(Scene._querystring_scenes())
+        if response.is_OK():
+            self._server._setServerData(response.data)
+            for result_dict in response.payload or []:
+                if int(result_dict.get("idx")) == self._scene.idx:
+                    self._scene._fill(result_dict)
+                    break
+
+    async def switch(self, value):
+        """Switch the scene/group ON or OFF
+
+        Returns:
+            True if successful
+        """
+        if self._scene.exists() and value in ONOFF:
+            response = await self._server.call(Scene._querystring_switch(self._scene.idx, value))
+            if response.is_OK():
+                await self.refresh()
+                return True
+        return False
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def scene(self):
+        """:obj:`Scene`"""
+        return self._scene
@@ -142,7 +142,9 @@ class BaseTimer(ABC):
             else:
                 self._fillfromkwargs(kwargs)
 
-        self._init()
+        # A new timer has nothing to retrieve yet
+        if self._idx is not None:
+            self._init()
         
     def __checkTypeAndValues(self, timertype, date, occurence, mday, month):
         if (timertype == TimerTypes.TME_TYPE_FIXED_DATETIME):
@@ -158,7 +160,7 @@ class BaseTimer(ABC):
             else:
                 self._date = None
                 self._occurence = 0
-                self._mday = 0
+                self._month = 0
         elif (timertype == TimerTypes.TME_TYPE_MONTHLY_WD):
             if (occurence == 0):
                 raise ValueError("Occurence should be specified for TME_TYPE_MONTHLY_WD.")
@@ -259,19 +261,8 @@ class BaseTimer(ABC):
         self._api.call()
         if self._api.is_OK() and self._api.has_payload():
             for var in self._api.payload:
-                t = str_2_date(var.get("Time"),"%H:%M")
                 if aftercreate:
-                    #print("{} {} {}:{} {} Date:{}".format(str_2_bool(var.get("Active")), int(var.get("Type")), t.hour, t.minute, int(var.get("Days")), var.get("Date")))
-                    if self._timertype == TimerTypes(int(var.get("Type"))) \
-                            and self._active == str_2_bool(var.get("Active")) \
-                            and self._hour == t.hour \
-                            and self._min == t.minute \
-                            and self._days == TimerDays(int(var.get("Days"))) \
-                            and self._date == BaseTimer._checkDateFormat(var.get("Date")) \
-                            and self._occurence == int(var.get("Occurence")) \
-                            and self._mday == int(var.get("MDay")) \
-                            and self._month == int(var.get("Month")) \
-                            and self._comparefields(var):
+                    if self._matches(var):
                         if self._idx is None or self._idx < int(var.get("idx")):
                             self._fillfrompayload(var)
                     
@@ -282,6 +273,73 @@ class BaseTimer(ABC):
                         break
     
     
+    def _matches(self, var):
+        # Same timer settings as the timer dict var from Domoticz
+        t = str_2_date(var.get("Time"),"%H:%M")
+        return self._timertype == TimerTypes(int(var.get("Type"))) \
+            and self._active == str_2_bool(var.get("Active")) \
+            and self._hour == t.hour \
+            and self._min == t.minute \
+            and self._days == TimerDays(int(var.get("Days"))) \
+            and self._date == BaseTimer._checkDateFormat(var.get("Date")) \
+            and self._occurence == int(var.get("Occurence")) \
+            and self._mday == int(var.get("MDay")) \
+            and self._month == int(var.get("Month")) \
+            and self._comparefields(var)
+
+    def _readback(self, known):
+        # After add: Domoticz does not return the idx of the new timer, so the
+        # timers of the device are retrieved once. The new timer is the one that
+        # was not in the timer index before, or else the newest with the same settings.
+        index = self._device._server.timer_index
+        response = self._api.call("type={}&idx={}".format(self._param_timers, self._device._idx))
+        if not response.is_OK():
+            return
+        payload = response.payload or []
+        new = [var for var in payload if int(var.get("idx")) not in known] if known is not None else []
+        if len(new) == 1:
+            self._fillfrompayload(new[0])
+        else:
+            for var in payload:
+                if self._matches(var) and (self._idx is None or self._idx < int(var.get("idx"))):
+                    self._fillfrompayload(var)
+        index._set(self._device, payload)
+        if self._idx is not None:
+            index._put(self)
+
+    def _querystring_add(self):
+        return "type=command&param={}&idx={}&active={}&timertype={}&hour={}&min={}&randomness=false&command=0&days={}&date={}&occurence={}&mday={}&month={}{}".format(
+            self._param_add_device_timer,
+            self._device._idx,
+            bool_2_str(self._active),
+            self._timertype,
+            self._hour,
+            self._min,
+            self._days.value,
+            self._date if BaseTimer._checkDateFormat(self._date) is not None else "",
+            self._occurence,
+            self._mday,
+            self._month,
+            self._addquerystring())
+
+    def _querystring_delete(self):
+        return "type=command&param={}&idx={}".format(self._param_delete_device_timer, self._idx)
+
+    def _querystring_update(self):
+        return "type=command&param={}&idx={}&active={}&timertype={}&hour={}&min={}&randomness=false&command=0&days={}&date={}&occurence={}&mday={}&month={}{}".format(
+            self._param_update_device_timer,
+            self._idx,
+            bool_2_str(self._active),
+            self._timertype,
+            self._hour,
+            self._min,
+            self._days.value,
+            self._date,
+            self._occurence,
+            self._mday,
+            self._month,
+            self._addquerystring())
+
     @staticmethod 
     def _checkDateFormat(str):
         if (str and str != ""):
@@ -296,56 +354,44 @@ class BaseTimer(ABC):
     def add(self):
         if self._idx is None \
                 and self._device is not None:
-            self._api.querystring = "type=command&param={}&idx={}&active={}&timertype={}&hour={}&min={}&randomness=false&command=0&days={}&date={}&occurence={}&mday={}&month={}{}".format(
-                self._param_add_device_timer,
-                self._device._idx,
-                bool_2_str(self._active),
-                self._timertype,
-                self._hour,
-                self._min,
-                self._days.value,
-                self._date if BaseTimer._checkDateFormat(self._date) is not None else "",
-                self._occurence,
-                self._mday,
-                self._month,
-                self._addquerystring())
+            known = self._device._server.timer_index._timer_idxs(self._device)
+            self._api.querystring = self._querystring_add()
             #print(self._api.querystring)
             self._api.call()
             if self._api.status == self._api.OK:
-                self._init(True)
+                self._readback(known)
             else:
                 print ("Not ok adding timer")
 
     def delete(self):
         if self.exists():
-            self._api.querystring = "type=command&param={}&idx={}".format(
-                self._param_delete_device_timer,
-                self._idx)
+            self._api.querystring = self._querystring_delete()
             self._api.call()
             if self._api.status == self._api.OK:
+                self._device._server.timer_index._discard(self)
                 self._device = None
                 self._idx = None
 
     def exists(self):
         """ Check if device timer exists in Domoticz """
         return not (self._idx is None or self._device is None)
+
+    def next_fire(self, after=None):
+        """ Next time this timer fires, computed without Domoticz
+
+        Args:
+            after (:obj:`datetime`, optional): Default the current time of the server
+
+        Returns:
+            :obj:`datetime`, or None if the timer does not fire anymore
+        """
+        from .timerschedule import TimerSchedule
+        return TimerSchedule(self._device._server, [self]).next_fire(self, after)
     
     def _update(self):
         
         if self.exists():
-            self._api.querystring = "type=command&param={}&idx={}&active={}&timertype={}&hour={}&min={}&randomness=false&command=0&days={}&date={}&occurence={}&mday={}&month={}{}".format(
-                self._param_update_device_timer,
-                self._idx,
-                bool_2_str(self._active),
-                self._timertype,
-                self._hour,
-                self._min,
-                self._days.value,
-                self._date,
-                self._occurence,
-                self._mday,
-                self._month,
-                self._addquerystring())
+            self._api.querystring = self._querystring_update()
             #print(self._api.querystring)
             self._api.call()
             self._init()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .device import Device
+from .scene import Scene
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+
+class CommandResult:
+
+    def __init__(self, command, target, querystring):
+        """Result of one command of a :obj:`CommandBatch`
+
+        Args:
+            command (:obj:`str`): name of the command, eg. "switch", "level", "color", "update" or "scene"
+            target (:obj:`tuple`): ("device", idx) or ("scene", idx)
+            querystring (:obj:`str`): querystring of the call
+        """
+        self._command = command
+        self._target = target
+        self._querystring = querystring
+        self._response = None
+
+    def __str__(self):
+        return "{}({} {}: {})".format(self.__class__.__name__, self._command, self.idx, self.status)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def is_OK(self):
+        return self._response is not None and self._response.is_OK()
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def command(self):
+        return self._command
+
+    @property
+    def idx(self):
+        """idx of the device or scene"""
+        return self._target[1]
+
+    @property
+    def querystring(self):
+        return self._querystring
+
+    @property
+    def response(self):
+        """:obj:`APIResponse`, or None when not executed yet"""
+        return self._response
+
+    @property
+    def status(self):
+        return self._response.status if self._response is not None else None
+
+
+class CommandBatch:
+    """
+        Domoticz CommandBatch class
+
+        Collects switch, level, color, udevice and scene commands and sends them
+        concurrently. Commands for the same device or scene are sent one after
+        the other, in the order they were added.
+
+            with server.batch() as batch:
+                for dev in lights:
+                    batch.switch(dev, Device.SWITCH_OFF)
+            print(batch.results)
+    """
+
+    DEFAULT_WORKERS = 8
+
+    # Up to this number of Device objects are refreshed with a call each, more with one call for all devices
+    REFRESH_EACH_MAX = 10
+
+    def __init__(self, server, workers=DEFAULT_WORKERS, refresh=True):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default = 8
+            refresh (:obj:`bool`, optional): update the given :obj:`Device` objects after executing:
+                each device, or all devices with one call for more than REFRESH_EACH_MAX devices. Default = True
+        """
+        self._server = server
+        self._workers = workers
+        self._refresh = refresh
+        self._commands = []
+        self._devices = {}
+        self._lock = threading.Lock()
+        self._results = []
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, str(self._server), len(self._commands))
+
+    def __len__(self):
+        return len(self._commands)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.execute()
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _add(self, command, target, querystring):
+        result = CommandResult(command, target, querystring)
+        with self._lock:
+            self._commands.append(result)
+        return result
+
+    def _device_idx(self, device):
+        if isinstance(device, Device):
+            self._devices[device.idx] = device
+            return device.idx
+        return int(device)
+
+    def _execute_group(self, results):
+        # Commands of one device or scene, in order
+        for result in results:
+            result._response = self._server.api.call(result.querystring)
+
+    def _refresh_device(self, device):
+        found_dict = device._retrieve()
+        if found_dict:
+            device._fill(found_dict)
+
+    def _refresh_devices(self):
+        devices = list(self._devices.values())
+        if len(devices) <= self.REFRESH_EACH_MAX:
+            # A small response for each device
+            with ThreadPoolExecutor(max_workers=max(1, min(self._workers, len(devices)))) as executor:
+                list(executor.map(self._refresh_device, devices))
+            return
+        # One call to update all Device objects of this batch
+        response = self._server.api.call(Device._querystring_devices())
+        if response.is_OK():
+            self._server._setServerData(response.data)
+            for result_dict in response.payload or []:
+                dev = self._devices.get(int(result_dict.get("idx")))
+                if dev is not None:
+                    dev._fill(result_dict)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def color(self, device, color, brightness=None):
+        """Set the :obj:`Color` of a :obj:`Device` or device idx
+
+        Args:
+            brightness (:obj:`int`, optional): Default the level of a :obj:`Device`. For a
+                device idx without brightness, it is left out of the call
+        """
+        if brightness is None and isinstance(device, Device):
+            brightness = device.level
+        idx = self._device_idx(device)
+        return self._add("color", ("device", idx), Device._querystring_color(idx, color, brightness))
+
+    def execute(self):
+        """Send all collected commands
+
+        Returns:
+            :obj:`list` of :obj:`CommandResult`, in the order the commands were added
+        """
+        with self._lock:
+            commands = self._commands
+            self._commands = []
+        groups = {}
+        for result in commands:
+            groups.setdefault(result._target, []).append(result)
+        if groups:
+            with ThreadPoolExecutor(max_workers=max(1, min(self._workers, len(groups)))) as executor:
+                # list() to raise exceptions of the workers
+                list(executor.map(self._execute_group, groups.values()))
+            if self._refresh and self._devices:
+                self._refresh_devices()
+        self._results = commands
+        return commands
+
+    def level(self, device, value):
+        """Set the level of a :obj:`Device` or device idx"""
+        idx = self._device_idx(device)
+        return self._add("level", ("device", idx), Device._querystring_level(idx, value))
+
+    def scene(self, scene, value):
+        """Switch a :obj:`Scene` or scene idx ON or OFF"""
+        idx = scene.idx if isinstance(scene, Scene) else int(scene)
+        return self._add("scene", ("scene", idx), Scene._querystring_switch(idx, value))
+
+    def switch(self, device, value):
+        """Switch a :obj:`Device` or device idx with Device.SWITCH_ON, Device.SWITCH_OFF or Device.SWITCH_TOGGLE"""
+        idx = self._device_idx(device)
+        return self._add("switch", ("device", idx), Device._querystring_switch(idx, value))
+
+    def update(self, device, nvalue, svalue, battery=None, rssi=None):
+        """Update the values of a :obj:`Device` or device idx (udevice)"""
+        idx = self._device_idx(device)
+        return self._add("update", ("device", idx), Device._querystring_update(idx, nvalue, svalue, battery, rssi))
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def results(self):
+        """:obj:`list` of :obj:`CommandResult` of the last execute"""
+        return list(self._results)
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
+
+    @property
+    def workers(self):
+        """Maximum number of concurrent calls"""
+        return self._workers
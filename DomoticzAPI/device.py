@@ -6,10 +6,43 @@ from .hardware import Hardware
 from .color import Color
 from .const import (NUM_MAX, NUM_MIN)
 from .utilities import (bool_2_int, bool_2_str, int_2_bool)
+import time
 
 
 class Device:
 
+    __slots__ = (
+        "_api",
+        "_batterylevel",
+        "_color",
+        "_color_value",
+        "_data",
+        "_extra",
+        "_favorite",
+        "_filled",
+        "_hardware",
+        "_hardwareid",
+        "_htype",
+        "_idx",
+        "_lastupdate",
+        "_level",
+        "_name",
+        "_nvalue",
+        "_planid",
+        "_planids",
+        "_server",
+        "_signallevel",
+        "_state",
+        "_status",
+        "_subtype",
+        "_svalue",
+        "_switchtype",
+        "_type",
+        "_typeimg",
+        "_typename",
+        "_used",
+    )
+
     _type_devices = "devices"
     _type_create_device = "createdevice"
     _type_create_dummy = "createvirtualsensor"
@@ -56,6 +89,145 @@ class Device:
         "rssi",
     }
 
+    # Less used properties of a device: (attribute, key in the result).
+    # Only available values are kept, in the _extra dict of the device.
+    _extra_fields = (
+        ("_addjmulti", "AddjMulti"),
+        ("_addjmulti2", "AddjMulti2"),
+        ("_addjvalue", "AddjValue"),
+        ("_addjvalue2", "AddjValue2"),
+        ("_barometer", "Barometer"),
+        ("_cameraidx", "CameraIdx"),
+        ("_chill", "Chill"),
+        ("_counter", "Counter"),
+        ("_counterdeliv", "CounterDeliv"),
+        ("_counterdelivtoday", "CounterDelivToday"),
+        ("_countertoday", "CounterToday"),
+        ("_current", "Current"),
+        ("_customimage", "CustomImage"),
+        ("_daytime", "DayTime"),
+        ("_description", "Description"),
+        ("_desc", "Desc"),
+        ("_dewpoint", "DewPoint"),
+        ("_dimmertype", "DimmerType"),
+        ("_direction", "Direction"),
+        ("_directionstr", "DirectionStr"),
+        ("_displaytype", "displaytype"),
+        ("_forecast", "Forecast"),
+        ("_forecaststr", "ForecastStr"),
+        ("_forecast_url", "forecast_url"),  # base64 encoded
+        ("_gust", "Gust"),
+        ("_havedimmer", "HaveDimmer"),
+        ("_havegroupcmd", "HaveGroupCmd"),
+        ("_havetimeout", "HaveTimeout"),
+        ("_humidity", "Humidity"),
+        ("_humiditystatus", "HumidityStatus"),
+        ("_id", "ID"),
+        # Next property available with:
+        #     /json.htm?type=command&param=getlightswitches
+        #     /json.htm?type=devices&filter=light&used=true&order=Name
+        ("_isdimmer", "IsDimmer"),
+        ("_image", "Image"),
+        ("_internalstate", "InternalState"),
+        ("_issubdevice", "IsSubDevice"),
+        ("_levelactions", "LevelActions"),
+        ("_levelint", "LevelInt"),
+        ("_levelnames", "LevelNames"),
+        ("_leveloffhidden", "LevelOffHidden"),
+        ("_maxdimlevel", "MaxDimLevel"),
+        ("_mode", "Mode"),
+        ("_modes", "Modes"),
+        ("_notifications", "Notifications"),
+        ("_options", "Options"),
+        ("_pressure", "Pressure"),
+        ("_protected", "Protected"),
+        ("_quality", "Quality"),
+        ("_radiation", "Radiation"),
+        ("_rain", "Rain"),
+        ("_rainrate", "RainRate"),
+        ("_selectorstyle", "SelectorStyle"),
+        ("_sensortype", "SensorType"),
+        ("_sensorunit", "SensorUnit"),
+        ("_setpoint", "SetPoint"),
+        ("_shownotifications", "ShowNotifications"),
+        ("_speed", "Speed"),
+        ("_strparam1", "StrParam1"),
+        ("_strparam2", "StrParam2"),
+        ("_switchtypeval", "SwitchTypeVal"),
+        ("_temp", "Temp"),
+        ("_timers", "Timers"),
+        ("_trend", "trend"),
+        ("_unit", "Unit"),
+        ("_until", "Until"),
+        ("_usage", "Usage"),
+        ("_usagedeliv", "UsageDeliv"),
+        ("_usedbycamera", "UsedByCamera"),
+        ("_uvi", "UVI"),
+        ("_valuequantity", "ValueQuantity"),
+        ("_valueunits", "ValueUnits"),
+        ("_visibility", "Visibility"),
+        ("_voltage", "Voltage"),
+        ("_xoffset", "XOffset"),
+        ("_yoffset", "YOffset"),
+    )
+
+    # Properties kept in slots: (attribute, key in the result)
+    _slot_fields = (
+        ("_batterylevel", "BatteryLevel"),
+        ("_color_value", "Color"),
+        ("_data", "Data"),
+        ("_favorite", "Favorite"),
+        ("_hardwareid", "HardwareID"),
+        ("_idx", "idx"),
+        ("_lastupdate", "LastUpdate"),
+        ("_level", "Level"),
+        ("_name", "Name"),
+        ("_planid", "PlanID"),
+        ("_planids", "PlanIDs"),
+        ("_signallevel", "SignalLevel"),
+        ("_state", "State"),
+        ("_status", "Status"),
+        ("_subtype", "SubType"),
+        ("_switchtype", "SwitchType"),
+        ("_type", "Type"),
+        ("_typeimg", "TypeImg"),
+        ("_used", "Used"),
+    )
+
+    # Attribute of each key in the result, for get_value. The values of other keys
+    # are only kept when asked for, in _extra with the key itself.
+    _attribute_keys = {key: attribute for attribute, key in _extra_fields + _slot_fields}
+
+    # Keys of which the attribute is converted. get_value returns the value in the
+    # result, rebuilt from the attribute. Only a value that can't be rebuilt, eg. a
+    # missing BatteryLevel, is kept in _extra with the key itself.
+    _converted_keys = ("BatteryLevel", "HardwareID", "idx")
+
+    # Attributes that are None when not set
+    _known_attributes = frozenset(__slots__) | frozenset(attribute for attribute, key in _extra_fields)
+
+    # Filters of the devices done by Domoticz: /json.htm?type=devices&filter=FILTER
+    FILTER_ALL = "all"
+    FILTER_BARO = "baro"
+    FILTER_LIGHT = "light"
+    FILTER_RAIN = "rain"
+    FILTER_TEMP = "temp"
+    FILTER_UTILITY = "utility"
+    FILTER_UV = "uv"
+    FILTER_WEATHER = "weather"
+    FILTER_WIND = "wind"
+    FILTERS = {
+        FILTER_ALL,
+        FILTER_BARO,
+        FILTER_LIGHT,
+        FILTER_RAIN,
+        FILTER_TEMP,
+        FILTER_UTILITY,
+        FILTER_UV,
+        FILTER_WEATHER,
+        FILTER_WIND,
+    }
+
     SWITCH_CLOSE_INLINE_RELAY = "Close inline relay"
     SWITCH_CLOSED = "Closed"
     SWITCH_LOCKED = "Locked"
@@ -102,9 +274,15 @@ class Device:
                         subtype (:obj:`int`, optional): Subtype of device
                     or 
                         typename (:obj:`str`, optional): Type name of the device
+                or
+                    payload (:obj:`dict`, optional): Device dict from a /json.htm?type=devices result
+                    hardware (:obj:`Hardware`, optional): Hardware of the device
         """
+        self._extra = {}
+        self._filled = None
         self._idx = None
         self._hardware = None
+        self._hardwareid = None
         self._name = None
         self._type = None
         self._subtype = None
@@ -146,7 +324,12 @@ class Device:
             self._type = None
             self._subtype = None
         self._api = self._server.api
-        self._init()
+        payload = kwargs.get("payload")
+        if payload is not None:
+            # Existing device from an already retrieved /json.htm?type=devices result
+            self._fill(payload)
+        else:
+            self._init()
 
     def __str__(self):
         return "{}({}, {}: \"{}\")".format(self.__class__.__name__,
@@ -154,165 +337,186 @@ class Device:
                                            self._idx,
                                            self._name)
 
+    def __getattr__(self, item):
+        # Only called for attributes which are not set: the less used properties
+        # in _extra and the slots which are not filled yet.
+        if item == "_extra" or item not in self._known_attributes:
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, item))
+        return self._extra.get(item)
+
     # ..........................................................................
     # Private methods
     # ..........................................................................
     def _init(self):
         if self._idx is not None:
-            # Retrieve status of specific device: /json.htm?type=devices&rid=IDX&displayhidden=1
-            querystring = "type={}&rid={}&displayhidden=1".format(
-                self._type_devices,
-                self._idx)
+            self._fill(self._retrieve())
         elif self._name is not None:
-            # Get all devices: /json.htm?type=devices&displayhidden=1
-            querystring = "type={}&displayhidden=1".format(
-                self._type_devices)
+            data = {}
+            found_dict = {}
+            # Search without parsing the rest of the response
+            for result_dict in self._api.iter_payload(self._querystring_devices(), data):
+                if result_dict.get("Name") == self._name:
+                    # Found device :)
+                    found_dict = result_dict
+                    break
+            # Update the server properties, which Domoticz returns before the devices
+            if "ActTime" in data:
+                self._server._setServerData(data)
+            self._fill(found_dict)
         else:
-            querystring = ""
-        self._api.querystring = querystring
-        self._api.call()
-        found_dict = {}
-        if self._api.status == self._api.OK:
-            d = self._api.data
-            # For some reason next property is only given in device and scene calls.
-            self._server._acttime = d.get("ActTime")
-            # Update the server properties.
-            self._server._astrtwilightend = d.get("AstrTwilightEnd")
-            self._server._astrtwilightstart = d.get("AstrTwilightStart")
-            self._server._civtwilightend = d.get("CivTwilightEnd")
-            self._server._civtwilightstart = d.get("CivTwilightStart")
-            self._server._daylength = d.get("DayLength")
-            self._server._nauttwilightend = d.get("NautTwilightEnd")
-            self._server._nauttwilightstart = d.get("NautTwilightStart")
-            self._server._servertime = d.get("ServerTime")
-            self._server._sunatsouth = d.get("SunAtSouth")
-            self._server._sunrise = d.get("Sunrise")
-            self._server._sunset = d.get("Sunset")
-            # In param=getversion it is "version"
-            self._server._version = d.get("app_version")
-            # Search for the given device
-            if self._api.payload:
-                for result_dict in self._api.payload:
-                    if (self._idx is not None and int(result_dict.get("idx")) == self._idx) \
-                            or (self._name is not None and result_dict.get("Name") == self._name):
-                        # Found device :)
-                        found_dict = result_dict
-                        break
+            self._fill({})
+
+    def _retrieve(self):
+        # Device dict of idx from Domoticz, {} if not found. The response is small,
+        # and shared with concurrent calls for the same device.
+        response = self._api.call(self._querystring_device(self._idx))
+        if response.is_OK():
+            self._server._setServerData(response.data)
+            for result_dict in response.payload or []:
+                if int(result_dict.get("idx")) == self._idx:
+                    return result_dict
+        return {}
+
+    def _fill(self, found_dict):
         # Update device properties
         # The list below may be not complete!!!
-        self._addjmulti = found_dict.get("AddjMulti")
-        self._addjmulti2 = found_dict.get("AddjMulti2")
-        self._addjvalue = found_dict.get("AddjValue")
-        self._addjvalue2 = found_dict.get("AddjValue2")
-        self._barometer = found_dict.get("Barometer")
         self._batterylevel = found_dict.get("BatteryLevel", NUM_MAX)
-        self._cameraidx = found_dict.get("CameraIdx")
-        self._chill = found_dict.get("Chill")
-        self._color = Color(color=found_dict.get("Color", "{}"))
-        self._counter = found_dict.get("Counter")
-        self._counterdeliv = found_dict.get("CounterDeliv")
-        self._counterdelivtoday = found_dict.get("CounterDelivToday")
-        self._countertoday = found_dict.get("CounterToday")
-        self._current = found_dict.get("Current")
-        self._customimage = found_dict.get("CustomImage")
+        # Color object is created when used
+        self._color = None
+        self._color_value = found_dict.get("Color")
         self._data = found_dict.get("Data")
-        self._daytime = found_dict.get("DayTime")
-        self._description = found_dict.get("Description")
-        self._desc = found_dict.get("Desc")
-        self._dewpoint = found_dict.get("DewPoint")
-        self._dimmertype = found_dict.get("DimmerType")
-        self._direction = found_dict.get("Direction")
-        self._directionstr = found_dict.get("DirectionStr")
-        self._displaytype = found_dict.get("displaytype")
         self._favorite = found_dict.get("Favorite")
-        self._forecast = found_dict.get("Forecast")
-        self._forecaststr = found_dict.get("ForecastStr")
-        self._forecast_url = found_dict.get("forecast_url")  # base64 encoded
-        self._gust = found_dict.get("Gust")
-        self._havedimmer = found_dict.get("HaveDimmer")
-        self._havegroupcmd = found_dict.get("HaveGroupCmd")
-        self._havetimeout = found_dict.get("HaveTimeout")
-        self._humidity = found_dict.get("Humidity")
-        self._humiditystatus = found_dict.get("HumidityStatus")
-        self._id = found_dict.get("ID")
         dummy = found_dict.get("idx", self._idx)
         self._idx = int(dummy) if dummy is not None else None
-        # Next property available with:
-        #     /json.htm?type=command&param=getlightswitches
-        #     /json.htm?type=devices&filter=light&used=true&order=Name
-        self._isdimmer = found_dict.get("IsDimmer")
-        self._image = found_dict.get("Image")
-        self._internalstate = found_dict.get("InternalState")
-        self._issubdevice = found_dict.get("IsSubDevice")
         self._lastupdate = found_dict.get("LastUpdate")
         self._level = found_dict.get("Level")
-        self._levelactions = found_dict.get("LevelActions")
-        self._levelint = found_dict.get("LevelInt")
-        self._levelnames = found_dict.get("LevelNames")
-        self._leveloffhidden = found_dict.get("LevelOffHidden")
-        self._maxdimlevel = found_dict.get("MaxDimLevel")
-        self._mode = found_dict.get("Mode")
-        self._modes = found_dict.get("Modes")
         self._name = found_dict.get("Name", self._name)
-        self._notifications = found_dict.get("Notifications")
-        self._options = found_dict.get("Options")
         # The first RoomPlan to which this device was assigned?
         self._planid = found_dict.get("PlanID")
         # List of RoomPlan idxs containg this device
         self._planids = found_dict.get("PlanIDs")
-        self._pressure = found_dict.get("Pressure")
-        self._protected = found_dict.get("Protected")
-        self._quality = found_dict.get("Quality")
-        self._radiation = found_dict.get("Radiation")
-        self._rain = found_dict.get("Rain")
-        self._rainrate = found_dict.get("RainRate")
-        self._selectorstyle = found_dict.get("SelectorStyle")
-        self._sensortype = found_dict.get("SensorType")
-        self._sensorunit = found_dict.get("SensorUnit")
-        self._setpoint = found_dict.get("SetPoint")
-        self._shownotifications = found_dict.get("ShowNotifications")
         self._signallevel = found_dict.get("SignalLevel")
-        self._speed = found_dict.get("Speed")
         self._state = found_dict.get("State")
         self._status = found_dict.get("Status")
-        self._strparam1 = found_dict.get("StrParam1")
-        self._strparam2 = found_dict.get("StrParam2")
         self._subtype = found_dict.get("SubType", self._subtype)
         self._switchtype = found_dict.get("SwitchType")
-        self._switchtypeval = found_dict.get("SwitchTypeVal")
-        self._temp = found_dict.get("Temp")
-        self._timers = found_dict.get("Timers")
-        self._trend = found_dict.get("trend")
         self._type = found_dict.get("Type", self._type)
         self._typeimg = found_dict.get("TypeImg")
-        self._unit = found_dict.get("Unit")
-        self._until = found_dict.get("Until")
         self._used = found_dict.get("Used")
-        self._usage = found_dict.get("Usage")
-        self._usagedeliv = found_dict.get("UsageDeliv")
-        self._usedbycamera = found_dict.get("UsedByCamera")
-        self._uvi = found_dict.get("UVI")
-        self._valuequantity = found_dict.get("ValueQuantity")
-        self._valueunits = found_dict.get("ValueUnits")
-        self._visibility = found_dict.get("Visibility")
-        self._voltage = found_dict.get("Voltage")
-        self._xoffset = found_dict.get("XOffset")
-        self._yoffset = found_dict.get("YOffset")
-
-        # Some info from the hardware also comes
+        self._extra = {}
+        for attribute, key in self._extra_fields:
+            value = found_dict.get(key)
+            if value is not None:
+                self._extra[attribute] = value
+        # Time of the data, for get_value
+        self._filled = time.monotonic() if found_dict else None
+
+        # The Hardware object is retrieved when used, from the hardware of the server
         hardwareid = found_dict.get("HardwareID")
-        if hardwareid is not None:
-            hw = Hardware(self._server, idx=hardwareid)
-            if hw.exists():
-                self._hardware = hw
-                self._hardware._hardwaretype = found_dict.get("HardwareType")
-            else:
-                self._hardware = None
+        self._hardwareid = int(hardwareid) if hardwareid is not None else None
+        if self._hardwareid is not None and self._hardware is not None and self._hardware.idx != self._hardwareid:
+            self._hardware = None
+        for key in self._converted_keys:
+            value = found_dict.get(key)
+            if value != self._raw(key):
+                self._extra[key] = value
 
     def _update(self, key, value):
         if key in ("nvalue", "svalue", "battery", "rssi"):
             pass
 
+    def _raw(self, key):
+        # Value of a converted key as Domoticz returns it, rebuilt from the attribute
+        if key == "idx":
+            return str(self._idx) if self._idx is not None else None
+        if key == "HardwareID":
+            return self._hardwareid
+        return self._batterylevel
+
+    def _value(self, key):
+        # Value of a key in the last data of the device, as returned by Domoticz
+        attribute = self._attribute_keys.get(key)
+        if key in self._converted_keys:
+            return self._extra[key] if key in self._extra else self._raw(key)
+        if attribute is None:
+            return self._extra.get(key)
+        return getattr(self, attribute)
+
+    # Querystrings, also used by AsyncServer
+    @classmethod
+    def _querystring_device(cls, idx):
+        # Retrieve status of specific device: /json.htm?type=devices&rid=IDX&displayhidden=1
+        return "type={}&rid={}&displayhidden=1".format(
+            cls._type_devices,
+            idx)
+
+    @classmethod
+    def _querystring_devices(cls, lastupdate=None, filter=None, used=None, favorite=None, plan=None):
+        # Get all devices: /json.htm?type=devices&displayhidden=1
+        # Devices changed since ActTime: /json.htm?type=devices&displayhidden=1&lastupdate=ACTTIME
+        # Filtered by Domoticz: /json.htm?type=devices&displayhidden=1&filter=temp&used=true&favorite=1&plan=IDX
+        querystring = ["type={}&displayhidden=1".format(
+            cls._type_devices)]
+        if filter is not None:
+            querystring.append("filter={}".format(filter))
+        if used is not None:
+            querystring.append("used={}".format("true" if used else "false"))
+        if favorite:
+            querystring.append("favorite=1")
+        if plan is not None:
+            querystring.append("plan={}".format(plan))
+        if lastupdate is not None:
+            querystring.append("lastupdate={}".format(lastupdate))
+        return "&".join(querystring)
+
+    @classmethod
+    def _querystring_switch(cls, idx, value):
+        # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=On
+        # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=Off
+        # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=Toggle
+        return "type=command&param={}&idx={}&switchcmd={}".format(
+            cls._param_switch_light,
+            idx,
+            value
+        )
+
+    @classmethod
+    def _querystring_level(cls, idx, value):
+        # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=Set%20Level&level=LEVEL
+        return "type=command&param={}&idx={}&switchcmd={}&level={}".format(
+            cls._param_switch_light,
+            idx,
+            cls.SWITCH_SET_LEVEL,
+            value
+        )
+
+    @classmethod
+    def _querystring_color(cls, idx, color, brightness=None):
+        # /json.htm?type=command&param=setcolbrightnessvalue&idx=IDX&color=COLOR&brightness=LEVEL
+        # brightness is optional
+        querystring = "type=command&param={}&idx={}&color={}".format(
+            cls._param_set_color_brightness,
+            idx,
+            color.color)
+        if brightness is not None:
+            querystring += "&brightness={}".format(brightness)
+        return querystring
+
+    @classmethod
+    def _querystring_update(cls, idx, nvalue, svalue, battery=None, rssi=None):
+        # /json.htm?type=command&param=udevice&idx=IDX&nvalue=NVALUE&svalue=SVALUE
+        params = ["type=command", "param={}".format(cls._param_update_device), "idx={}".format(idx)]
+        if nvalue is not None:
+            params.append("nvalue={}".format(nvalue))
+        if svalue is not None:
+            params.append("svalue={}".format(svalue))
+        # Optional parameters
+        if battery is not None and isinstance(battery, int):
+            params.append("battery={}".format(battery))
+        if rssi is not None and isinstance(rssi, int):
+            params.append("rssi={}".format(rssi))
+        return "&".join(params)
+
     def _values(self):
                 # The only way to get a current value from a device is by calling:
         #
@@ -324,13 +528,12 @@ class Device:
         #
         if self.exists():
             # /json.htm?type=events&param=currentstates
-            self._api.querystring = "type={}&param={}".format(
+            response = self._api.call("type={}&param={}".format(
                 self._type_events,
-                self._param_current_states)
-            self._api.call()
+                self._param_current_states))
             found_dict = {}
-            if self._api.status == self._api.OK and self._api.payload:
-                for result_dict in self._api.payload:
+            if response.is_OK() and response.payload:
+                for result_dict in response.payload:
                     if self._idx is not None and result_dict.get("id") == self.idx:
                         # Found device :)
                         found_dict = result_dict
@@ -374,11 +577,12 @@ class Device:
             self._api.call()
             if self._api.status == self._api.OK:
                 self._hardware = None
+                self._hardwareid = None
                 self._idx = None
 
     def exists(self):
         """ Check if device exists in Domoticz """
-        return not (self._idx is None or self._hardware is None)
+        return self._idx is not None and self._hardwareid is not None
 
     def has_battery(self):
         """ Check if this device is using a battery """
@@ -430,102 +634,71 @@ class Device:
             self._api.call()
             self._init()
 
-    def update(self, nvalue, svalue, battery, rssi):
-        # /json.htm?type=command&param=udevice&idx=IDX&nvalue=NVALUE&svalue=SVALUE
+    def update(self, nvalue, svalue, battery=None, rssi=None):
+        """ Update the values of the device
+
+        Returns:
+            True if successful
+        """
         if self.exists() and (nvalue is not None or svalue is not None):
-            self._api.querystring = "type=command&param={}&idx={}".format(
-                self._param_update_device,
-                self._idx)
-            if nvalue is not None:
-                self._api.querystring += "&nvalue={}".format(nvalue)
-            if svalue is not None:
-                self._api.querystring += "&svalue={}".format(svalue)
-            # Optional parameters
-            if battery is not None and isinstance(battery, int):
-                self._api.querystring += "&battery={}".format(battery)
-            if rssi is not None and isinstance(rssi, int):
-                self._api.querystring += "&rssi={}".format(rssi)
-            self._api.call()
+            response = self._api.call(self._querystring_update(
+                self._idx, nvalue, svalue, battery, rssi))
             self._init()
+            return response.is_OK()
+        return False
 
     def update_switch(self, value, level=0):
         if self.exists():
             if self.is_switch():
                 if value in self.SWITCH_LIGHT_VALUES:
-                    # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=On
-                    # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=Off
-                    # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=Toggle
-                    self._api.querystring = "type=command&param={}&idx={}&switchcmd={}".format(
-                        self._param_switch_light,
-                        self._idx,
-                        value
-                    )
+                    self._api.querystring = self._querystring_switch(self._idx, value)
                     self._api.call()
                     self._init()
 
-    @property
-    def value(self, key):
-        """Retrieve the value from a device property 
+    def get_value(self, key, max_age=None):
+        """Retrieve the value from a device property
         Can be used if the property is not available/unknown
 
+        The value is taken from the last data of the device, retrieved when the
+        device was created or refreshed. Domoticz is only called when this data
+        is older than max_age, or for the first use of a key without a property.
+        The value is as Domoticz returned it, eg. "idx" is a str, and None for a
+        key that is not in the data.
+
         Args:
             key (str): key from a property, eg. "Level", etc
+            max_age (:obj:`float`, optional): refresh the device first when its data
+                is older than max_age seconds. Default never
         """
-        found_dict = {}
-        if self.exists():
-            # Retrieve status of specific device: /json.htm?type=devices&rid=IDX&displayhidden=1
-            self._api.querystring = "type={}&rid={}&displayhidden=1".format(
-                self._type_devices,
-                self._idx)
-            self._api.call()
-            if self._api.status == self._api.OK:
-                if self._api.payload:
-                    for result_dict in self._api.payload:
-                        if int(result_dict.get("idx")) == self._idx:
-                            # Found device :)
-                            found_dict = result_dict
-                            break
-        return found_dict.get(key)
-        
-    def get_value(self, key):
-        """Retrieve the value from a device property 
-        Can be used if the property is not available/unknown
+        return self.get_values([key], max_age=max_age)[key]
+
+    def get_values(self, keys, max_age=None):
+        """Retrieve the values from device properties, with at most one call to Domoticz
 
         Args:
-            key (str): key from a property, eg. "Level", etc
+            keys (:obj:`list` of :obj:`str`): keys from properties, eg. ["Level", "SetPoint"]
+            max_age (:obj:`float`, optional): refresh the device first when its data
+                is older than max_age seconds. Default never
+
+        Returns:
+            :obj:`dict` with the value of each key
         """
-        found_dict = {}
         if self.exists():
-            # Retrieve status of specific device: /json.htm?type=devices&rid=IDX&displayhidden=1
-            self._api.querystring = "type={}&rid={}&displayhidden=1".format(
-                self._type_devices,
-                self._idx)
-            self._api.call()
-            if self._api.status == self._api.OK:
-                if self._api.payload:
-                    for result_dict in self._api.payload:
-                        if int(result_dict.get("idx")) == self._idx:
-                            # Found device :)
-                            found_dict = result_dict
-                            break
-        return found_dict.get(key)        
-
-    @value.setter
-    def value(self, key, value):
-        if key in self._type_set_used_keys:
-            # /json.htm?type=setused&idx=IDX&used=true|false
-            self._api.querystring = "type={}&idx={}&used={}&{}={}".format(
-                self._type_set_used,
-                self._idx,
-                self._used,
-                key,
-                value
-            )
-            self._api.call()
+            stale = self._filled is None or (max_age is not None and time.monotonic() - self._filled > max_age)
+            # Values of keys without a property are retrieved when first asked for
+            missing = [key for key in keys if key not in self._attribute_keys and key not in self._extra]
+            if stale or missing:
+                found_dict = self._retrieve()
+                if stale:
+                    self._fill(found_dict)
+                for key in missing:
+                    self._extra[key] = found_dict.get(key)
+        return {key: self._value(key) for key in keys}
+
+    def refresh(self):
+        """Retrieve the device from Domoticz again"""
+        if self._idx is not None:
             self._init()
-        elif key in self._param_update_device_keys:
-            # self.update(self._nvalue, self._svalue, self._batterylevel, self._rssi)
-            pass
 
     def set_value(self, key, value):
         if key in self._type_set_used_keys:
@@ -585,19 +758,16 @@ class Device:
 
     @property
     def color(self):
+        if self._color is None:
+            self._color = Color(color=self._color_value or "{}")
         return self._color
 
     @color.setter
     def color(self, value):
         if isinstance(value, Color) and self.exists():
             if self.is_switch():
-                # /json.htm?type=command&param=setcolbrightnessvalue&idx=IDX&color=COLOR&brightness=LEVEL
-                self._api.querystring = "type=command&param={}&idx={}&color={}&brightness={}".format(
-                    self._param_set_color_brightness,
-                    self._idx,
-                    value.color,
-                    self._level
-                )
+                self._api.querystring = self._querystring_color(
+                    self._idx, value, self._level)
                 self._api.call()
                 self._init()
 
@@ -694,8 +864,15 @@ class Device:
 
     @property
     def hardware(self):
+        if self._hardware is None and self._hardwareid is not None:
+            self._hardware = self._server.get_hardware(self._hardwareid)
         return self._hardware
 
+    @property
+    def hardwareid(self):
+        """idx of the hardware of this device"""
+        return self._hardwareid
+
     @property
     def havedimmer(self):
         return self._havedimmer
@@ -760,13 +937,7 @@ class Device:
     @level.setter
     def level(self, value):
         if self.is_switch():
-            # /json.htm?type=command&param=switchlight&idx=IDX&switchcmd=Set%20Level&level=LEVEL
-            self._api.querystring = "type=command&param={}&idx={}&switchcmd={}&level={}".format(
-                self._param_switch_light,
-                self._idx,
-                self.SWITCH_SET_LEVEL,
-                value
-            )
+            self._api.querystring = self._querystring_level(self._idx, value)
             self._api.call()
             self._init()
 
@@ -901,6 +1072,10 @@ class Device:
         self._values()
         return self._state
 
+    @property
+    def status(self):
+        return self._status
+
     @property
     def subtype(self):
         return self._subtype
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .server import Server
+from .device import Device
+
+
+class DeviceCollection:
+    """
+        Domoticz DeviceCollection class
+
+        All devices are retrieved with only one call to Domoticz and the Device
+        objects are created from this result, without any further calls.
+        The filters are done by Domoticz, so only the selected devices are
+        transferred and parsed.
+    """
+
+    def __init__(self, server, filter=None, used=None, favorite=None, plan=None):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            filter (:obj:`str`, optional): Device.FILTER_LIGHT, Device.FILTER_TEMP, Device.FILTER_UTILITY,
+                Device.FILTER_WEATHER, etc. Default all devices
+            used (:obj:`bool`, optional): only used devices when True
+            favorite (:obj:`bool`, optional): only favorite devices when True
+            plan (:obj:`int`, optional): only devices of the roomplan with this idx
+        """
+        if isinstance(server, Server) and server.exists():
+            self._server = server
+        else:
+            self._server = None
+        self._api = self._server.api
+        self._acttime = None
+        self._devices = {}
+        self._query = {"filter": filter, "used": used, "favorite": favorite, "plan": plan}
+        self.refresh()
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, str(self._server), len(self._devices))
+
+    def __contains__(self, idx):
+        return idx in self._devices
+
+    def __getitem__(self, idx):
+        return self._devices[idx]
+
+    def __iter__(self):
+        return iter(list(self._devices.values()))
+
+    def __len__(self):
+        return len(self._devices)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _index(self, dev):
+        # Called when a device is added or changed
+        pass
+
+    def _unindex(self, dev):
+        # Called when a device is removed
+        pass
+
+    def _merge(self, payload):
+        # Add or update the devices in the payload. Returns the changed Device objects
+        changed = []
+        for result_dict in payload:
+            idx = int(result_dict.get("idx"))
+            dev = self._devices.get(idx)
+            if dev is None:
+                dev = Device(self._server, payload=result_dict)
+                self._devices[idx] = dev
+            else:
+                dev._fill(result_dict)
+            self._index(dev)
+            changed.append(dev)
+        return changed
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def find(self, name):
+        """Find a device by name
+
+        Args:
+            name (:obj:`str`): Name of the device
+
+        Returns:
+            :obj:`Device` or None if not found
+        """
+        for dev in self._devices.values():
+            if dev.name == name:
+                return dev
+        return None
+
+    def get(self, idx):
+        """:obj:`Device` with idx, or None if not found"""
+        return self._devices.get(int(idx)) if idx is not None else None
+
+    def refresh(self):
+        """Retrieve all devices again and update the existing Device objects in place"""
+        if self._server is not None:
+            response = self._api.call(Device._querystring_devices(**self._query))
+            if response.is_OK():
+                self._server._setServerData(response.data)
+                self._acttime = response.data.get("ActTime")
+                found = {dev.idx: dev for dev in self._merge(response.payload or [])}
+                for idx, dev in self._devices.items():
+                    if idx not in found:
+                        self._unindex(dev)
+                self._devices = found
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def acttime(self):
+        """ActTime of Domoticz of the last refresh"""
+        return self._acttime
+
+    @property
+    def devices(self):
+        """:obj:`list` of :obj:`Device`"""
+        return list(self._devices.values())
+
+    @property
+    def query(self):
+        """:obj:`dict` of the filters done by Domoticz"""
+        return dict(self._query)
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
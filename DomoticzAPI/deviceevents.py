@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+
+class Subscription:
+
+    # Device properties compared between polls. These come from the devices
+    # retrieved by the poll itself; nvalue, svalue and state cost a call per
+    # device, so they are only compared when asked for in fields.
+    FIELDS = (
+        "batterylevel",
+        "data",
+        "level",
+        "status",
+    )
+
+    def __init__(self, target, callback, fields=FIELDS, debounce=0):
+        """Subscription to changes of devices, created by `Server.subscribe()`
+
+        Args:
+            target: idx of a device, a function filter(device) returning True for the
+                devices to follow, or None for all devices
+            callback: called as callback(device, changes), where changes is a :obj:`dict`
+                of field: (old value, new value)
+            fields (:obj:`tuple`, optional): Device properties to compare. Default Subscription.FIELDS.
+                Comparing nvalue, svalue or state calls Domoticz for each changed device
+            debounce (:obj:`float`, optional): seconds without new changes before the callback is called.
+                The changes in this period are combined into one call. Default = 0
+        """
+        self._target = target
+        self._callback = callback
+        self._fields = tuple(fields)
+        self._debounce = debounce
+        self._pending = {}
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, self._target, ", ".join(self._fields))
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _add(self, device, changes, now):
+        # Combine with earlier changes of this device which are not sent yet
+        pending_device, pending_changes, _ = self._pending.get(device.idx, (device, {}, None))
+        for field, (old, new) in changes.items():
+            if field in pending_changes:
+                old = pending_changes[field][0]
+            if old == new:
+                pending_changes.pop(field, None)
+            else:
+                pending_changes[field] = (old, new)
+        if pending_changes:
+            self._pending[device.idx] = (device, pending_changes, now + self._debounce)
+        else:
+            self._pending.pop(device.idx, None)
+
+    def _due(self, now):
+        # Changes that waited long enough
+        result = []
+        for idx, (device, changes, deadline) in list(self._pending.items()):
+            if deadline <= now:
+                del self._pending[idx]
+                result.append((device, changes))
+        return result
+
+    def _matches(self, device):
+        if self._target is None:
+            return True
+        if callable(self._target):
+            try:
+                return bool(self._target(device))
+            except Exception:
+                return False
+        return device.idx == int(self._target)
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def callback(self):
+        return self._callback
+
+    @property
+    def debounce(self):
+        """Seconds without new changes before the callback is called"""
+        return self._debounce
+
+    @property
+    def fields(self):
+        """:obj:`tuple` of compared Device properties"""
+        return self._fields
+
+    @property
+    def target(self):
+        return self._target
+
+
+class DeviceEvents:
+
+    def __init__(self, poller):
+        """Calls the subscriptions for real changes in the devices of a :obj:`DevicePoller`
+
+        After each poll the changed devices are compared with the values of the
+        previous poll. Debounced changes are sent at the first poll after the
+        debounce period, so the resolution is the poll interval.
+
+        Args:
+            poller (:obj:`DevicePoller`): poller shared by all subscriptions
+        """
+        self._poller = poller
+        self._lock = threading.Lock()
+        self._snapshots = None
+        self._subscriptions = []
+        self._poller.add_poll_listener(self._on_poll)
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, self._poller, len(self._subscriptions))
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _fields(self):
+        fields = set()
+        for subscription in self._subscriptions:
+            fields.update(subscription.fields)
+        return fields
+
+    @staticmethod
+    def _snapshot(device, fields):
+        return {field: getattr(device, field, None) for field in fields}
+
+    def _on_poll(self, changed):
+        now = time.monotonic()
+        calls = []
+        with self._lock:
+            fields = self._fields()
+            if self._snapshots is None:
+                # First poll: values to compare with
+                self._snapshots = {}
+                for device in self._poller.devices or []:
+                    self._snapshots[device.idx] = self._snapshot(device, fields)
+            for device in changed:
+                new = self._snapshot(device, fields)
+                old = self._snapshots.get(device.idx)
+                self._snapshots[device.idx] = new
+                if old is None:
+                    continue
+                for subscription in self._subscriptions:
+                    if subscription._matches(device):
+                        changes = {field: (old.get(field), new.get(field))
+                                   for field in subscription.fields
+                                   if field in old and old.get(field) != new.get(field)}
+                        if changes:
+                            subscription._add(device, changes, now)
+            for subscription in self._subscriptions:
+                for device, changes in subscription._due(now):
+                    calls.append((subscription.callback, device, changes))
+        # Callbacks are called outside the lock, so they can (un)subscribe
+        for callback, device, changes in calls:
+            try:
+                callback(device, changes)
+            except Exception:
+                pass
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def subscribe(self, target, callback, fields=Subscription.FIELDS, debounce=0):
+        """Call callback(device, changes) when a device changes
+
+        Returns:
+            :obj:`Subscription`
+        """
+        subscription = Subscription(target, callback, fields=fields, debounce=debounce)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            if self._snapshots is not None:
+                # Add the values of new fields
+                for device in self._poller.devices or []:
+                    snapshot = self._snapshots.setdefault(device.idx, {})
+                    for field in subscription.fields:
+                        if field not in snapshot:
+                            snapshot[field] = getattr(device, field, None)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def poller(self):
+        """:obj:`DevicePoller`"""
+        return self._poller
+
+    @property
+    def subscriptions(self):
+        """:obj:`list` of :obj:`Subscription`"""
+        return list(self._subscriptions)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .device import Device
+from .devicecollection import DeviceCollection
+import threading
+
+
+class DevicePoller:
+    """
+        Domoticz DevicePoller class
+
+        Only the devices changed since the previous poll are retrieved, using the
+        ActTime of the previous response (/json.htm?type=devices&lastupdate=ACTTIME).
+        The changed devices are updated in the :obj:`DeviceCollection` and passed
+        to the listeners.
+    """
+
+    DEFAULT_INTERVAL = 5
+
+    def __init__(self, server, devices=None, interval=DEFAULT_INTERVAL):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            devices (:obj:`DeviceCollection`, optional): collection to update. Default a new collection,
+                retrieved at the first poll
+            interval (:obj:`int`, optional): seconds between polls when started. Default = 5
+        """
+        self._server = server
+        self._devices = devices
+        self._interval = interval
+        self._lastupdate = devices.acttime if devices is not None else None
+        self._listeners = []
+        self._poll_listeners = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, str(self._server), self._lastupdate)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _notify(self, changed):
+        for callback in list(self._listeners):
+            for dev in changed:
+                try:
+                    callback(dev)
+                except Exception:
+                    # A failing listener should not stop the other listeners or the polling
+                    pass
+        for callback in list(self._poll_listeners):
+            try:
+                callback(changed)
+            except Exception:
+                pass
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            self.poll()
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def add_listener(self, callback):
+        """Call callback(device) for each changed :obj:`Device`"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def add_poll_listener(self, callback):
+        """Call callback(devices) after each poll, with the :obj:`list` of changed :obj:`Device`"""
+        if callback not in self._poll_listeners:
+            self._poll_listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def remove_poll_listener(self, callback):
+        if callback in self._poll_listeners:
+            self._poll_listeners.remove(callback)
+
+    def poll(self):
+        """Retrieve the devices changed since the previous poll
+
+        The first poll retrieves all devices and passes no changed devices.
+
+        Returns:
+            :obj:`list` of changed :obj:`Device`
+        """
+        changed = []
+        with self._lock:
+            if self._devices is None:
+                self._devices = DeviceCollection(self._server)
+                self._lastupdate = self._devices.acttime
+            else:
+                response = self._server._api.call(Device._querystring_devices(lastupdate=self._lastupdate,
+                                                                              **self._devices._query))
+                if response.is_OK():
+                    self._server._setServerData(response.data)
+                    changed = self._devices._merge(response.payload or [])
+                    self._lastupdate = response.data.get("ActTime", self._lastupdate)
+        self._notify(changed)
+        return changed
+
+    def start(self):
+        """Poll in a background thread every interval seconds"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run,
+                                            name=self.__class__.__name__,
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def devices(self):
+        """:obj:`DeviceCollection`"""
+        return self._devices
+
+    @property
+    def interval(self):
+        """Seconds between polls when started"""
+        return self._interval
+
+    @interval.setter
+    def interval(self, value):
+        self._interval = value
+
+    @property
+    def lastupdate(self):
+        """ActTime used for the next poll"""
+        return self._lastupdate
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
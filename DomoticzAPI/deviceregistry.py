@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .devicecollection import DeviceCollection
+
+
+class DeviceRegistry(DeviceCollection):
+    """
+        Domoticz DeviceRegistry class
+
+        A :obj:`DeviceCollection` with indexes by name, hardware, type/subtype,
+        roomplan and favorite. The indexes are updated with each refresh, and
+        when the registry is updated by a :obj:`DevicePoller`, so lookups don't
+        need a call to Domoticz.
+    """
+
+    def __init__(self, server, filter=None, used=None, favorite=None, plan=None):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            filter, used, favorite, plan: filters done by Domoticz, see :obj:`DeviceCollection`
+        """
+        # Each index maps a key to {idx: Device}
+        self._by_name = {}
+        self._by_hardware = {}
+        self._by_type = {}
+        self._by_plan = {}
+        self._favorites = {}
+        # Index keys of each device, to remove them when the device changes
+        self._keys = {}
+        super().__init__(server, filter=filter, used=used, favorite=favorite, plan=plan)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    @staticmethod
+    def _add_key(index, key, dev):
+        index.setdefault(key, {})[dev.idx] = dev
+
+    @staticmethod
+    def _remove_key(index, key, idx):
+        devices = index.get(key)
+        if devices is not None:
+            devices.pop(idx, None)
+            if not devices:
+                del index[key]
+
+    def _index(self, dev):
+        self._unindex(dev)
+        keys = (
+            (self._by_name, dev.name),
+            (self._by_hardware, dev.hardwareid),
+            (self._by_type, (dev.type, None)),
+            (self._by_type, (dev.type, dev.subtype)),
+        ) + tuple((self._by_plan, int(planid)) for planid in dev.planids or [])
+        if dev.favorite:
+            keys += ((self._favorites, True),)
+        for index, key in keys:
+            self._add_key(index, key, dev)
+        self._keys[dev.idx] = keys
+
+    def _unindex(self, dev):
+        for index, key in self._keys.pop(dev.idx, ()):
+            self._remove_key(index, key, dev.idx)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def by_hardware(self, hardwareid):
+        """:obj:`list` of :obj:`Device` of the hardware with idx hardwareid"""
+        return list(self._by_hardware.get(int(hardwareid), {}).values())
+
+    def by_name(self, name):
+        """:obj:`list` of :obj:`Device` with this name. Names in Domoticz are not unique"""
+        return list(self._by_name.get(name, {}).values())
+
+    def by_plan(self, planid):
+        """:obj:`list` of :obj:`Device` in the roomplan with idx planid"""
+        return list(self._by_plan.get(int(planid), {}).values())
+
+    def by_type(self, type, subtype=None):
+        """:obj:`list` of :obj:`Device` with this type, and subtype when given"""
+        return list(self._by_type.get((type, subtype), {}).values())
+
+    def favorites(self):
+        """:obj:`list` of favorite :obj:`Device`"""
+        return list(self._favorites.get(True, {}).values())
+
+    def find(self, name):
+        """Find a device by name
+
+        Args:
+            name (:obj:`str`): Name of the device
+
+        Returns:
+            :obj:`Device` or None if not found
+        """
+        for dev in self._by_name.get(name, {}).values():
+            return dev
+        return None
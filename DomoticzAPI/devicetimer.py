@@ -65,7 +65,7 @@ class DeviceTimer(BaseTimer):
         self._level = int(var.get("Level", 100))
     
     def _addquerystring(self):
-        return "&randomness={}&command={}&level".format(self._randomness, self._command, self._level)
+        return "&randomness={}&command={}&level={}".format(self._randomness, self._command, self._level)
         
     def _addstr(self):
         return ", Randomness: {}, Command: {}, Level: {}".format(self._randomness, self._command, self._level)
@@ -74,7 +74,7 @@ class DeviceTimer(BaseTimer):
     def loadbydevice(device):
         result = []
         if isinstance(device, Device) and device.exists() and device.type != "Thermostat":
-            api = device.hardware.api
+            api = device._api
             querystring = "type={}&idx={}".format(DeviceTimer._param_timers, device._idx)
             api.querystring = querystring
             api.call()
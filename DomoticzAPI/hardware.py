@@ -68,7 +68,11 @@ class Hardware:
                     self._serialport = kwargs.get("serialport")
                     self._type = kwargs.get("type")
                     self._username = kwargs.get("username")
-        if self._idx is not None:
+        payload = kwargs.get("payload")
+        if payload is not None:
+            # Existing hardware from an already retrieved /json.htm?type=hardware result
+            self._fill(payload, kwargs.get("type_name"))
+        elif self._idx is not None:
             self._init()
 
     def __str__(self):
@@ -85,14 +89,19 @@ class Hardware:
             return ""
 
     def _init(self):
-        # /json.htm?type=hardware
-        self._api.querystring = "type={}".format(self._type_hardware)
-        self._api.call()
+        response = self._api.call(self._querystring_hardware())
         found_dict = {}
-        if self._api.payload:
-            for found_dict in self._api.payload:
-                if found_dict.get("idx") == str(self._idx):
+        if response.payload:
+            for result_dict in response.payload:
+                if result_dict.get("idx") == str(self._idx):
+                    found_dict = result_dict
                     break
+        self._fill(found_dict)
+
+    def _fill(self, found_dict, type_name=None):
+        idx = found_dict.get("idx")
+        if idx is not None:
+            self._idx = int(idx)
         self._address = found_dict.get("Address")
         self._datatimeout = found_dict.get("DataTimeout")
         self._enabled = found_dict.get("Enabled", "true") == "true"
@@ -108,7 +117,10 @@ class Hardware:
         self._port = found_dict.get("Port")
         self._serialport = found_dict.get("SerialPort")
         self._type = found_dict.get("Type")
-        self._hardwaretype = self._get_type_description(self._type)
+        if type_name is not None:
+            self._hardwaretype = type_name
+        else:
+            self._hardwaretype = self._get_type_description(self._type)
         self._username = found_dict.get("Username")
 
     def _update(self, key, value):
@@ -140,18 +152,21 @@ class Hardware:
             if key == "htype":
                 self._hardwaretype = self._get_type_description(self._type)
 
-    def _get_type_description(self, type):
+    # Querystrings, also used by AsyncServer
+    @classmethod
+    def _querystring_hardware(cls):
+        # /json.htm?type=hardware
+        return "type={}".format(cls._type_hardware)
+
+    @classmethod
+    def _querystring_hardwaretypes(cls):
         # /json.htm?type=command&param=gethardwaretypes
-        self._api.querystring = "type=command&param={}".format(
-            self._param_get_hardwaretypes)
-        self._api.call()
-        if self._api.payload:
-            for found_dict in self._api.payload:
-                if found_dict.get("idx") == type:
-                    break
-            return found_dict.get("name")
-        else:
-            return None
+        return "type=command&param={}".format(
+            cls._param_get_hardwaretypes)
+
+    def _get_type_description(self, type):
+        # Hardware types are retrieved once for the server
+        return self._server._hardwareTypeName(type)
 
     # ..........................................................................
     # Public methods
@@ -189,6 +204,7 @@ class Hardware:
                 
                 if self._api.status == self._api.OK:
                     self._idx = int(self._api.data.get("idx"))
+                    self._server.refresh_hardware()
                     self._init()
 
     def add_virtual(self):
@@ -203,6 +219,7 @@ class Hardware:
             self._api.call()
             if self._api.status == self._api.OK:
                 self._idx = None
+                self._server.refresh_hardware()
 
     def is_dummy(self):
         return self._type == HTYPE_DUMMY
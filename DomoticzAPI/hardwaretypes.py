@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .hardware import Hardware
+from .utilities import (json_load_file, json_save_file)
+import os
+import re
+import threading
+
+
+class HardwareTypes:
+    """
+        Domoticz HardwareTypes class
+
+        Catalogue of the hardware types of a Domoticz server, retrieved once with
+        /json.htm?type=command&param=gethardwaretypes. The hardware types only
+        change with a new Domoticz version, or when Python plugins are installed.
+        The catalogue is retrieved again when the server version changes, and
+        is kept in the cache directory of the server for the next start.
+    """
+
+    def __init__(self, server):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+        """
+        self._server = server
+        self._by_idx = {}
+        self._by_name = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self._loaded = False
+
+    def __str__(self):
+        return "{}({}, {}: {})".format(self.__class__.__name__, str(self._server), self._version, len(self))
+
+    def __contains__(self, idx):
+        self._load()
+        return idx in self._by_idx
+
+    def __iter__(self):
+        self._load()
+        return iter(list(self._by_idx.items()))
+
+    def __len__(self):
+        self._load()
+        return len(self._by_idx)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _cache_file(self, version):
+        if self._server.cache_dir is None:
+            return None
+        # Python plugins are also hardware types, so the types differ for each server
+        name = re.sub(r"[^\w.-]", "_", "hardwaretypes-{}_{}-{}".format(
+            self._server.address, self._server.port, version))
+        return os.path.join(self._server.cache_dir, "{}.json".format(name))
+
+    def _fill(self, payload, version=None):
+        by_idx = {}
+        by_name = {}
+        for result_dict in payload:
+            idx = result_dict.get("idx")
+            name = result_dict.get("name")
+            # Python plugins all have the same idx: keep the first name
+            by_idx.setdefault(idx, name)
+            by_name[name] = idx
+        self._by_idx = by_idx
+        self._by_name = by_name
+        self._version = version
+        self._loaded = True
+
+    def _load(self):
+        version = self._server.version
+        if self._loaded and version == self._version:
+            return
+        with self._lock:
+            if self._loaded and version == self._version:
+                return
+            cache_file = self._cache_file(version) if version is not None else None
+            payload = json_load_file(cache_file) if cache_file is not None else None
+            if payload is None:
+                payload = []
+                if self._server.exists():
+                    response = self._server.api.call(Hardware._querystring_hardwaretypes())
+                    if not response.is_OK():
+                        return
+                    payload = [{"idx": result_dict.get("idx"), "name": result_dict.get("name")}
+                               for result_dict in response.payload or []]
+                    if cache_file is not None:
+                        json_save_file(cache_file, payload)
+            self._fill(payload, version)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def idx(self, name):
+        """Type of the hardware type with this name, or None if not found"""
+        self._load()
+        return self._by_name.get(name)
+
+    def invalidate(self):
+        """Retrieve the hardware types from Domoticz again at the next use"""
+        with self._lock:
+            cache_file = self._cache_file(self._version) if self._version is not None else None
+            if cache_file is not None and os.path.exists(cache_file):
+                try:
+                    os.remove(cache_file)
+                except OSError:
+                    pass
+            self._loaded = False
+
+    def name(self, idx):
+        """Name of the hardware type, or None if not found"""
+        self._load()
+        return self._by_idx.get(idx)
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def names(self):
+        """:obj:`list` of the names of all hardware types"""
+        self._load()
+        return list(self._by_name.keys())
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
+
+    @property
+    def version(self):
+        """Domoticz version of the catalogue"""
+        return self._version
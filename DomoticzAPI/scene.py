@@ -32,11 +32,16 @@ class Scene:
     def __init__(self, server, **kwargs):
         """Scene/Group class
 
+        The scene or group is taken from the scene registry of the server, which
+        retrieves all scenes and groups once.
+
         Args:
             server (:obj:`Server`): Domoticz server object where to maintain the scene or group
               idx (:obj:`int`, optional): ID of an existing scene or group
             or 
               name (:obj:`str`, optional): Name of the scene or group
+            or
+              payload (:obj:`dict`, optional): Scene dict from a /json.htm?type=scenes result
         """
         self._idx = None
         self._name = None
@@ -46,7 +51,13 @@ class Scene:
             if self._idx is None:
                 self._name = kwargs.get("name")
             self._api = self._server.api
-            self._init()
+            payload = kwargs.get("payload")
+            if payload is not None:
+                self._fill(payload)
+            else:
+                self._init()
+            # Updated in place when the registry is refreshed
+            self._server.scene_registry._register(self)
         else:
             self._server = None
 
@@ -70,38 +81,16 @@ class Scene:
         found_dict = {}
         if self._server is not None:
             if self._idx is not None or self._name is not None:
-                # Get all scenes: /json.htm?type=scenes&displayhidden=1
-                self._api.querystring = "type={}&displayhidden=1".format(
-                    self._type_scenes)
-                self._api.call()
-                if self._api.is_OK():
-                    d = self._api.data
-                    # For some reason next property is only given in device and scene calls.
-                    self._server._acttime = d.get("ActTime")
-                    # For some reason next property is only given in this scene call, but is a setting!!!.
-                    # self._server._allowwidgetordering = d.get("AllowWidgetOrdering")
-                    # Update the server properties.
-                    self._server._astrtwilightend = d.get("AstrTwilightEnd")
-                    self._server._astrtwilightstart = d.get(
-                        "AstrTwilightStart")
-                    self._server._civtwilightend = d.get("CivTwilightEnd")
-                    self._server._civtwilightstart = d.get("CivTwilightStart")
-                    self._server._daylength = d.get("DayLength")
-                    self._server._nauttwilightend = d.get("NautTwilightEnd")
-                    self._server._nauttwilightstart = d.get(
-                        "NautTwilightStart")
-                    self._server._servertime = d.get("ServerTime")
-                    self._server._sunatsouth = d.get("SunAtSouth")
-                    self._server._sunrise = d.get("Sunrise")
-                    self._server._sunset = d.get("Sunset")
-                    # Search for the given scene
-                    if self._api.payload:
-                        for result_dict in self._api.payload:
-                            if (self._idx is not None and int(result_dict.get("idx")) == self._idx) \
-                                    or (self._name is not None and result_dict.get("Name") == self._name):
-                                # Found scene :)
-                                found_dict = result_dict
-                                break
+                # Search for the given scene in the scenes retrieved once for the server
+                found_dict = self._server.scene_registry._record(idx=self._idx, name=self._name)
+        self._fill(found_dict)
+
+    def _refresh(self):
+        # After a change: retrieve all scenes again, which updates this and other Scene objects
+        self._server.scene_registry.refresh()
+        self._init()
+
+    def _fill(self, found_dict):
         if found_dict:
             self._description = found_dict.get("Description")
             self._favorite = int_2_bool(found_dict.get("Favorite"))
@@ -153,7 +142,24 @@ class Scene:
                     self._add_param(key, value))
             self._api.querystring = querystring
             self._api.call()
-            self._init()
+            self._refresh()
+
+    # Querystrings, also used by AsyncServer
+    @classmethod
+    def _querystring_scenes(cls):
+        # Get all scenes: /json.htm?type=scenes&displayhidden=1
+        return "type={}&displayhidden=1".format(
+            cls._type_scenes)
+
+    @classmethod
+    def _querystring_switch(cls, idx, value):
+        # /json.htm?type=command&param=switchscene&idx=5&switchcmd=On&passcode=
+        # /json.htm?type=command&param=switchscene&idx=5&switchcmd=Off&passcode=
+        return "type=command&param={}&idx={}&switchcmd={}&passcode=".format(
+            cls._param_switch_scene,
+            idx,
+            onoff_2_str(value)
+        )
 
     # ..........................................................................
     # Public methods
@@ -173,7 +179,7 @@ class Scene:
                 self._api.querystring = querystring
                 self._api.call()
                 if self._api.is_OK():
-                    self._init()
+                    self._refresh()
 
     def delete(self):
         '''Delete current scene/group from Domoticz
@@ -185,6 +191,7 @@ class Scene:
             self._api.querystring = querystring
             self._api.call()
             self._idx = None
+            self._server.scene_registry.refresh()
 
     def exists(self):
         """Check if scene/group exists in Domoticz """
@@ -297,17 +304,10 @@ class Scene:
     @status.setter
     def status(self, value):
         if value in ONOFF:
-            # /json.htm?type=command&param=switchscene&idx=5&switchcmd=On&passcode=
-            # /json.htm?type=command&param=switchscene&idx=5&switchcmd=Off&passcode=
             self._status = value
-            querystring = "type=command&param={}&idx={}&switchcmd={}&passcode=".format(
-                self._param_switch_scene,
-                self._idx,
-                onoff_2_str(self._status)
-            )
-            self._api.querystring = querystring
+            self._api.querystring = self._querystring_switch(self._idx, self._status)
             self._api.call()
-            self._init()
+            self._refresh()
 
     @property
     def timers(self):
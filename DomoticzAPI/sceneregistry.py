@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import threading
+import time
+import weakref
+
+
+class SceneRegistry:
+    """
+        Domoticz SceneRegistry class
+
+        All scenes and groups of a server, retrieved with one call to
+        /json.htm?type=scenes&displayhidden=1 and indexed by idx and name.
+        :obj:`Scene` objects are views of the registry: they are created without
+        a call to Domoticz, and are updated in place with each refresh. The
+        scenes are retrieved again when they are used after ttl seconds.
+    """
+
+    # Seconds the retrieved scenes are used before they are retrieved again
+    DEFAULT_TTL = 60
+
+    def __init__(self, server, ttl=DEFAULT_TTL):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            ttl (:obj:`int`, optional): seconds to keep the scenes. None keeps them until `refresh()`
+                or `invalidate()`. Default = 60
+        """
+        self._server = server
+        self._ttl = ttl
+        self._by_idx = {}
+        self._by_name = {}
+        self._lock = threading.Lock()
+        # Time of the last refresh, None when not loaded
+        self._loaded_time = None
+        # Scene objects to update with each refresh
+        self._views = weakref.WeakSet()
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, str(self._server), len(self))
+
+    def __contains__(self, idx):
+        self._load()
+        return idx in self._by_idx
+
+    def __iter__(self):
+        return iter(self.scenes)
+
+    def __len__(self):
+        self._load()
+        return len(self._by_idx)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _is_expired(self):
+        if self._loaded_time is None:
+            return True
+        if self._ttl is None:
+            return False
+        return time.monotonic() - self._loaded_time >= self._ttl
+
+    def _load(self):
+        if self._is_expired():
+            self.refresh()
+
+    def _record(self, idx=None, name=None):
+        # Scene dict with idx, or else with name. {} if not found
+        self._load()
+        if idx is None:
+            idx = self._by_name.get(name)
+        return self._by_idx.get(int(idx), {}) if idx is not None else {}
+
+    def _register(self, scene):
+        self._views.add(scene)
+
+    def _view(self, record):
+        from .scene import Scene
+        return Scene(self._server, payload=record) if record else None
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def find(self, name):
+        """:obj:`Scene` with name, or None if not found"""
+        return self._view(self._record(name=name))
+
+    def get(self, idx):
+        """:obj:`Scene` with idx, or None if not found"""
+        return self._view(self._record(idx=idx)) if idx is not None else None
+
+    def invalidate(self):
+        """Retrieve the scenes again at the next use"""
+        self._loaded_time = None
+
+    def refresh(self):
+        """Retrieve all scenes and groups again, and update the existing Scene objects in place"""
+        from .scene import Scene
+        with self._lock:
+            if self._server is None or not self._server.exists():
+                return
+            response = self._server.api.call(Scene._querystring_scenes())
+            if not response.is_OK():
+                return
+            by_idx = {}
+            by_name = {}
+            for result_dict in response.payload or []:
+                idx = int(result_dict.get("idx"))
+                by_idx[idx] = result_dict
+                by_name.setdefault(result_dict.get("Name"), idx)
+            self._by_idx = by_idx
+            self._by_name = by_name
+            self._loaded_time = time.monotonic()
+        for scene in list(self._views):
+            if scene.idx is not None:
+                scene._fill(by_idx.get(scene.idx, {}))
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def scenes(self):
+        """:obj:`list` of :obj:`Scene`"""
+        self._load()
+        return [self._view(record) for record in list(self._by_idx.values())]
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
+
+    @property
+    def ttl(self):
+        """Seconds the scenes are kept. None keeps them until `refresh()` or `invalidate()`"""
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value):
+        self._ttl = value
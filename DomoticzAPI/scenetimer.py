@@ -63,7 +63,7 @@ class SceneTimer(BaseTimer):
         self._level = int(var.get("Level", 100))
     
     def _addquerystring(self):
-        return "&randomness={}&command={}&level".format(self._randomness, self._command, self._level)
+        return "&randomness={}&command={}&level={}".format(self._randomness, self._command, self._level)
         
     def _addstr(self):
         return ", Randomness: {}, Command: {}, Level: {}".format(self._randomness, self._command, self._level)
@@ -2,10 +2,15 @@
 # -*- coding: utf-8 -*-
 #from .const import(RETURN_EMPTY, RETURN_ERROR, RETURN_OK)
 from .api import API
+from .hardware import Hardware
+from .sceneregistry import SceneRegistry
 from .setting import Setting
+from .sun import SolarCalculator, SunTimes
 from .translation import Translation
+from .transport import Transport
 import json
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 from urllib.parse import urlparse
 from .utilities import (str_2_date)
 
@@ -15,6 +20,11 @@ class Server:
     DEFAULT_ADDRESS = "localhost"
     DEFAULT_PORT = "8080"
     DEFAULT_LANGUAGE = "en"
+    DEFAULT_CACHE_DIR = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+        "DomoticzAPI")
+    # Number of days of computed sun times that are kept
+    SUN_DAYS_CACHED = 400
 
     # Protocols
     PROTOCOL_HTTP = "http"
@@ -62,13 +72,94 @@ class Server:
                 user (:obj:`str`, optional): the username to access Domoticz.
                 password (:obj:`str`, optional): the password to access Domoticz.
                 url (:obj:`str`, optional): use url to pass protocol/adress/port/user and password to access Domoticz.
+                lazy (:obj:`bool`, optional): only check the authorization and the login when creating the server.
+                    The login is checked with getversion when a password is required; an invalid login
+                    sets api.status to API.ERROR, as for a server that is not lazy. The other version,
+                    sunrise/sunset, language and translation properties are retrieved when first used. Default = True
+                checkforupdate (:obj:`bool`, optional): check for a Domoticz update when creating a not lazy server.
+                    Domoticz will contact the internet for this check. Default = False
+                settings_ttl (:obj:`int`, optional): seconds to keep the retrieved settings. Default = 60
+                scenes_ttl (:obj:`int`, optional): seconds to keep the scenes in the scene registry.
+                    None keeps them until refreshed. Default = 60
+                cache_dir (:obj:`str`, optional): directory for files cached on disk, eg. translations.
+                    None disables the disk cache. Default = ~/.cache/DomoticzAPI
+                transport (:obj:`Transport`, optional): HTTP connections to use, eg. shared with another server.
+                    Otherwise a Transport is created with the next arguments.
+                pool_size (:obj:`int`, optional): maximum number of connections. Default = 10
+                retries (:obj:`int`, optional): number of retries of a failed call. Default = 3
+                backoff (:obj:`float`, optional): backoff factor between retries, in seconds. Default = 0.3
+                connect_timeout (:obj:`float`, optional): seconds to wait for a connection. Default = 5
+                read_timeout (:obj:`float`, optional): seconds to wait for a response. Default = 30
+                keep_alive (:obj:`bool`, optional): keep connections open for the next calls. Default = True
+                cache_window (:obj:`float`, optional): seconds a response of a read, eg. type=devices, is reused.
+                    Identical concurrent reads always share one request. 0 disables the reuse. Default = 0.5
+                local_sun (:obj:`bool`, optional): compute the sun times of today from the Location setting too,
+                    instead of retrieving them with getSunRiseSet. Other days are always computed. The time zone
+                    of the server is still taken from one getSunRiseSet. Default = False
         """
+        self._initConnection(address, port, **kwargs)
+        self._initState(**kwargs)
+
+        # Check if authorization is required
+        self._getAuth()
+        if self._api.status == self._api.OK:
+            self._exists = True
+        if self._rights == self.RIGHTS_LOGGED_IN or (
+                self._rights == self.RIGHTS_LOGIN_REQUIRED and self._user is not None):
+            if self._rights == self.RIGHTS_LOGIN_REQUIRED or not self._lazy:
+                # The login is checked with getversion, also for a lazy server
+                self._getVersion()
+            if self._rights == self.RIGHTS_LOGIN_REQUIRED and self._domoticzupdateurl is None:
+                self._api.status = self._api.ERROR
+                self._api.message = "Invalid login"
+            elif not self._lazy:
+                # No need to initialize all time properties. Next procedures will do that.
+                if kwargs.get("checkforupdate", False):
+                    self._checkForUpdate()
+                self._getSunRiseSet(True)
+        else:
+            self._api.status = self._api.ERROR
+            self._api.message = "Authorization is required"
+        if not self._lazy:
+            self._getLanguage()
+            self._translation = Translation(self, language=self._language)
+
+    def __str__(self):
+        txt = "{}(\"{}\", \"{}\"): {}".format(
+            self.__class__.__name__, self._address, self._port, self._exists)
+        return txt
+
+    def __getattr__(self, item):
+        return None
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _initConnection(self, address, port, **kwargs):
         self._address = address
         self._port = port
         self._protocol = 'http'
         self._user = kwargs.get("user")
         self._password = kwargs.get("password")
         self._domUrl = kwargs.get("url")
+        self._cache_dir = kwargs.get("cache_dir", self.DEFAULT_CACHE_DIR)
+        self._cache_window = kwargs.get("cache_window")
+        self._scenes_ttl = kwargs.get("scenes_ttl", SceneRegistry.DEFAULT_TTL)
+        self._local_sun = kwargs.get("local_sun", False)
+        self._sun_today = None
+        self._sun_days = {}
+        self._solar_calculator = None
+        # Time zone difference with the server, None until the server time is retrieved
+        self._clock_offset = None
+        self._transport = kwargs.get("transport")
+        if self._transport is None:
+            self._transport = Transport(
+                pool_size=kwargs.get("pool_size", Transport.DEFAULT_POOL_SIZE),
+                retries=kwargs.get("retries", Transport.DEFAULT_RETRIES),
+                backoff=kwargs.get("backoff", Transport.DEFAULT_BACKOFF),
+                connect_timeout=kwargs.get("connect_timeout", Transport.DEFAULT_CONNECT_TIMEOUT),
+                read_timeout=kwargs.get("read_timeout", Transport.DEFAULT_READ_TIMEOUT),
+                keep_alive=kwargs.get("keep_alive", True))
 
         self._rights = self.RIGHTS_NOT_DEFINED
         self._currentdate_date = datetime.now().date()
@@ -91,41 +182,24 @@ class Server:
         if self._password != None:
             self._rights = self.RIGHTS_LOGIN_REQUIRED
 
+    def _initState(self, **kwargs):
+        # State of the server before any call to Domoticz, also used by AsyncServer
         self._api = API(self)
         self._exists = False
+        self._lazy = kwargs.get("lazy", True)
+        self._currentdate = None
+        self._events = None
+        self._hardware_cache = None
+        self._hardware_types = None
+        self._language_loaded = False
+        self._poller = None
+        self._scene_registry = None
+        self._servertime_dt = None
+        self._setting = Setting(self, ttl=kwargs.get("settings_ttl", Setting.DEFAULT_TTL))
+        self._timer_index = None
+        self._translation = None
+        self._version_loaded = False
 
-        # Check if authorization is required
-        self._getAuth()
-        if self._api.status == self._api.OK:
-            self._exists = True
-        self._setting = Setting(self)
-        if self._rights == self.RIGHTS_LOGGED_IN or (
-                self._rights == self.RIGHTS_LOGIN_REQUIRED and self._user is not None):
-            # No need to initialize all time properties. Next procedures will do that.
-            self._getVersion()
-            if self._rights == self.RIGHTS_LOGIN_REQUIRED and self._domoticzupdateurl is None:
-                self._api.status = self._api.ERROR
-                self._api.message = "Invalid login"
-            else:
-                self._checkForUpdate()
-                self._getSunRiseSet(True)
-        else:
-            self._api.status = self._api.ERROR
-            self._api.message = "Authorization is required"
-        self._getLanguage()
-        self._translation = Translation(self, language=self._language)
-
-    def __str__(self):
-        txt = "{}(\"{}\", \"{}\"): {}".format(
-            self.__class__.__name__, self._address, self._port, self._exists)
-        return txt
-
-    def __getattr__(self, item):
-        return None
-
-    # ..........................................................................
-    # Private methods
-    # ..........................................................................
     def _getAuth(self):
         # /json.htm?type=command&param=getauth
         self._api.querystring = "type=command&param={}".format(
@@ -140,15 +214,24 @@ class Server:
             self._api.querystring = "type=command&param={}".format(
                 self._param_version)
             self._api.call()
-            self._build_time = self._api.data.get("build_time")
-            self._domoticzupdateurl = self._api.data.get("DomoticzUpdateURL")
-            self._dzvents_version = self._api.data.get("dzvents_version")
-            self._hash = self._api.data.get("hash")
-            self._haveupdate = self._api.data.get("HaveUpdate")
-            self._python_version = self._api.data.get("python_version")
-            self._revision = self._api.data.get("Revision")
-            self._systemname = self._api.data.get("SystemName")
-            self._version = self._api.data.get("version")
+            self._setVersion(self._api.data)
+            self._version_loaded = True
+
+    def _loadVersion(self):
+        # getversion properties are retrieved once, when first used
+        if not self._version_loaded:
+            self._getVersion()
+
+    def _setVersion(self, data):
+        self._build_time = data.get("build_time")
+        self._domoticzupdateurl = data.get("DomoticzUpdateURL")
+        self._dzvents_version = data.get("dzvents_version")
+        self._hash = data.get("hash")
+        self._haveupdate = data.get("HaveUpdate")
+        self._python_version = data.get("python_version")
+        self._revision = data.get("Revision")
+        self._systemname = data.get("SystemName")
+        self._version = data.get("version")
 
     def _checkForUpdate(self):
         # /json.htm?type=command&param=checkforupdate
@@ -176,49 +259,84 @@ class Server:
                 self._param_getlanguage)
             self._api.call()
             self._language = self._api.data.get("language")
+            self._language_loaded = True
 
     def _getSunRiseSet(self, now=False):
         # /json.htm?type=command&param=getSunRiseSet
         if self._exists:
-            if isinstance(self._currentdate_date, datetime):
-                if datetime.now().date() > self._currentdate_date:
-                    now = True
-            if now:
+            # Not retrieved yet, or a new day on the server
+            if now or self._currentdate is None or self._now().date() > self._currentdate_date:
                 self._api.querystring = "type=command&param={}".format(
                     self._param_sun)
                 self._api.call()
-                self._astrtwilightend = self._api.data.get("AstrTwilightEnd")
-                self._astrtwilightstart = self._api.data.get(
-                    "AstrTwilightStart")
-                self._civtwilightend = self._api.data.get("CivTwilightEnd")
-                self._civtwilightstart = self._api.data.get("CivTwilightStart")
-                self._nauttwilightend = self._api.data.get("NautTwilightEnd")
-                self._nauttwilightstart = self._api.data.get(
-                    "NautTwilightStart")
-                self._sunrise = self._api.data.get("Sunrise")
-                self._sunset = self._api.data.get("Sunset")
-                self._sunatsouth = self._api.data.get("SunAtSouth")
-                self._daylength = self._api.data.get("DayLength")
-                self._servertime = self._api.data.get("ServerTime")
-                # Remember the datetime from this call
-                if self._api.status == self._api.OK:
-                    self._currentdate = self._servertime[:10]  # yyyy-mm-dd
-                    self._currentdate_date = self._str2dt(self._servertime, "%Y-%m-%d %H:%M:%S").date()
-
-                    self._servertime_dt = self._str2dt(self._servertime, "%Y-%m-%d %H:%M:%S")
-                    sr = self._str2dt(self._currentdate + " " + self._sunrise, "%Y-%m-%d %H:%M")
-                    ss = self._str2dt(self._currentdate + " " + self._sunset, "%Y-%m-%d %H:%M")
-                    ats = self._str2dt(self._currentdate + " " + self._astrtwilightstart, "%Y-%m-%d %H:%M")
-                    ate = self._str2dt(self._currentdate + " " + self._astrtwilightend, "%Y-%m-%d %H:%M")
-                    self._is_day = sr < self._servertime_dt < ss
-                    self._is_night = (self._servertime_dt < ats) or (
-                        self._servertime_dt > ate)
-                else:
-                    self._currentdate = None
-                    self._currentdate_date = None
-                    self._is_day = None
-                    self._is_night = None
-                    self._servertime_dt = None
+                self._setSunRiseSet(self._api.data, self._api.status == self._api.OK)
+
+    def _setSunRiseSet(self, data, ok):
+        self._astrtwilightend = data.get("AstrTwilightEnd")
+        self._astrtwilightstart = data.get("AstrTwilightStart")
+        self._civtwilightend = data.get("CivTwilightEnd")
+        self._civtwilightstart = data.get("CivTwilightStart")
+        self._nauttwilightend = data.get("NautTwilightEnd")
+        self._nauttwilightstart = data.get("NautTwilightStart")
+        self._sunrise = data.get("Sunrise")
+        self._sunset = data.get("Sunset")
+        self._sunatsouth = data.get("SunAtSouth")
+        self._daylength = data.get("DayLength")
+        self._servertime = data.get("ServerTime")
+        # Remember the datetime from this call
+        if ok:
+            self._currentdate = self._servertime[:10]  # yyyy-mm-dd
+            self._currentdate_date = self._str2dt(self._servertime, "%Y-%m-%d %H:%M:%S").date()
+
+            self._servertime_dt = self._str2dt(self._servertime, "%Y-%m-%d %H:%M:%S")
+            if self._servertime_dt is not None:
+                # Time zone difference with the server, in quarters of an hour
+                quarters = round((self._servertime_dt - datetime.now()).total_seconds() / 900)
+                offset = timedelta(seconds=quarters * 900)
+                if offset != self._clock_offset:
+                    # The computed sun times are in the local time of the server
+                    self._sun_days.clear()
+                    self._clock_offset = offset
+            self._sun_today = SunTimes.from_domoticz(self._currentdate_date, data)
+        else:
+            self._currentdate = None
+            self._currentdate_date = None
+            self._servertime_dt = None
+            self._sun_today = None
+
+    def _loadClockOffset(self):
+        # The time zone difference is known from getSunRiseSet, retrieved once when
+        # not retrieved yet, also with local_sun. timedelta(0) when it can't be retrieved.
+        if self._clock_offset is None:
+            self._getSunRiseSet(True)
+        return self._clock_offset if self._clock_offset is not None else timedelta(0)
+
+    def _now(self):
+        # Current time on the server
+        return datetime.now() + self._loadClockOffset()
+
+    def _sun_time(self, name):
+        times = self.sun_times()
+        return times.get(name) if times is not None else None
+
+    def _setServerData(self, data):
+        # Update the server properties which are also returned in device and scene calls
+        # For some reason next property is only given in device and scene calls.
+        self._acttime = data.get("ActTime")
+        self._astrtwilightend = data.get("AstrTwilightEnd")
+        self._astrtwilightstart = data.get("AstrTwilightStart")
+        self._civtwilightend = data.get("CivTwilightEnd")
+        self._civtwilightstart = data.get("CivTwilightStart")
+        self._daylength = data.get("DayLength")
+        self._nauttwilightend = data.get("NautTwilightEnd")
+        self._nauttwilightstart = data.get("NautTwilightStart")
+        self._servertime = data.get("ServerTime")
+        self._sunatsouth = data.get("SunAtSouth")
+        self._sunrise = data.get("Sunrise")
+        self._sunset = data.get("Sunset")
+        # In param=getversion it is "version". Not given in scene calls.
+        if data.get("app_version") is not None:
+            self._version = data.get("app_version")
 
     def _getConfig(self):
         # /json.htm?type=command&param=getconfig
@@ -238,6 +356,25 @@ class Server:
             s = self._api.data.get("seconds")
             self._uptime = d + h + m + s
     
+    def _getHardware(self):
+        # /json.htm?type=hardware
+        # All hardware, retrieved once for all devices
+        if self._hardware_cache is None and self._exists:
+            hardware = {}
+            response = self._api.call(Hardware._querystring_hardware())
+            if response.is_OK():
+                for result_dict in response.payload or []:
+                    hw = Hardware(self,
+                                  payload=result_dict,
+                                  type_name=self._hardwareTypeName(result_dict.get("Type")))
+                    hardware[hw.idx] = hw
+                self._hardware_cache = hardware
+            return hardware
+        return self._hardware_cache or {}
+
+    def _hardwareTypeName(self, type):
+        return self.hardware_types.name(type)
+
     def _getTimerPlans(self):
         #/json.htm?type=command&param=gettimerplans
         if self._exists:
@@ -251,20 +388,95 @@ class Server:
     # Public Methods
     # ..........................................................................
 
+    def batch(self, workers=None, refresh=True):
+        """ Collect switch, level, color, udevice and scene commands, to send them concurrently
+
+            with server.batch() as batch:
+                batch.switch(12, Device.SWITCH_OFF)
+                batch.level(dev, 50)
+
+        Args:
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default CommandBatch.DEFAULT_WORKERS
+            refresh (:obj:`bool`, optional): update the given Device objects after executing. Default = True
+
+        Returns:
+            :obj:`CommandBatch`
+        """
+        from .commandbatch import CommandBatch
+        return CommandBatch(self,
+                            workers=workers if workers is not None else CommandBatch.DEFAULT_WORKERS,
+                            refresh=refresh)
+
     def checkForUpdate(self):
         """
         Retrieves Domoticz version information
         """
         self._checkForUpdate()
 
+    def devices(self, filter=None, used=None, favorite=None, plan=None):
+        """ Devices, retrieved from Domoticz with one call. The filters are done by Domoticz.
+
+            temperatures = server.devices(filter=Device.FILTER_TEMP, used=True, plan=3)
+
+        Args:
+            filter (:obj:`str`, optional): Device.FILTER_LIGHT, Device.FILTER_TEMP, Device.FILTER_UTILITY,
+                Device.FILTER_WEATHER, etc. Default all devices
+            used (:obj:`bool`, optional): only used devices when True
+            favorite (:obj:`bool`, optional): only favorite devices when True
+            plan (:obj:`int`, optional): only devices of the roomplan with this idx
+
+        Returns:
+            :obj:`DeviceCollection`
+        """
+        from .devicecollection import DeviceCollection
+        return DeviceCollection(self, filter=filter, used=used, favorite=favorite, plan=plan)
+
     def exists(self):
         """ Check if Domoticz server exists """
         return self._exists
 
+    def get_hardware(self, idx):
+        """ Hardware with idx, from the hardware retrieved once for this server
+
+        Returns:
+            :obj:`Hardware` or None if not found
+        """
+        if idx is None:
+            return None
+        return self._getHardware().get(int(idx))
+
     def has_location(self):
         """ Check if location is defined for sunrise, sunset, etc."""
         return self._setting.get_value("Location") is not None
 
+    def iter_devices(self, filter=None, used=None, favorite=None, plan=None):
+        """ Devices, created one at a time while the response of Domoticz is received
+
+        Stop iterating, eg. with break, when the device is found: the rest of
+        the response is not received and parsed, so the memory used does not
+        grow with the number of devices.
+
+            dev = next(server.iter_devices(filter=lambda dev: dev.name == "Kitchen"), None)
+
+        Args:
+            filter (:obj:`str` or callable, optional): a filter done by Domoticz, eg. Device.FILTER_TEMP,
+                or a function: only yield the devices for which filter(device) is True
+            used, favorite, plan: filters done by Domoticz, see :meth:`devices`
+
+        Returns:
+            Iterator of :obj:`Device`
+        """
+        from .device import Device
+        match = filter if callable(filter) else None
+        querystring = Device._querystring_devices(filter=None if callable(filter) else filter,
+                                                  used=used,
+                                                  favorite=favorite,
+                                                  plan=plan)
+        for result_dict in self._api.iter_payload(querystring):
+            dev = Device(self, payload=result_dict)
+            if match is None or match(dev):
+                yield dev
+
     def logmessage(self, text):
         """ Send text to the Domoticz log """
         # /json.htm?type=command&param=addlogmessage&message=MESSAGE
@@ -275,6 +487,10 @@ class Server:
             )
             self._api.call()
 
+    def refresh_hardware(self):
+        """ Retrieve the hardware again at the next use, eg. after adding or deleting hardware """
+        self._hardware_cache = None
+
     def reboot(self):
         """Reboot the Domoticz server"""
         # /json.htm?type=command&param=system_reboot
@@ -291,6 +507,113 @@ class Server:
                 self._param_shutdown)
             self._api.call()
 
+    def subscribe(self, target, callback, fields=None, debounce=0, start=True):
+        """ Call callback(device, changes) when a device changes
+
+        All subscriptions share one :obj:`DevicePoller`, which retrieves only the changed devices.
+
+        Args:
+            target: idx of a device, a function filter(device) returning True for the
+                devices to follow, or None for all devices
+            callback: called as callback(device, changes), where changes is a :obj:`dict`
+                of field: (old value, new value)
+            fields (:obj:`tuple`, optional): Device properties to compare. Default Subscription.FIELDS
+            debounce (:obj:`float`, optional): seconds without new changes before the callback is called.
+                Default = 0
+            start (:obj:`bool`, optional): start polling in a background thread. Use False to call
+                `server.poller.poll()` yourself, eg. on a plugin heartbeat. Default = True
+
+        Returns:
+            :obj:`Subscription`
+        """
+        from .deviceevents import Subscription
+        subscription = self.events.subscribe(target,
+                                             callback,
+                                             fields=fields if fields is not None else Subscription.FIELDS,
+                                             debounce=debounce)
+        if start:
+            self.poller.start()
+        return subscription
+
+    def sun_times(self, day=None):
+        """ Sunrise, sunset, sun at south and twilight of a day, kept per day
+
+            times = server.sun_times()
+            print(times.sunrise, times.is_day(datetime.now()))
+
+        The times of today are retrieved once a day with getSunRiseSet, unless the
+        server was created with local_sun=True. The times of other days are computed
+        with the Location setting.
+
+        Args:
+            day (:obj:`date`, optional): Default today on the server
+
+        Returns:
+            :obj:`SunTimes`, or None when they are not known, eg. without Location
+        """
+        if not self._local_sun:
+            self._getSunRiseSet()
+            if self._sun_today is not None and day in (None, self._sun_today.day):
+                return self._sun_today
+        day = day if day is not None else self._now().date()
+        times = self._sun_days.get(day)
+        if times is None:
+            calculator = self.solar_calculator
+            if calculator is None:
+                return None
+            times = calculator.sun_times(day)
+            if len(self._sun_days) >= self.SUN_DAYS_CACHED:
+                self._sun_days.clear()
+            self._sun_days[day] = times
+        return times
+
+    def timer_schedule(self, timers=None, days=None):
+        """ Compute when timers fire, without calls to Domoticz
+
+            for event in server.timer_schedule().next(10):
+                print(event.time, event.timer)
+
+        Args:
+            timers (optional): iterable of timers. Default all timers in timer_index
+            days (:obj:`int`, optional): number of days computed at once. Default TimerSchedule.DEFAULT_DAYS
+
+        Returns:
+            :obj:`TimerSchedule`
+        """
+        from .timerschedule import TimerSchedule
+        return TimerSchedule(self,
+                             timers=timers,
+                             days=days if days is not None else TimerSchedule.DEFAULT_DAYS)
+
+    def timer_sync(self, desired, workers=None, delete=True):
+        """ Make the timers of devices, thermostats and scenes equal to the desired timers
+
+            sync = server.timer_sync({dev: [timer1, timer2]})
+            print(sync.summary())
+            sync.execute()
+
+        Args:
+            desired: :obj:`dict` of :obj:`Device` or :obj:`Scene` with a :obj:`list` of timers,
+                or an iterable of timers
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default TimerSync.DEFAULT_WORKERS
+            delete (:obj:`bool`, optional): delete the timers that are not desired. Default = True
+
+        Returns:
+            :obj:`TimerSync`
+        """
+        from .timersync import TimerSync
+        return TimerSync(self,
+                         desired,
+                         workers=workers if workers is not None else TimerSync.DEFAULT_WORKERS,
+                         delete=delete)
+
+    def unsubscribe(self, subscription):
+        """ Remove a subscription. Polling stops after the last subscription is removed. """
+        if self._events is not None:
+            self._events.unsubscribe(subscription)
+            if len(self._events) == 0:
+                self._poller.stop()
+
     def update(self):
         """Update the Domoticz software"""
         if self._exists:
@@ -317,6 +640,21 @@ class Server:
                     )
                     self._api.call()
 
+    def update_pipeline(self, workers=None, window=0):
+        """ Pipeline to send udevice updates for many devices concurrently
+
+        Args:
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default UpdatePipeline.DEFAULT_WORKERS
+            window (:obj:`float`, optional): seconds between sending the pending updates when started. Default = 0
+
+        Returns:
+            :obj:`UpdatePipeline`
+        """
+        from .updatepipeline import UpdatePipeline
+        return UpdatePipeline(self,
+                              workers=workers if workers is not None else UpdatePipeline.DEFAULT_WORKERS,
+                              window=window)
+
     # ..........................................................................
     # Properties
     # ..........................................................................
@@ -362,7 +700,7 @@ class Server:
 
     @property
     def astrtwilightend_dt(self):
-        return self._str2dt(self._currentdate + " " + self._astrtwilightend, "%Y-%m-%d %H:%M")
+        return self._sun_time("astrtwilightend")
 
     @property
     # getSunRiseSet
@@ -372,17 +710,24 @@ class Server:
 
     @property
     def astrtwilightstart_dt(self):
-        return self._str2dt(self._currentdate + " " + self._astrtwilightstart, "%Y-%m-%d %H:%M")
+        return self._sun_time("astrtwilightstart")
 
     @property
     # getversion
     def build_time(self):
+        self._loadVersion()
         return self._build_time
 
     @property
     def build_time_dt(self):
+        self._loadVersion()
         return self._str2dt(self._build_time, "%Y-%m-%d %H:%M:%S")
 
+    @property
+    def cache_dir(self):
+        """Directory for files cached on disk, or None"""
+        return self._cache_dir
+
     @property
     # getSunRiseSet
     def civtwilightend(self):
@@ -391,7 +736,7 @@ class Server:
 
     @property
     def civtwilightend_dt(self):
-        return self._str2dt(self._currentdate + " " + self._civtwilightend, "%Y-%m-%d %H:%M")
+        return self._sun_time("civtwilightend")
 
     @property
     # getSunRiseSet
@@ -401,7 +746,7 @@ class Server:
 
     @property
     def civtwilightstart_dt(self):
-        return self._str2dt(self._currentdate + " " + self._civtwilightstart, "%Y-%m-%d %H:%M")
+        return self._sun_time("civtwilightstart")
 
     @property
     # getSunRiseSet
@@ -414,38 +759,64 @@ class Server:
     # getversion & checkforupdate
     def domoticzupdateurl(self):
         """Domoticz update url"""
+        self._loadVersion()
         return self._domoticzupdateurl
 
     @property
     # getversion
     def dzvents_version(self):
         """dzVents version"""
+        self._loadVersion()
         return self._dzvents_version
 
+    @property
+    def events(self):
+        """:obj:`DeviceEvents` for the subscriptions"""
+        if self._events is None:
+            from .deviceevents import DeviceEvents
+            self._events = DeviceEvents(self.poller)
+        return self._events
+
+    @property
+    def hardware_types(self):
+        """:obj:`HardwareTypes` catalogue of this server"""
+        if self._hardware_types is None:
+            from .hardwaretypes import HardwareTypes
+            self._hardware_types = HardwareTypes(self)
+        return self._hardware_types
+
     @property
     # getversion & checkforupdate
     def haveupdate(self):
         """Domoticz update available?"""
+        self._loadVersion()
         return self._haveupdate
 
     @property
     # getversion
     def hash(self):
         """Build hash from Git"""
+        self._loadVersion()
         return self._hash
 
     @property
     def is_day(self):
-        return self._is_day
+        """Between sunrise and sunset now. Retrieves the sun times at most once a day"""
+        times = self.sun_times()
+        return times.is_day(self._now()) if times is not None else None
 
     @property
     def is_night(self):
-        return self._is_night
+        """Outside astronomical twilight now. Retrieves the sun times at most once a day"""
+        times = self.sun_times()
+        return times.is_night(self._now()) if times is not None else None
 
     @property
     # getlanguage
     def language(self):
         """Domoticz user interface language"""
+        if not self._language_loaded:
+            self._getLanguage()
         return self._language
 
     @property
@@ -456,7 +827,7 @@ class Server:
 
     @property
     def nauttwilightend_dt(self):
-        return self._str2dt(self._currentdate + " " + self._nauttwilightend, "%Y-%m-%d %H:%M")
+        return self._sun_time("nauttwilightend")
 
     @property
     # getSunRiseSet
@@ -466,7 +837,7 @@ class Server:
 
     @property
     def nauttwilightstart_dt(self):
-        return self._str2dt(self._currentdate + " " + self._nauttwilightstart, "%Y-%m-%d %H:%M")
+        return self._sun_time("nauttwilightstart")
 
     @property
     def password(self):
@@ -477,6 +848,14 @@ class Server:
     def password(self, value):
         self._password = value
 
+    @property
+    def poller(self):
+        """:obj:`DevicePoller` shared by the subscriptions"""
+        if self._poller is None:
+            from .devicepoller import DevicePoller
+            self._poller = DevicePoller(self)
+        return self._poller
+
     @property
     def port(self):
         """Domoticz server port"""
@@ -495,12 +874,14 @@ class Server:
     # getversion
     def python_version(self):
         """Python version on Domoticz server"""
+        self._loadVersion()
         return self._python_version
 
     @property
     # getversion & checkforupdate
     def revision(self):
         """Domoticz revision"""
+        self._loadVersion()
         return self._revision
 
     @property
@@ -509,6 +890,13 @@ class Server:
         """Domoticz protection"""
         return self._rights
 
+    @property
+    def scene_registry(self):
+        """:obj:`SceneRegistry` with all scenes and groups of this server, retrieved again after scenes_ttl seconds"""
+        if self._scene_registry is None:
+            self._scene_registry = SceneRegistry(self, ttl=self._scenes_ttl)
+        return self._scene_registry
+
     @property
     def setting(self):
         """:obj: `Setting`"""
@@ -524,7 +912,17 @@ class Server:
     @property
     def servertime_dt(self):
         """:obj:`datetime` Domoticz server time"""
-        return self._str2dt(self._servertime, "%Y-%m-%d %H:%M:%S")
+        self._getSunRiseSet(True)
+        return self._servertime_dt
+
+    @property
+    def solar_calculator(self):
+        """:obj:`SolarCalculator` of the Location setting, or None when the location is not defined"""
+        if self._solar_calculator is None:
+            # The time zone difference is read at each computation, it is retrieved later
+            self._solar_calculator = SolarCalculator.from_location(self._setting.get_value("Location"),
+                                                                   offset=self._loadClockOffset)
+        return self._solar_calculator
 
     @property
     # checkforupdate
@@ -539,7 +937,7 @@ class Server:
 
     @property
     def sunatsouth_dt(self):
-        return self._str2dt(self._currentdate + " " + self._sunatsouth, "%Y-%m-%d %H:%M")
+        return self._sun_time("sunatsouth")
 
     @property
     # getSunRiseSet
@@ -549,7 +947,7 @@ class Server:
 
     @property
     def sunrise_dt(self):
-        return self._str2dt(self._currentdate + " " + self._sunrise, "%Y-%m-%d %H:%M")
+        return self._sun_time("sunrise")
 
     @property
     # getSunRiseSet
@@ -559,17 +957,26 @@ class Server:
 
     @property
     def sunset_dt(self):
-        return self._str2dt(self._currentdate + " " + self._sunset, "%Y-%m-%d %H:%M")
+        return self._sun_time("sunset")
 
     @property
     # getversion & checkforupdate
     def systemname(self):
+        self._loadVersion()
         return self._systemname
 
     @property
     def translation(self):
+        """:obj:`Translation`, retrieved when first used"""
+        if self._translation is None:
+            self._translation = Translation(self, language=self.language)
         return self._translation
 
+    @property
+    def transport(self):
+        """:obj:`Transport` for the HTTP connections"""
+        return self._transport
+
     @property
     def uptime(self):
         """Uptime of Domoticz in seconds.
@@ -592,8 +999,17 @@ class Server:
     # getversion
     def version(self):
         """Domoticz version"""
+        self._loadVersion()
         return self._version
     
+    @property
+    def timer_index(self):
+        """:obj:`TimerIndex` with the timers of this server, loaded with load or load_all"""
+        if self._timer_index is None:
+            from .timerindex import TimerIndex
+            self._timer_index = TimerIndex(self)
+        return self._timer_index
+
     @property
     def timerplans(self):
         self._getTimerPlans()
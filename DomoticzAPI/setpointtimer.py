@@ -67,7 +67,7 @@ class SetPointTimer(BaseTimer):
     def loadbythermostat(device):
         result = []
         if isinstance(device, Device) and device.exists() and device.type == "Thermostat":
-            api = device.hardware.api
+            api = device._api
             querystring = "type={}&idx={}".format(SetPointTimer._param_timers, device._idx)
             api.querystring = querystring
             api.call()
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from .settings import Settings
-import urllib.request as request
-import urllib.parse as parse
 import base64
+import time
 
 
 class Setting:
@@ -12,13 +11,23 @@ class Setting:
 
     _url = "storesettings"
 
-    def __init__(self, server):
+    # Seconds the retrieved settings are used before they are retrieved again
+    DEFAULT_TTL = 60
+
+    def __init__(self, server, ttl=DEFAULT_TTL):
         """Settings class, to get Domoticz settings
 
+        The settings are retrieved with one call and kept for ttl seconds.
+
         Args:
             server (:obj:`Server`): Domoticz server object where to maintain the device            
+            ttl (:obj:`int`, optional): seconds to keep the settings. None keeps them until `invalidate()`,
+                0 retrieves them for every value. Default = 60
         """
         self._server = server
+        self._settings = None
+        self._settings_time = None
+        self._ttl = ttl
 
     def __str__(self):
         txt = "{}(\"{}\")".format(self.__class__.__name__, self._server)
@@ -28,11 +37,23 @@ class Setting:
         # /json.htm?type=settings
         # Not required yet. Perhaps in the near future to be sure that ALL setting are available for use.
         self._settings = {}
+        self._settings_time = None
         if self._server.exists():
-            self._server._api.querystring = "type={}".format(self._type_settings)
-            self._server._api.call()
-            if self._server._api.status == self._server._api.OK:
-                self._settings = self._server._api.data
+            response = self._server._api.call("type={}".format(self._type_settings))
+            if response.is_OK():
+                self._settings = dict(response.data)
+                self._settings_time = time.monotonic()
+
+    def _is_expired(self):
+        if self._settings_time is None:
+            return True
+        if self._ttl is None:
+            return False
+        return time.monotonic() - self._settings_time >= self._ttl
+
+    def _loadSettings(self):
+        if self._is_expired():
+            self._getSettings()
 
     # ..........................................................................
     # Public methods
@@ -43,12 +64,10 @@ class Setting:
         Args:
             key (str): key from a setting, eg. "AcceptNewHardware", "SecPassword", etc
         """
-        # Requery settings
         # /json.htm?type=settings
-        # Not required yet. Perhaps in the near future to be sure that ALL setting are available for use.
+        # Only requeried when the settings are expired
         if key in Settings.KEYS:
-            self._getSettings()
-  
+            self._loadSettings()
             return self._settings.get(key)
         else:
             return None
@@ -65,8 +84,9 @@ class Setting:
                 self._server._api.endpoint,
                 self._url
             )
-            self._getSettings()
-            d = self._settings
+            self._loadSettings()
+            # The posted values are different from the retrieved values, so change a copy
+            d = dict(self._settings)
             # First we have to transform all switches from None/0/1 to <deleted>/on :(
             for k, v in list(d.items()):
                 if k in Settings.KEY_SWITCHES:
@@ -138,9 +158,25 @@ class Setting:
                     d[Settings.KEY_SUBSYSTEMAPPS] = 1
                     
             #print("Data" + str(d))
-            data = parse.urlencode(d).encode("utf-8")
-            req = request.Request(url, data=data)
             try:
-                request.urlopen(req)
+                self._server._api._post(url, d)
+                self._settings[key] = value
             except:
-                pass
+                self.invalidate()
+
+    def invalidate(self):
+        """Retrieve the settings again from Domoticz at the next use"""
+        self._settings_time = None
+        self._server.api.invalidate()
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def ttl(self):
+        """Seconds the settings are kept. None keeps them until `invalidate()`"""
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value):
+        self._ttl = value
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from datetime import date, datetime, timedelta
+import math
+
+
+class SunTimes:
+    """
+        Domoticz SunTimes class
+
+        Sunrise, sunset, sun at south and twilight of one day, as :obj:`datetime`
+        in the local time of the server. A time is None when it does not occur
+        that day, eg. no astronomical twilight in a summer night far from the equator.
+    """
+
+    # Attribute -> key in /json.htm?type=command&param=getSunRiseSet
+    KEYS = {
+        "astrtwilightend": "AstrTwilightEnd",
+        "astrtwilightstart": "AstrTwilightStart",
+        "civtwilightend": "CivTwilightEnd",
+        "civtwilightstart": "CivTwilightStart",
+        "nauttwilightend": "NautTwilightEnd",
+        "nauttwilightstart": "NautTwilightStart",
+        "sunatsouth": "SunAtSouth",
+        "sunrise": "Sunrise",
+        "sunset": "Sunset",
+    }
+
+    def __init__(self, day, **times):
+        """
+        Args:
+            day (:obj:`date`): the day
+            times: :obj:`datetime` or None for the attributes in SunTimes.KEYS, eg. sunrise=datetime(...)
+        """
+        self._day = day
+        self._times = {name: times.get(name) for name in self.KEYS}
+
+    def __str__(self):
+        return "{}({}, sunrise: {}, sunset: {})".format(self.__class__.__name__,
+                                                        self._day,
+                                                        self._format(self.sunrise),
+                                                        self._format(self.sunset))
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    @staticmethod
+    def _format(value):
+        return value.strftime("%H:%M") if value is not None else None
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    @classmethod
+    def from_domoticz(cls, day, data):
+        """SunTimes from the "HH:MM" values of a getSunRiseSet response
+
+        Args:
+            day (:obj:`date`): the day of the response
+            data (:obj:`dict`): the response
+        """
+        times = {}
+        midnight = datetime(day.year, day.month, day.day)
+        for name, key in cls.KEYS.items():
+            try:
+                hour, minute = str(data.get(key)).split(":")[:2]
+                times[name] = midnight + timedelta(hours=int(hour), minutes=int(minute))
+            except ValueError:
+                times[name] = None
+        return cls(day, **times)
+
+    def get(self, name):
+        """:obj:`datetime` of an attribute in SunTimes.KEYS, eg. "sunrise" """
+        return self._times.get(name)
+
+    def is_day(self, at):
+        """Between sunrise and sunset
+
+        Args:
+            at (:obj:`datetime`): local time of the server
+        """
+        sunrise = self._times["sunrise"]
+        sunset = self._times["sunset"]
+        if sunrise is None or sunset is None:
+            return None
+        return sunrise < at < sunset
+
+    def is_night(self, at):
+        """Before the start or after the end of astronomical twilight
+
+        Args:
+            at (:obj:`datetime`): local time of the server
+        """
+        start = self._times["astrtwilightstart"]
+        end = self._times["astrtwilightend"]
+        if start is None or end is None:
+            return None
+        return at < start or at > end
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def astrtwilightend(self):
+        return self._times["astrtwilightend"]
+
+    @property
+    def astrtwilightstart(self):
+        return self._times["astrtwilightstart"]
+
+    @property
+    def civtwilightend(self):
+        return self._times["civtwilightend"]
+
+    @property
+    def civtwilightstart(self):
+        return self._times["civtwilightstart"]
+
+    @property
+    def day(self):
+        """:obj:`date`"""
+        return self._day
+
+    @property
+    def daylength(self):
+        """:obj:`timedelta` from sunrise to sunset"""
+        if self.sunrise is None or self.sunset is None:
+            return None
+        return self.sunset - self.sunrise
+
+    @property
+    def nauttwilightend(self):
+        return self._times["nauttwilightend"]
+
+    @property
+    def nauttwilightstart(self):
+        return self._times["nauttwilightstart"]
+
+    @property
+    def sunatsouth(self):
+        return self._times["sunatsouth"]
+
+    @property
+    def sunrise(self):
+        return self._times["sunrise"]
+
+    @property
+    def sunset(self):
+        return self._times["sunset"]
+
+
+class SolarCalculator:
+    """
+        Domoticz SolarCalculator class
+
+        Computes the sun times of any day for a location, without Domoticz, with
+        the sunrise equation. The result differs at most about a minute from
+        the times of Domoticz.
+
+            calculator = SolarCalculator(52.37, 4.89)
+            print(calculator.sun_times(date(2021, 6, 21)))
+    """
+
+    # Sun altitude in degrees of each event; sunrise includes refraction and the radius of the sun
+    ALTITUDES = (
+        ("sunrise", "sunset", -0.833),
+        ("civtwilightstart", "civtwilightend", -6.0),
+        ("nauttwilightstart", "nauttwilightend", -12.0),
+        ("astrtwilightstart", "astrtwilightend", -18.0),
+    )
+
+    # Julian day of 2000-01-01 12:00 UTC, and of 1970-01-01 00:00 UTC
+    J2000 = 2451545.0
+    J1970 = 2440587.5
+
+    def __init__(self, latitude, longitude, offset=None):
+        """
+        Args:
+            latitude (:obj:`float`): degrees, north is positive
+            longitude (:obj:`float`): degrees, east is positive
+            offset (optional): difference between the clock of the server and the local clock, a
+                :obj:`timedelta` or a function returning it, which is called at each computation.
+                Default the server and this computer are in the same time zone
+        """
+        self._latitude = float(latitude)
+        self._longitude = float(longitude)
+        self._offset = offset if offset is not None else timedelta(0)
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, self._latitude, self._longitude)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _local(self, julian, offset):
+        # Local time of the server of a Julian day, to the minute
+        value = datetime.fromtimestamp((julian - self.J1970) * 86400) + offset
+        return (value + timedelta(seconds=30)).replace(second=0, microsecond=0)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    @classmethod
+    def from_location(cls, location, offset=None):
+        """SolarCalculator of the Domoticz Location setting, or None when it is not defined
+
+        Args:
+            location (:obj:`dict`): {"Latitude": ..., "Longitude": ...}
+            offset (optional): :obj:`timedelta` or a function returning it, see SolarCalculator
+        """
+        try:
+            return cls(location.get("Latitude"), location.get("Longitude"), offset=offset)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def sun_times(self, day):
+        """:obj:`SunTimes` of a :obj:`date`"""
+        n = (day - date(2000, 1, 1)).days
+        mean_noon = n - self._longitude / 360
+        anomaly = math.radians((357.5291 + 0.98560028 * mean_noon) % 360)
+        center = 1.9148 * math.sin(anomaly) + 0.0200 * math.sin(2 * anomaly) + 0.0003 * math.sin(3 * anomaly)
+        ecliptic = math.radians((math.degrees(anomaly) + center + 180 + 102.9372) % 360)
+        transit = self.J2000 + mean_noon + 0.0053 * math.sin(anomaly) - 0.0069 * math.sin(2 * ecliptic)
+        declination = math.asin(math.sin(ecliptic) * math.sin(math.radians(23.4397)))
+        latitude = math.radians(self._latitude)
+        offset = self.offset
+        times = {"sunatsouth": self._local(transit, offset)}
+        for rise, set_, altitude in self.ALTITUDES:
+            cos_hour = (math.sin(math.radians(altitude)) - math.sin(latitude) * math.sin(declination)) \
+                / (math.cos(latitude) * math.cos(declination))
+            if -1 <= cos_hour <= 1:
+                hour = math.degrees(math.acos(cos_hour)) / 360
+                times[rise] = self._local(transit - hour, offset)
+                times[set_] = self._local(transit + hour, offset)
+        return SunTimes(day, **times)
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def latitude(self):
+        return self._latitude
+
+    @property
+    def longitude(self):
+        return self._longitude
+
+    @property
+    def offset(self):
+        """:obj:`timedelta` between the clock of the server and the local clock"""
+        return self._offset() if callable(self._offset) else self._offset
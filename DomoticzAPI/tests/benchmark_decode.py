@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import gc
+import json
+import time
+import tracemalloc
+
+# Parse time and peak memory of decoding a large type=devices response
+NR_OF_DEVICES = 5000
+NR_OF_RUNS = 5
+
+
+def device_dict(idx):
+    return {
+        "idx": str(idx), "ID": "{:08X}".format(idx), "Unit": 1, "Name": "Device {}".format(idx),
+        "HardwareID": 1, "HardwareName": "Hardware", "HardwareType": "Dummy", "HardwareTypeVal": 15,
+        "Type": "Temp", "SubType": "LaCrosse TX3", "TypeImg": "temperature",
+        "Data": "{:.1f} C".format(idx / 100), "Temp": idx / 100, "BatteryLevel": 255, "SignalLevel": "-",
+        "LastUpdate": "2020-12-01 12:00:00", "Favorite": 0, "Used": 1, "PlanID": "0", "PlanIDs": [0],
+        "Description": "", "Notifications": "false", "ShowNotifications": True, "Protected": False,
+        "Timers": "false", "XOffset": "0", "YOffset": "0", "AddjMulti": 1.0, "AddjValue": 0.0,
+    }
+
+
+def measure(decode, content):
+    gc.collect()
+    tracemalloc.start()
+    decode(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for i in range(NR_OF_RUNS):
+        decode(content)
+    elapsed = (time.perf_counter() - start) / NR_OF_RUNS
+    return elapsed, peak
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    content = json.dumps({
+        "status": "OK", "title": "Devices", "ActTime": 1606824000,
+        "result": [device_dict(idx) for idx in range(1, NR_OF_DEVICES + 1)],
+    }).encode()
+    print("Response size ......... : {:.1f} MB".format(len(content) / 1e6))
+    print("JSON backend .......... : {}".format(dom.API.JSON_BACKEND))
+    for name, decode in [("Legacy", dom.API._decode_legacy), ("Bytes", dom.API._decode)]:
+        elapsed, peak = measure(decode, content)
+        print("{:.<23} : {:.3f} s, peak memory {:.1f} MB".format(name + " ", elapsed, peak / 1e6))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Apostrophe in a value")
+    print("--------------------------------------------------------------------------------")
+    content = json.dumps({"status": "OK", "result": [{"Name": "Kid's room"}]}).encode()
+    try:
+        print("Legacy ................ : {}".format(dom.API._decode_legacy(content)))
+    except ValueError as e:
+        print("Legacy ................ : {}".format(e))
+    print("Bytes ................. : {}".format(dom.API._decode(content)))
+
+
+if __name__ == "__main__":
+    main()
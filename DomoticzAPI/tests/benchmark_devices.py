@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+import gc
+import json
+import threading
+import time
+import tracemalloc
+
+# Memory used by a fleet of devices, using a stub of the Domoticz json/API
+NR_OF_DEVICES = 5000
+NR_OF_HARDWARE = 10
+
+
+def device_dict(idx):
+    result = {
+        "idx": str(idx), "ID": "{:08X}".format(idx), "Unit": 1, "Name": "Device {}".format(idx),
+        "HardwareID": idx % NR_OF_HARDWARE + 1, "HardwareName": "Hardware", "HardwareType": "Dummy",
+        "HardwareTypeVal": 15, "Type": "Temp", "SubType": "LaCrosse TX3", "TypeImg": "temperature",
+        "Data": "{:.1f} C".format(idx / 100), "Temp": idx / 100, "BatteryLevel": 255, "SignalLevel": "-",
+        "LastUpdate": "2020-12-01 12:00:00", "Favorite": idx % 10 == 0 and 1 or 0, "Used": 1,
+        "PlanID": "0", "PlanIDs": [0], "Description": "", "Notifications": "false",
+        "ShowNotifications": True, "Protected": False, "Timers": "false", "HaveTimeout": False,
+        "XOffset": "0", "YOffset": "0", "AddjMulti": 1.0, "AddjMulti2": 1.0, "AddjValue": 0.0,
+        "AddjValue2": 0.0, "CustomImage": 0, "Image": "", "trend": 0, "UsedByCamera": False,
+    }
+    if idx % 20 == 0:
+        result.update({"Type": "Color Switch", "SubType": "RGBW", "SwitchType": "Dimmer", "Level": 50,
+                       "Color": "{\"b\":0,\"cw\":0,\"g\":0,\"m\":3,\"r\":255,\"t\":0,\"ww\":0}"})
+    return result
+
+
+DEVICES = json.dumps({
+    "status": "OK", "title": "Devices", "ActTime": 1606824000,
+    "result": [device_dict(idx) for idx in range(1, NR_OF_DEVICES + 1)],
+}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        q = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        data = {"status": "OK", "title": "Stub"}
+        if q.get("param") == "getauth":
+            data["rights"] = 2
+        elif q.get("type") == "hardware":
+            data["result"] = [{"idx": str(idx), "Name": "Hardware", "Type": 15, "Enabled": "true"}
+                              for idx in range(1, NR_OF_HARDWARE + 1)]
+        elif q.get("param") == "gethardwaretypes":
+            data["result"] = [{"idx": 15, "name": "Dummy (Does nothing, use for virtual switches only)"}]
+        body = DEVICES if q.get("type") == "devices" else json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    httpd = HTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        server = dom.Server(port=str(httpd.server_address[1]))
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        devices = server.devices()
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        # The API keeps the last response of the thread, replace it with a small one,
+        # and the response is cached for a short time
+        server.api.call("type=command&param=getauth")
+        server.api.invalidate()
+        gc.collect()
+        devices_only, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("Nr of devices ......... : {}".format(len(devices)))
+        print("Load time ............. : {:.3f} s".format(elapsed))
+        print("Memory ................ : {:.1f} MB ({} bytes/device)".format(current / 1e6, current // len(devices)))
+        print("Memory devices only ... : {:.1f} MB ({} bytes/device)".format(devices_only / 1e6,
+                                                                            devices_only // len(devices)))
+        print("Peak memory ........... : {:.1f} MB".format(peak / 1e6))
+        del devices
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Streaming, stop at the first device")
+        print("--------------------------------------------------------------------------------")
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        dev = next(server.iter_devices(filter=lambda dev: dev.idx == 1), None)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("Found ................. : {}".format(dev))
+        print("Time .................. : {:.3f} s".format(elapsed))
+        print("Peak memory ........... : {:.1f} MB".format(peak / 1e6))
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import DomoticzAPI as dom
+import threading
+import time
 
 
 def main():
@@ -60,6 +62,25 @@ def main():
         print("server.api.url ........... : {}".format(server.api.url))
         print("version .................. : {}".format(
             server.api.data.get("version")))
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Shared reads")
+        print("--------------------------------------------------------------------------------")
+        print("server.api.cache_window .. : {}".format(server.api.cache_window))
+        threads = [threading.Thread(target=server.api.call, args=("type=hardware",)) for i in range(10)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print("10 threads, type=hardware : {:.3f} s".format(time.perf_counter() - start))
+        start = time.perf_counter()
+        server.api.call("type=hardware")
+        print("Again, from cache ........ : {:.3f} s".format(time.perf_counter() - start))
+        server.api.invalidate()
+        start = time.perf_counter()
+        server.api.call("type=hardware")
+        print("After invalidate ......... : {:.3f} s".format(time.perf_counter() - start))
     else:
         print("Server not found!!!")
         print(server.api.message)
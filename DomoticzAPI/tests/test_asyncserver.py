@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+import asyncio
+import json
+import threading
+
+# Stub of the Domoticz json/API, so this test does not need a running Domoticz
+DEVICES = {
+    idx: {"idx": str(idx), "Name": "Switch {}".format(idx), "HardwareID": 1, "Type": "Light/Switch",
+          "SubType": "Switch", "SwitchType": "On/Off", "Data": "Off", "Level": 0}
+    for idx in range(1, 11)
+}
+SCENES = {
+    idx: {"idx": str(idx), "Name": "Scene {}".format(idx), "Type": "Scene", "Status": "Off", "Favorite": 0}
+    for idx in range(1, 4)
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        q = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        data = {"status": "OK", "title": "Stub"}
+        if q.get("param") == "getauth":
+            data["rights"] = 2
+        elif q.get("param") == "getversion":
+            data.update({"version": "stub", "DomoticzUpdateURL": ""})
+        elif q.get("param") == "getSunRiseSet":
+            data.update({"ServerTime": "2020-12-01 12:00:00", "Sunrise": "08:30", "Sunset": "16:30",
+                         "AstrTwilightStart": "06:30", "AstrTwilightEnd": "18:30"})
+        elif q.get("type") == "hardware":
+            data["result"] = [{"idx": "1", "Name": "Stub hardware", "Type": 15, "Enabled": "true"}]
+        elif q.get("param") == "gethardwaretypes":
+            data["result"] = [{"idx": 15, "name": "Dummy (Does nothing, use for virtual switches only)"}]
+        elif q.get("type") == "devices":
+            data["result"] = [d for d in DEVICES.values() if q.get("rid") in (None, d["idx"])]
+        elif q.get("type") == "scenes":
+            data["result"] = list(SCENES.values())
+        elif q.get("param") == "switchlight":
+            DEVICES[int(q["idx"])]["Data"] = q["switchcmd"]
+        elif q.get("param") == "switchscene":
+            SCENES[int(q["idx"])]["Status"] = q["switchcmd"]
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+async def run(port):
+    async with dom.AsyncServer(port=port) as server:
+        print(server)
+        print("Version ................ : {}".format(server.version))
+        print("Sunrise ................ : {}".format(server.sunrise))
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Devices")
+        print("--------------------------------------------------------------------------------")
+        devices = await server.devices()
+        print("Nr of devices .......... : {}".format(len(devices)))
+        dev = await server.device(idx=1)
+        print("{} - {} - {}".format(dev, dev.hardware, dev.data))
+        dev = await server.device(name="Switch 2")
+        print("{} - {}".format(dev, dev.data))
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Switch all devices concurrently")
+        print("--------------------------------------------------------------------------------")
+        await asyncio.gather(*[d.update_switch(dom.Device.SWITCH_ON) for d in devices])
+        for d in devices:
+            print("{} - {}".format(d, d.data))
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Scenes")
+        print("--------------------------------------------------------------------------------")
+        scenes = await server.scenes()
+        await asyncio.gather(*[s.switch(dom.ON) for s in scenes])
+        for s in scenes:
+            print("{} - {}".format(s, s.status))
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    httpd = HTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run(run(str(httpd.server_address[1])))
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import time
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    lights = [dev for dev in server.devices() if dev.is_switch() and dev.type == "Light/Switch"]
+    print("Nr of switches ........ : {}".format(len(lights)))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Toggle all switches twice")
+    print("--------------------------------------------------------------------------------")
+    start = time.perf_counter()
+    with server.batch() as batch:
+        for dev in lights:
+            batch.switch(dev, dom.Device.SWITCH_TOGGLE)
+            batch.switch(dev, dom.Device.SWITCH_TOGGLE)
+    print("Time .................. : {:.3f} s".format(time.perf_counter() - start))
+    for result in batch.results:
+        print(result)
+    for dev in lights:
+        print("{} - {}".format(dev, dev.data))
+
+
+if __name__ == "__main__":
+    main()
@@ -77,6 +77,8 @@ def main():
         dev4.set_value("setpoint", 23)
         print(dev4)
         print(dev4.get_value("SetPoint"))
+        print(dev4.get_values(["SetPoint", "LastUpdate", "HardwareName"]))
+        print(dev4.get_value("LastUpdate", max_age=0))
       
         
     # Cleanup test data
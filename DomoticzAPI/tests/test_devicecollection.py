@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    devices = server.devices()
+    print(devices)
+    print("Nr of devices ......... : {}".format(len(devices)))
+    for dev in devices:
+        print("{} - {}".format(dev, dev.hardware))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Lookup")
+    print("--------------------------------------------------------------------------------")
+    if len(devices) > 0:
+        dev = devices.devices[0]
+        print("get({}) ................ : {}".format(dev.idx, devices.get(dev.idx)))
+        print("find(\"{}\") ........... : {}".format(dev.name, devices.find(dev.name)))
+    print("find(\"xyz\") ........... : {}".format(devices.find("xyz")))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Refresh")
+    print("--------------------------------------------------------------------------------")
+    devices.refresh()
+    print(devices)
+    if len(devices) > 0:
+        print("Same object after refresh: {}".format(devices.get(dev.idx) is dev))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Filtered by Domoticz")
+    print("--------------------------------------------------------------------------------")
+    for filter in sorted(dom.Device.FILTERS):
+        print("{:.<22} : {}".format(filter + " ", len(server.devices(filter=filter))))
+    print("Used .................. : {}".format(len(server.devices(used=True))))
+    print("Favorite .............. : {}".format(len(server.devices(favorite=True))))
+    temperatures = server.devices(filter=dom.Device.FILTER_TEMP, used=True)
+    print(temperatures, temperatures.query)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import time
+
+
+class CountingTransport(dom.Transport):
+    """Transport which counts the requests"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = 0
+
+    def get(self, url, *args, **kwargs):
+        self.requests += 1
+        return super().get(url, *args, **kwargs)
+
+
+def changed(dev, changes):
+    print("Changed ............... : {} - {}".format(dev, changes))
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    transport = CountingTransport()
+    server = dom.Server(transport=transport)
+    subscription = server.subscribe(None, changed, debounce=2)
+    print(subscription)
+    print(server.events)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Requests per poll, the default fields need no call per device")
+    print("--------------------------------------------------------------------------------")
+    server.poller.stop()
+    for poll in range(3):
+        before = transport.requests
+        server.poller.poll()
+        print("Poll {} ................ : {} request(s)".format(poll + 1, transport.requests - before))
+    server.poller.start()
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Wait 20 seconds for changes, change some devices in Domoticz")
+    print("--------------------------------------------------------------------------------")
+    time.sleep(20)
+    server.unsubscribe(subscription)
+    print(server.events)
+
+
+if __name__ == "__main__":
+    main()
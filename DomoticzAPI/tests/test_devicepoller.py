@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import time
+
+
+def changed(dev):
+    print("Changed ............... : {} - {}".format(dev, dev.data))
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    poller = dom.DevicePoller(server, interval=2)
+    poller.add_listener(changed)
+    poller.poll()
+    print(poller)
+    print(poller.devices)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Poll for 10 seconds, change some devices in Domoticz")
+    print("--------------------------------------------------------------------------------")
+    poller.start()
+    time.sleep(10)
+    poller.stop()
+    print(poller)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    registry = dom.DeviceRegistry(server)
+    print(registry)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Lookups")
+    print("--------------------------------------------------------------------------------")
+    if len(registry) > 0:
+        dev = registry.devices[0]
+        print("find(\"{}\") ........... : {}".format(dev.name, registry.find(dev.name)))
+        print("by_hardware({}) ......... : {}".format(dev.hardwareid, len(registry.by_hardware(dev.hardwareid))))
+        print("by_type(\"{}\") ......... : {}".format(dev.type, len(registry.by_type(dev.type))))
+        print("by_type(\"{}\", \"{}\") .. : {}".format(dev.type, dev.subtype, len(registry.by_type(dev.type, dev.subtype))))
+        for planid in dev.planids or []:
+            print("by_plan({}) ............. : {}".format(planid, len(registry.by_plan(planid))))
+    print("favorites() ........... : {}".format(len(registry.favorites())))
+    print("find(\"xyz\") ........... : {}".format(registry.find("xyz")))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Incremental update")
+    print("--------------------------------------------------------------------------------")
+    poller = dom.DevicePoller(server, devices=registry)
+    print("Changed ............... : {}".format(len(poller.poll())))
+
+
+if __name__ == "__main__":
+    main()
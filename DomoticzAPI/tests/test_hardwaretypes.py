@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    types = server.hardware_types
+    print(types)
+    print("Cache directory ....... : {}".format(server.cache_dir))
+    print("Nr of hardware types .. : {}".format(len(types)))
+    print("name({}) .............. : {}".format(dom.HTYPE_DUMMY, types.name(dom.HTYPE_DUMMY)))
+    print("idx(\"{}\") : {}".format(types.name(dom.HTYPE_DUMMY), types.idx(types.name(dom.HTYPE_DUMMY))))
+    print("name(-1) .............. : {}".format(types.name(-1)))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Invalidate")
+    print("--------------------------------------------------------------------------------")
+    types.invalidate()
+    print("Nr of hardware types .. : {}".format(len(types)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    registry = server.scene_registry
+    print(registry)
+    print("Nr of scenes/groups ... : {}".format(len(registry)))
+    for scene in registry:
+        print(scene)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Lookup")
+    print("--------------------------------------------------------------------------------")
+    if len(registry) > 0:
+        scene = registry.scenes[0]
+        print("get({}) ................ : {}".format(scene.idx, registry.get(scene.idx)))
+        print("find(\"{}\") ........... : {}".format(scene.name, registry.find(scene.name)))
+        print("Scene(idx={}) .......... : {}".format(scene.idx, dom.Scene(server, idx=scene.idx)))
+    print("find(\"xyz\") ........... : {}".format(registry.find("xyz")))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Refresh")
+    print("--------------------------------------------------------------------------------")
+    registry.refresh()
+    print(registry)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+from datetime import date, timedelta
+import time
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    print(server.sun_times())
+    print("Sunrise ............... : {}".format(server.sunrise_dt))
+    print("Sunset ................ : {}".format(server.sunset_dt))
+    print("Is day ................ : {}".format(server.is_day))
+    print("Is night .............. : {}".format(server.is_night))
+    start = time.perf_counter()
+    for i in range(10000):
+        server.is_day
+    print("10000 x is_day ........ : {:.1f} ms".format((time.perf_counter() - start) * 1000))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Computed from the Location setting")
+    print("--------------------------------------------------------------------------------")
+    print(server.solar_calculator)
+    if server.solar_calculator is not None:
+        today = server.solar_calculator.sun_times(date.today())
+        print("Today ................. : {}".format(today))
+        print("Sunrise difference .... : {}".format(today.sunrise - server.sunrise_dt))
+        for days in range(1, 8):
+            print(server.sun_times(date.today() + timedelta(days=days)))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Without getSunRiseSet")
+    print("--------------------------------------------------------------------------------")
+    local = dom.Server(local_sun=True)
+    print(local.sun_times())
+    print("Is day ................ : {}".format(local.is_day))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Any location")
+    print("--------------------------------------------------------------------------------")
+    calculator = dom.SolarCalculator(52.37, 4.89)
+    for day in (date(2021, 3, 21), date(2021, 6, 21), date(2021, 12, 21)):
+        times = calculator.sun_times(day)
+        print("{} : day length {}".format(times, times.daylength))
+    print(dom.SolarCalculator(78.22, 15.65).sun_times(date(2021, 6, 21)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import time
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    index = server.timer_index
+    start = time.perf_counter()
+    timers = index.load_all()
+    print("Load all .............. : {} timers, {:.3f} s".format(len(timers), time.perf_counter() - start))
+    print(index)
+    for timer in timers[:5]:
+        print(timer)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Add and delete a timer")
+    print("--------------------------------------------------------------------------------")
+    hw = dom.Hardware(server, type=15, name="Test Hardware")
+    hw.add()
+    dev = dom.Device(server, hw, "Test Device", type=244, subtype=73)  # Switch
+    dev.add()
+    if dev.exists():
+        index.refresh(dev)
+        print("Timers of device ...... : {}".format(len(index.timers(dev))))
+        tmr = dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_ON_TIME, 7, 30, dom.TimerDays.Monday, None, 0, 0, 0, False, 0, 100)
+        tmr.add()
+        print("New timer idx ......... : {}".format(tmr.idx))
+        print("In index .............. : {}".format(index.get(tmr.idx) is tmr))
+        print("Timers of device ...... : {}".format(len(index.timers(dev))))
+        idx = tmr.idx
+        tmr.delete()
+        print("Deleted from index .... : {}".format(index.get(idx) is None))
+        dev.delete()
+    hw.delete()
+
+
+if __name__ == "__main__":
+    main()
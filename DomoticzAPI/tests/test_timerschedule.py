@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+from datetime import datetime, timedelta
+import time
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    print("Sunrise ............... : {}".format(server.sunrise))
+    print("Sunset ................ : {}".format(server.sunset))
+    server.timer_index.load_all()
+    schedule = server.timer_schedule()
+    start = time.perf_counter()
+    events = schedule.between(datetime.now(), datetime.now() + timedelta(days=7))
+    print("Week ahead ............ : {} events, {:.1f} ms".format(len(events), (time.perf_counter() - start) * 1000))
+    for event in schedule.next(10):
+        print(event)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Next fire of one timer")
+    print("--------------------------------------------------------------------------------")
+    hw = dom.Hardware(server, type=15, name="Test Hardware")
+    hw.add()
+    dev = dom.Device(server, hw, "Test Device", type=244, subtype=73)  # Switch
+    dev.add()
+    if dev.exists():
+        timers = [
+            dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_ON_TIME, 7, 30, dom.TimerDays.Monday | dom.TimerDays.Friday, None, 0, 0, 0, False, 0, 100),
+            dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_AFTER_SUNSET, 0, 15, dom.TimerDays.EveryDay, None, 0, 0, 0, False, 0, 100),
+            dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_MONTHLY_WD, 8, 0, dom.TimerDays.Sunday, None, 5, 0, 0, False, 0, 100),
+            dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_YEARLY, 9, 0, dom.TimerDays.EveryDay, None, 0, 25, 12, False, 0, 100),
+        ]
+        for tmr in timers:
+            tmr.add()
+            print("{} : {}".format(tmr.timertype.name, tmr.next_fire()))
+        dev.delete()
+    hw.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    hw = dom.Hardware(server, type=15, name="Test Hardware")
+    hw.add()
+    dev = dom.Device(server, hw, "Test Device", type=244, subtype=73)  # Switch
+    dev.add()
+    if dev.exists():
+        dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_ON_TIME, 6, 0, dom.TimerDays.Monday, None, 0, 0, 0, False, 0, 100).add()
+        dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_ON_TIME, 7, 0, dom.TimerDays.Monday, None, 0, 0, 0, False, 0, 100).add()
+        dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_ON_TIME, 8, 0, dom.TimerDays.Monday, None, 0, 0, 0, False, 0, 100).add()
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Synchronise")
+        print("--------------------------------------------------------------------------------")
+        desired = [
+            dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_ON_TIME, 6, 0, dom.TimerDays.Monday, None, 0, 0, 0, False, 0, 100),
+            dom.DeviceTimer(dev, True, dom.TimerTypes.TME_TYPE_AFTER_SUNSET, 0, 30, dom.TimerDays.EveryDay, None, 0, 0, 0, False, 0, 100),
+        ]
+        sync = server.timer_sync({dev: desired})
+        print(sync)
+        for change in sync.execute():
+            print(change)
+        print("Timers of device ...... : {}".format([timer.idx for timer in server.timer_index.timers(dev)]))
+        print("Desired timers ........ : {}".format([timer.idx for timer in desired]))
+        print("Again ................. : {}".format(server.timer_sync({dev: desired}).summary()))
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Failed retrieval of the timers")
+        print("--------------------------------------------------------------------------------")
+        index = dom.TimerIndex(server)
+        server._timer_index = index
+        fetch = index._fetch
+        index._fetch = lambda owner: None  # Every retrieval of timers fails
+        index._put(desired[0])  # In the index without its data from Domoticz
+        sync = server.timer_sync({dev: desired})
+        print("Without data .......... : {} - failed: {}".format(sync, sync.failed))
+        index._fetch = fetch
+        sync = server.timer_sync({dev: desired})
+        print("Retrieved again ....... : {} - failed: {}".format(sync, sync.failed))
+
+        print("\r")
+        print("--------------------------------------------------------------------------------")
+        print("Remove all timers")
+        print("--------------------------------------------------------------------------------")
+        sync = server.timer_sync({dev: []})
+        sync.execute()
+        print(sync)
+        dev.delete()
+    hw.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ def main():
     server = dom.Server()
     print("Server language: {}".format(server.language))
     print(server.translation)
+    print("Cache directory: {}".format(server.cache_dir))
     print("Translation language: {}".format(server.translation.language))
     server.translation.language = "nl"
     print("Translation language: {}".format(server.translation.language))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import time
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server(pool_size=4, retries=2, connect_timeout=3, read_timeout=10)
+    print(server.transport)
+    print("Timeout ............... : {}".format(server.transport.timeout))
+    print("Keep alive ............ : {}".format(server.transport.keep_alive))
+    start = time.perf_counter()
+    for i in range(10):
+        server.api.call("type=command&param=getversion")
+    print("10 calls .............. : {:.3f} s".format(time.perf_counter() - start))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Shared transport")
+    print("--------------------------------------------------------------------------------")
+    other = dom.Server(transport=server.transport)
+    print("Same transport ........ : {}".format(other.transport is server.transport))
+    print(other)
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Unreachable server")
+    print("--------------------------------------------------------------------------------")
+    start = time.perf_counter()
+    unreachable = dom.Server(address="10.255.255.1", retries=0, connect_timeout=1)
+    print("exists() .............. : {}".format(unreachable.exists()))
+    print("Time .................. : {:.1f} s".format(time.perf_counter() - start))
+    server.transport.close()
+
+
+if __name__ == "__main__":
+    main()
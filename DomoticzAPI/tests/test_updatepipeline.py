@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import DomoticzAPI as dom
+import random
+
+
+def main():
+    print("********************************************************************************")
+    print("Test script ........... : {} ({})".format(__file__, dom.VERSION))
+    print("********************************************************************************")
+    server = dom.Server()
+    sensors = [dev for dev in server.devices() if dev.is_thermometer() and dev.hardware.is_dummy()]
+    print("Nr of virtual sensors . : {}".format(len(sensors)))
+
+    print("\r")
+    print("--------------------------------------------------------------------------------")
+    print("Send 3 readings for each sensor, only the last one is sent")
+    print("--------------------------------------------------------------------------------")
+    pipeline = server.update_pipeline()
+    rows = []
+    for i in range(3):
+        for dev in sensors:
+            rows.append((dev.idx, 0, "{:.1f}".format(random.uniform(15, 25))))
+    stats = pipeline.send(rows)
+    print(stats)
+    print("Failed ................ : {}".format(stats.failed))
+
+
+if __name__ == "__main__":
+    main()
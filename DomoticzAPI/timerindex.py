@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .devicetimer import DeviceTimer
+from .scene import Scene
+from .scenetimer import SceneTimer
+from .setpointtimer import SetPointTimer
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+
+class TimerIndex:
+    """
+        Domoticz TimerIndex class
+
+        The timers of many devices, thermostats and scenes, retrieved concurrently
+        with a bounded number of calls at the same time. The timers are indexed
+        by their device or scene, and by timer idx.
+
+            index = server.timer_index
+            index.load_all()
+            for timer in index.timers(device):
+                print(timer)
+
+        Domoticz keeps device timers, setpoint timers and scene timers in separate
+        tables, so the kind of timer is part of each key: "timers", "setpointtimers"
+        or "scenetimers".
+    """
+
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, server, workers=DEFAULT_WORKERS):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default = 8
+        """
+        self._server = server
+        self._workers = workers
+        self._lock = threading.Lock()
+        # (kind, device or scene idx) -> {timer idx: timer}
+        self._by_owner = {}
+        # (kind, timer idx) -> timer
+        self._by_idx = {}
+        # (kind, timer idx) -> timer dict from Domoticz
+        self._payloads = {}
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, str(self._server), len(self))
+
+    def __iter__(self):
+        return iter(list(self._by_idx.values()))
+
+    def __len__(self):
+        return len(self._by_idx)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    @staticmethod
+    def _timer_class(owner):
+        if isinstance(owner, Scene):
+            return SceneTimer
+        if owner.type == "Thermostat":
+            return SetPointTimer
+        return DeviceTimer
+
+    def _owner_key(self, owner):
+        return (self._timer_class(owner)._param_timers, owner.idx)
+
+    def _fetch(self, owner):
+        # Timers of one device or scene, None if the call failed
+        timer_class = self._timer_class(owner)
+        response = self._server.api.call("type={}&idx={}".format(timer_class._param_timers, owner.idx))
+        if not response.is_OK():
+            return None
+        return response.payload or []
+
+    def _set(self, owner, payload):
+        # Replace the timers of owner with the timers in payload
+        timer_class = self._timer_class(owner)
+        kind = timer_class._param_timers
+        timers = {}
+        payloads = {}
+        for var in payload:
+            timer = timer_class(owner, is_from_factory=True, **var)
+            timers[timer.idx] = timer
+            payloads[timer.idx] = var
+        with self._lock:
+            for idx in self._by_owner.pop((kind, owner.idx), {}):
+                self._by_idx.pop((kind, idx), None)
+                self._payloads.pop((kind, idx), None)
+            self._by_owner[(kind, owner.idx)] = timers
+            for idx, timer in timers.items():
+                self._by_idx[(kind, idx)] = timer
+                self._payloads[(kind, idx)] = payloads[idx]
+        return list(timers.values())
+
+    def _payload(self, timer):
+        # Timer dict from Domoticz of the timer with the idx of timer, None if not loaded
+        return self._payloads.get((timer._param_timers, timer.idx))
+
+    def _put(self, timer):
+        # Use this timer object for its idx
+        with self._lock:
+            kind = timer._param_timers
+            self._by_owner.setdefault((kind, timer.device.idx), {})[timer.idx] = timer
+            self._by_idx[(kind, timer.idx)] = timer
+
+    def _is_loaded(self, owner):
+        # Timers of owner are in the index, all with their timer dict from Domoticz
+        kind, idx = self._owner_key(owner)
+        timers = self._by_owner.get((kind, idx))
+        return timers is not None and all((kind, timer_idx) in self._payloads for timer_idx in timers)
+
+    def _timer_idxs(self, owner):
+        # Timer idxs of owner in the index, None if not loaded
+        timers = self._by_owner.get(self._owner_key(owner))
+        return set(timers) if timers is not None else None
+
+    def _discard(self, timer):
+        with self._lock:
+            kind = timer._param_timers
+            self._by_idx.pop((kind, timer.idx), None)
+            self._payloads.pop((kind, timer.idx), None)
+            timers = self._by_owner.get((kind, timer.device.idx))
+            if timers is not None:
+                timers.pop(timer.idx, None)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def get(self, idx, kind=DeviceTimer._param_timers):
+        """Timer with idx, or None if not loaded
+
+        Args:
+            idx (:obj:`int`): idx of the timer
+            kind (:obj:`str`, optional): "timers", "setpointtimers" or "scenetimers". Default "timers"
+        """
+        return self._by_idx.get((kind, int(idx))) if idx is not None else None
+
+    def load(self, owners):
+        """Retrieve the timers of the devices and scenes concurrently
+
+        Args:
+            owners: iterable of :obj:`Device` and :obj:`Scene`
+
+        Returns:
+            :obj:`list` of the timers
+        """
+        owners = [owner for owner in owners if owner is not None and owner.exists()]
+        result = []
+        if owners:
+            with ThreadPoolExecutor(max_workers=max(1, min(self._workers, len(owners)))) as executor:
+                for owner, payload in zip(owners, executor.map(self._fetch, owners)):
+                    if payload is not None:
+                        result.extend(self._set(owner, payload))
+        return result
+
+    def load_all(self):
+        """Retrieve the timers of all devices, thermostats and scenes of the server
+
+        Returns:
+            :obj:`list` of the timers
+        """
+        return self.load(list(self._server.devices()) + self._server.scene_registry.scenes)
+
+    def refresh(self, owner):
+        """Retrieve the timers of one device or scene again
+
+        Returns:
+            :obj:`list` of the timers
+        """
+        return self.load([owner])
+
+    def timers(self, owner):
+        """:obj:`list` of the timers of a :obj:`Device` or :obj:`Scene` in the index"""
+        return list(self._by_owner.get(self._owner_key(owner), {}).values())
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
+
+    @property
+    def workers(self):
+        """Maximum number of concurrent calls"""
+        return self._workers
+
+    @workers.setter
+    def workers(self, value):
+        self._workers = value
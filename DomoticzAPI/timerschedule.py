@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .basetimer import TimerDays, TimerTypes
+from bisect import bisect_left
+from calendar import monthrange
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+
+class TimerEvent:
+
+    __slots__ = ("_time", "_timer")
+
+    def __init__(self, time, timer):
+        """A moment that a timer fires
+
+        Args:
+            time (:obj:`datetime`): local time of the server
+            timer (:obj:`BaseTimer`): the timer
+        """
+        self._time = time
+        self._timer = timer
+
+    def __str__(self):
+        return "{}({}, {} {})".format(self.__class__.__name__,
+                                      self._time.strftime("%Y-%m-%d %H:%M"),
+                                      self._timer.__class__.__name__,
+                                      self._timer.idx)
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def time(self):
+        """:obj:`datetime`"""
+        return self._time
+
+    @property
+    def timer(self):
+        """:obj:`BaseTimer`"""
+        return self._timer
+
+
+class TimerSchedule:
+    """
+        Domoticz TimerSchedule class
+
+        Computes when timers fire, without calls to Domoticz. The events of a
+        window of days are computed once and kept sorted by time, so the next
+        events of all timers are found with a binary search.
+
+            schedule = server.timer_schedule()      # the timers in server.timer_index
+            for event in schedule.next(10):
+                print(event.time, event.timer)
+
+        The times of sunrise, sunset, sun at south and twilight of each day come
+        from server.sun_times. When only the times of today are known, they are
+        used for every day. Inactive timers never fire, and the randomness of a
+        timer is ignored.
+    """
+
+    DEFAULT_DAYS = 7
+
+    # Longest search for the next time of one timer: a yearly timer on 29 February
+    MAX_DAYS = 8 * 366
+
+    # Timer type -> (server sun property, sign of the offset)
+    SUN_TYPES = {
+        TimerTypes.TME_TYPE_BEFORE_SUNRISE: ("sunrise", -1),
+        TimerTypes.TME_TYPE_AFTER_SUNRISE: ("sunrise", 1),
+        TimerTypes.TME_TYPE_BEFORE_SUNSET: ("sunset", -1),
+        TimerTypes.TME_TYPE_AFTER_SUNSET: ("sunset", 1),
+        TimerTypes.TME_TYPE_BEFORESUNATSOUTH: ("sunatsouth", -1),
+        TimerTypes.TME_TYPE_AFTERSUNATSOUTH: ("sunatsouth", 1),
+        TimerTypes.TME_TYPE_BEFORECIVTWSTART: ("civtwilightstart", -1),
+        TimerTypes.TME_TYPE_AFTERCIVTWSTART: ("civtwilightstart", 1),
+        TimerTypes.TME_TYPE_BEFORECIVTWEND: ("civtwilightend", -1),
+        TimerTypes.TME_TYPE_AFTERCIVTWEND: ("civtwilightend", 1),
+        TimerTypes.TME_TYPE_BEFORENAUTTWSTART: ("nauttwilightstart", -1),
+        TimerTypes.TME_TYPE_AFTERNAUTTWSTART: ("nauttwilightstart", 1),
+        TimerTypes.TME_TYPE_BEFORENAUTTWEND: ("nauttwilightend", -1),
+        TimerTypes.TME_TYPE_AFTERNAUTTWEND: ("nauttwilightend", 1),
+        TimerTypes.TME_TYPE_BEFOREASTTWSTART: ("astrtwilightstart", -1),
+        TimerTypes.TME_TYPE_AFTERASTTWSTART: ("astrtwilightstart", 1),
+        TimerTypes.TME_TYPE_BEFOREASTTWEND: ("astrtwilightend", -1),
+        TimerTypes.TME_TYPE_AFTERASTTWEND: ("astrtwilightend", 1),
+    }
+
+    # Timer types that fire on the week days of the timer, when the day has the condition
+    WEEKLY_TYPES = {
+        TimerTypes.TME_TYPE_ON_TIME: None,
+        TimerTypes.TME_TYPE_DAYSODD: "odd_day",
+        TimerTypes.TME_TYPE_DAYSEVEN: "even_day",
+        TimerTypes.TME_TYPE_WEEKSODD: "odd_week",
+        TimerTypes.TME_TYPE_WEEKSEVEN: "even_week",
+    }
+
+    # Day flags of Domoticz besides the TimerDays of the week days
+    DAYS_EVERYDAY = 0x80
+    DAYS_WEEKDAYS = 0x100
+    DAYS_WEEKENDS = 0x200
+
+    def __init__(self, server, timers=None, days=DEFAULT_DAYS):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server, for the sun times
+            timers (optional): iterable of timers. Default all timers in server.timer_index
+            days (:obj:`int`, optional): number of days of the window that is computed at once. Default = 7
+        """
+        self._server = server
+        self._timers = list(timers) if timers is not None else None
+        self._days = days
+        self._rules = None
+        self._weekly = None
+        self._sun = None
+        self._start = None
+        self._end = None
+        self._times = []
+        self._events = []
+
+    def __str__(self):
+        return "{}({}, {} events)".format(self.__class__.__name__, str(self._server), len(self._events))
+
+    def __len__(self):
+        return len(self._events)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    @classmethod
+    def _day_mask(cls, days):
+        # TimerDays of the week days a timer may fire
+        days = int(days)
+        if days == TimerDays.EveryDay or days & cls.DAYS_EVERYDAY:
+            return 0x7F
+        if days & cls.DAYS_WEEKDAYS:
+            return 0x1F
+        if days & cls.DAYS_WEEKENDS:
+            return 0x60
+        return days & 0x7F
+
+    @classmethod
+    def _rule(cls, timer):
+        # What is needed of a timer for each day, None if it never fires
+        if not timer.active:
+            return None
+        timertype = timer.timertype
+        if timertype == TimerTypes.TME_TYPE_FIXED_DATETIME:
+            fixed = datetime.strptime(timer.date, "%Y-%m-%d").date() if timer.date else None
+            if fixed is None:
+                return None
+        else:
+            fixed = None
+        sun, sign = cls.SUN_TYPES.get(timertype, (None, 1))
+        return (timer,
+                timertype,
+                sign * (timer.hour * 60 + timer.minute),
+                cls._day_mask(timer.days),
+                sun,
+                fixed,
+                timer.occurence,
+                timer.mday,
+                timer.month)
+
+    def _load_sun(self, day):
+        # Minutes after midnight of the sun times of a day, or else of today
+        times = self._server.sun_times(day)
+        if times is None:
+            times = self._server.sun_times()
+        sun = {}
+        for name, sign in self.SUN_TYPES.values():
+            value = times.get(name) if times is not None else None
+            sun[name] = value.hour * 60 + value.minute if value is not None else None
+        return sun
+
+    def _sun_minutes(self, day):
+        # Sun times of a day
+        if self._sun is None:
+            self._sun = {}
+        sun = self._sun.get(day)
+        if sun is None:
+            sun = self._sun[day] = self._load_sun(day)
+        return sun
+
+    @staticmethod
+    def _day_facts(day):
+        bit = 1 << day.weekday()
+        last = monthrange(day.year, day.month)[1]
+        return (day,
+                datetime(day.year, day.month, day.day),
+                bit,
+                day.day % 2 == 1,
+                day.isocalendar()[1] % 2 == 1,
+                (day.day - 1) // 7 + 1,
+                day.day + 7 > last)
+
+    def _minutes(self, rule, facts, sun):
+        # Minutes after midnight that the timer fires on the day, or None
+        timer, timertype, offset, mask, sun_name, fixed, occurence, mday, month = rule
+        day, midnight, bit, odd_day, odd_week, week_of_month, last_week = facts
+        if sun_name is not None:
+            base = sun.get(sun_name)
+            if base is None or not mask & bit:
+                return None
+            return base + offset
+        if timertype == TimerTypes.TME_TYPE_ON_TIME:
+            fires = mask & bit
+        elif timertype == TimerTypes.TME_TYPE_FIXED_DATETIME:
+            fires = day == fixed
+        elif timertype == TimerTypes.TME_TYPE_DAYSODD:
+            fires = odd_day
+        elif timertype == TimerTypes.TME_TYPE_DAYSEVEN:
+            fires = not odd_day
+        elif timertype == TimerTypes.TME_TYPE_WEEKSODD:
+            fires = odd_week and mask & bit
+        elif timertype == TimerTypes.TME_TYPE_WEEKSEVEN:
+            fires = not odd_week and mask & bit
+        elif timertype == TimerTypes.TME_TYPE_MONTHLY:
+            fires = day.day == mday
+        elif timertype == TimerTypes.TME_TYPE_MONTHLY_WD:
+            # occurence 1 to 4, or 5 for the last week day of the month
+            fires = mask & bit and (week_of_month == occurence or (occurence == 5 and last_week))
+        elif timertype == TimerTypes.TME_TYPE_YEARLY:
+            fires = day.month == month and day.day == mday
+        elif timertype == TimerTypes.TME_TYPE_YEARLY_WD:
+            fires = day.month == month and mask & bit \
+                and (week_of_month == occurence or (occurence == 5 and last_week))
+        else:
+            fires = False
+        return offset if fires else None
+
+    def _prepare(self):
+        # Timers that depend on the week day are kept per week day, the others as rules
+        timers = self._timers if self._timers is not None else self._server.timer_index
+        self._rules = []
+        self._weekly = [[] for weekday in range(7)]
+        for rule in map(self._rule, timers):
+            if rule is None:
+                continue
+            timer, timertype, offset, mask, sun_name = rule[:5]
+            if timertype in self.WEEKLY_TYPES or sun_name is not None:
+                condition = self.WEEKLY_TYPES.get(timertype)
+                if timertype in (TimerTypes.TME_TYPE_DAYSODD, TimerTypes.TME_TYPE_DAYSEVEN):
+                    mask = 0x7F
+                entry = (condition, sun_name, timedelta(minutes=offset), timer.idx or 0, timer)
+                for weekday in range(7):
+                    if mask & (1 << weekday):
+                        self._weekly[weekday].append(entry)
+            else:
+                self._rules.append(rule)
+
+    def _build(self, start, end):
+        # All events from start until end, sorted by time
+        if self._rules is None:
+            self._prepare()
+        events = []
+        # A day earlier and later, for sun times with a large offset
+        day = start.date() - timedelta(days=1)
+        while day <= end.date() + timedelta(days=1):
+            facts = self._day_facts(day)
+            midnight = facts[1]
+            sun = self._sun_minutes(day)
+            # Start of the day, or the sun time, for each condition and sun time of this day
+            bases = {(None, None): midnight}
+            for sun_name, minutes in sun.items():
+                if minutes is not None:
+                    bases[(None, sun_name)] = midnight + timedelta(minutes=minutes)
+            for condition in ("odd_day" if facts[3] else "even_day", "odd_week" if facts[4] else "even_week"):
+                bases[(condition, None)] = midnight
+            for condition, sun_name, delta, idx, timer in self._weekly[day.weekday()]:
+                base = bases.get((condition, sun_name))
+                if base is not None:
+                    time = base + delta
+                    if start <= time < end:
+                        events.append((time, idx, timer))
+            for rule in self._rules:
+                minutes = self._minutes(rule, facts, sun)
+                if minutes is not None:
+                    time = midnight + timedelta(minutes=minutes)
+                    if start <= time < end:
+                        events.append((time, rule[0].idx or 0, rule[0]))
+            day += timedelta(days=1)
+        events.sort(key=itemgetter(0, 1))
+        self._start = start
+        self._end = end
+        self._times = [event[0] for event in events]
+        self._events = [TimerEvent(event[0], event[2]) for event in events]
+
+    def _window(self, after, n=0):
+        # Compute the window again when after is outside it, and make it longer
+        # until it has n events from after, or it spans MAX_DAYS
+        if self._start is None or not self._start <= after < self._end:
+            start = after.replace(second=0, microsecond=0)
+            self._build(start, start + timedelta(days=self._days))
+        while len(self._events) - bisect_left(self._times, after) < n \
+                and self._end - self._start < timedelta(days=self.MAX_DAYS):
+            self._build(self._start, self._start + min((self._end - self._start) * 2, timedelta(days=self.MAX_DAYS)))
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def between(self, start, end):
+        """Events from start until end
+
+        Args:
+            start (:obj:`datetime`): first time, included
+            end (:obj:`datetime`): last time, not included
+
+        Returns:
+            :obj:`list` of :obj:`TimerEvent`, sorted by time
+        """
+        if self._start is None or start < self._start or end > self._end:
+            self._build(start, max(end, start + timedelta(days=self._days)))
+        return self._events[bisect_left(self._times, start):bisect_left(self._times, end)]
+
+    def next(self, n=1, after=None):
+        """The next events of all timers
+
+        Args:
+            n (:obj:`int`, optional): number of events. Default = 1
+            after (:obj:`datetime`, optional): events at or after this time. Default the current time of the server
+
+        Returns:
+            :obj:`list` of :obj:`TimerEvent`, sorted by time. The window of days is made
+            longer for more events, so fewer than n only when the timers fire less than
+            n times in MAX_DAYS.
+        """
+        after = after if after is not None else self._server._now()
+        self._window(after, n)
+        first = bisect_left(self._times, after)
+        return self._events[first:first + n]
+
+    def next_fire(self, timer, after=None):
+        """Next time that one timer fires, at or after the given time
+
+        Args:
+            timer (:obj:`BaseTimer`): the timer
+            after (:obj:`datetime`, optional): Default the current time of the server
+
+        Returns:
+            :obj:`datetime`, or None if the timer does not fire anymore
+        """
+        after = after if after is not None else self._server._now()
+        rule = self._rule(timer)
+        if rule is None:
+            return None
+        day = after.date() - timedelta(days=1)
+        for i in range(self.MAX_DAYS):
+            facts = self._day_facts(day)
+            minutes = self._minutes(rule, facts, self._sun_minutes(day) if rule[4] is not None else None)
+            if minutes is not None:
+                time = facts[1] + timedelta(minutes=minutes)
+                if time >= after:
+                    return time
+            day += timedelta(days=1)
+        return None
+
+    def refresh(self):
+        """Compute again at the next use, eg. after timers or sun times were changed"""
+        self._rules = None
+        self._weekly = None
+        self._sun = None
+        self._start = None
+        self._end = None
+        self._times = []
+        self._events = []
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def days(self):
+        """Number of days that are computed at once"""
+        return self._days
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
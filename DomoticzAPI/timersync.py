@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+
+class TimerChange:
+
+    ADD = "add"
+    DELETE = "delete"
+    UPDATE = "update"
+
+    def __init__(self, action, timer, current=None):
+        """One change of a :obj:`TimerSync`
+
+        Args:
+            action (:obj:`str`): TimerChange.ADD, TimerChange.UPDATE or TimerChange.DELETE
+            timer (:obj:`BaseTimer`): desired timer to add or update, or the timer to delete
+            current (:obj:`BaseTimer`, optional): timer in Domoticz that is updated
+        """
+        self._action = action
+        self._timer = timer
+        self._current = current
+        self._response = None
+
+    def __str__(self):
+        return "{}({} {}: {})".format(self.__class__.__name__, self._action, self.idx, self.status)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _querystring(self):
+        if self._action == self.ADD:
+            return self._timer._querystring_add()
+        if self._action == self.UPDATE:
+            return self._timer._querystring_update()
+        return self._timer._querystring_delete()
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def is_OK(self):
+        return self._response is not None and self._response.is_OK()
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def action(self):
+        return self._action
+
+    @property
+    def current(self):
+        """Timer in Domoticz before an update, otherwise None"""
+        return self._current
+
+    @property
+    def idx(self):
+        """idx of the timer, None for an add that is not executed yet"""
+        return self._timer.idx
+
+    @property
+    def response(self):
+        """:obj:`APIResponse`, or None when not executed yet"""
+        return self._response
+
+    @property
+    def status(self):
+        return self._response.status if self._response is not None else None
+
+    @property
+    def timer(self):
+        return self._timer
+
+
+class TimerSync:
+    """
+        Domoticz TimerSync class
+
+        Makes the timers of devices, thermostats and scenes in Domoticz equal to
+        a desired set of timers, with the fewest adds, updates and deletes. The
+        plan is made against the timers in the :obj:`TimerIndex` of the server,
+        and the changes are sent concurrently.
+
+            sync = server.timer_sync({dev: [DeviceTimer(dev, True, ...), ...],
+                                      scene: []})
+            print(sync)          # TimerSync(add: 1, update: 0, delete: 2, unchanged: 3)
+            sync.execute()
+
+        A desired timer that is equal to a timer in Domoticz is left alone. Other
+        desired timers first reuse a timer in Domoticz that is not wanted anymore
+        (update), then the rest is added. Timers in Domoticz that remain are deleted.
+        After executing, the desired timer objects have the idx of their timer in Domoticz.
+        Devices and scenes of which the timers can not be retrieved are left alone,
+        see `failed`.
+    """
+
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, server, desired, workers=DEFAULT_WORKERS, delete=True):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            desired: :obj:`dict` of :obj:`Device` or :obj:`Scene` with a :obj:`list` of timers,
+                or an iterable of timers. Only the devices and scenes given are synchronised.
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default = 8
+            delete (:obj:`bool`, optional): delete the timers that are not desired. Default = True
+        """
+        self._server = server
+        self._workers = workers
+        self._delete = delete
+        self._lock = threading.Lock()
+        self._owners = {}
+        self._desired = {}
+        if isinstance(desired, dict):
+            for owner, timers in desired.items():
+                self._want(owner, timers)
+        else:
+            for timer in desired:
+                self._want(timer.device, [timer])
+        self._changes = None
+        self._unchanged = []
+        self._failed = []
+
+    def __str__(self):
+        summary = self.summary()
+        return "{}(add: {}, update: {}, delete: {}, unchanged: {})".format(self.__class__.__name__,
+                                                                           summary[TimerChange.ADD],
+                                                                           summary[TimerChange.UPDATE],
+                                                                           summary[TimerChange.DELETE],
+                                                                           summary["unchanged"])
+
+    def __len__(self):
+        return len(self.changes)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _want(self, owner, timers):
+        key = self._server.timer_index._owner_key(owner)
+        self._owners.setdefault(key, owner)
+        self._desired.setdefault(key, []).extend(timers)
+
+    def _plan_owner(self, key, changes, unchanged):
+        index = self._server.timer_index
+        current = sorted(index.timers(self._owners[key]), key=lambda timer: timer.idx)
+        desired = list(self._desired[key])
+        # Equal timers are left alone
+        for timer in list(desired):
+            for other in current:
+                payload = index._payload(other)
+                if (timer.idx is None or timer.idx == other.idx) and payload is not None and timer._matches(payload):
+                    timer._idx = other.idx
+                    unchanged.append(timer)
+                    desired.remove(timer)
+                    current.remove(other)
+                    break
+        # A desired timer with the idx of a timer in Domoticz updates that timer
+        for timer in list(desired):
+            for other in current:
+                if timer.idx == other.idx:
+                    changes.append(TimerChange(TimerChange.UPDATE, timer, other))
+                    desired.remove(timer)
+                    current.remove(other)
+                    break
+        # Reuse the timers that are not wanted anymore, then add
+        for timer in desired:
+            if timer.idx is None and current:
+                other = current.pop(0)
+                timer._idx = other.idx
+                changes.append(TimerChange(TimerChange.UPDATE, timer, other))
+            else:
+                timer._idx = None
+                changes.append(TimerChange(TimerChange.ADD, timer))
+        if self._delete:
+            for other in current:
+                changes.append(TimerChange(TimerChange.DELETE, other))
+
+    def _execute_change(self, change):
+        change._response = self._server.api.call(change._querystring())
+
+    def _read_back(self, changes):
+        # One call for the timers of each changed device or scene
+        index = self._server.timer_index
+        known = {}
+        owners = {}
+        for change in changes:
+            key = index._owner_key(change.timer.device)
+            owners.setdefault(key, change.timer.device)
+            if change.action == TimerChange.ADD and key not in known:
+                known[key] = index._timer_idxs(change.timer.device) or set()
+        index.load(owners.values())
+        for change in changes:
+            if not change.is_OK():
+                continue
+            key = index._owner_key(change.timer.device)
+            if change.action == TimerChange.ADD:
+                # Domoticz does not return the idx: the new timers are the unknown ones
+                for other in index.timers(change.timer.device):
+                    if other.idx not in known[key] and change.timer._matches(index._payload(other)):
+                        change.timer._idx = other.idx
+                        known[key].add(other.idx)
+                        break
+            if change.action in (TimerChange.ADD, TimerChange.UPDATE) and change.timer.idx is not None:
+                index._put(change.timer)
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def execute(self):
+        """Send all changes of the plan
+
+        Returns:
+            :obj:`list` of :obj:`TimerChange`
+        """
+        changes = self.changes
+        if changes:
+            with ThreadPoolExecutor(max_workers=max(1, min(self._workers, len(changes)))) as executor:
+                # list() to raise exceptions of the workers
+                list(executor.map(self._execute_change, changes))
+            self._read_back(changes)
+        index = self._server.timer_index
+        for timer in self._unchanged:
+            index._put(timer)
+        return changes
+
+    def plan(self):
+        """Compare the desired timers with the timers in Domoticz
+
+        Retrieves the timers of the devices and scenes that are not in the
+        :obj:`TimerIndex` yet, or of which the index lacks the data of a timer.
+
+        Returns:
+            :obj:`list` of :obj:`TimerChange`
+        """
+        index = self._server.timer_index
+        with self._lock:
+            index.load([owner for owner in self._owners.values() if not index._is_loaded(owner)])
+            changes = []
+            unchanged = []
+            failed = []
+            for key in self._desired:
+                if not index._is_loaded(self._owners[key]):
+                    # Without the current timers a plan could add duplicates
+                    failed.append(self._owners[key])
+                    continue
+                self._plan_owner(key, changes, unchanged)
+            self._changes = changes
+            self._unchanged = unchanged
+            self._failed = failed
+        return changes
+
+    def summary(self):
+        """Number of timers to add, update and delete, and the number of unchanged timers
+
+        Returns:
+            :obj:`dict` with the keys "add", "update", "delete" and "unchanged"
+        """
+        result = {TimerChange.ADD: 0, TimerChange.UPDATE: 0, TimerChange.DELETE: 0}
+        for change in self.changes:
+            result[change.action] += 1
+        result["unchanged"] = len(self._unchanged)
+        return result
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def changes(self):
+        """:obj:`list` of :obj:`TimerChange`, planned at first use"""
+        if self._changes is None:
+            self.plan()
+        return list(self._changes)
+
+    @property
+    def failed(self):
+        """:obj:`list` of the devices and scenes left alone, because their timers could not be retrieved"""
+        if self._changes is None:
+            self.plan()
+        return list(self._failed)
+
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
+
+    @property
+    def unchanged(self):
+        """:obj:`list` of the desired timers that are equal to a timer in Domoticz"""
+        if self._changes is None:
+            self.plan()
+        return list(self._unchanged)
+
+    @property
+    def workers(self):
+        """Maximum number of concurrent calls"""
+        return self._workers
@@ -1,17 +1,31 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from .utilities import(os_command)
+from .utilities import (json_load_file, json_save_file)
 import json
+import os
+import re
 
 
 class Translation:
 
+    _path = "i18n/domoticz-{}.json"
+
     def __init__(self, server, **kwargs):
+        """Translations of the Domoticz user interface
+
+        The translation file is kept in the cache directory of the server, for
+        each language and Domoticz version. When cached, Domoticz is only asked
+        if the file is changed.
+
+        Args:
+            server (:obj:`Server`): Domoticz server
+            language (:obj:`str`, optional): language code, eg. "en", "nl". Default the Domoticz language setting
+        """
         self._translations = {}
         self._server = server
-        self._language = kwargs.get(
-            "language",
-            self._server.setting.get_value("Language"))
+        self._language = kwargs.get("language")
+        if self._language is None:
+            self._language = self._server.setting.get_value("Language")
         self._getTranslations()
 
     def __str__(self):
@@ -20,28 +34,49 @@ class Translation:
     # ..........................................................................
     # Private methods
     # ..........................................................................
+    def _cache_file(self):
+        # One file for each language and Domoticz version
+        if self._server is None or self._server.cache_dir is None:
+            return None
+        version = re.sub(r"[^\w.-]", "_", str(self._server.version))
+        return os.path.join(self._server.cache_dir,
+                            "i18n",
+                            "domoticz-{}-{}.json".format(self._language, version))
+
     def _getTranslations(self):
         # /i18n/domoticz-XX.json
         # Get translation for language with code XX, eg. uk, en, fr, nl, ru, etc.
-        self._server._api.querystring = None
         if self._server is not None:
-            command = "curl"
-            command += " -s -X GET \"http://{}:{}/i18n/domoticz-{}.json\"".format(
-                self._server._address,
-                self._server._port,
-                self._language)
-            try:
-                r = json.loads(os_command(command))
-                self._translations = r
-                self._server._api._message = None
-                self._server._api.status = self._server._api.OK
+            cache_file = self._cache_file()
+            cached = json_load_file(cache_file) if cache_file is not None else None
+            headers = {}
+            if cached is not None:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached.get("etag")
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached.get("last_modified")
+            response = self._server._api.get_file(self._path.format(self._language), headers=headers)
+            self._title = None
+            if response is not None and response.status_code == 304 and cached is not None:
+                self._translations = cached.get("translations", {})
+                self._title = "domoticz-{}".format(self._language)
+            elif response is not None and response.status_code == 200:
+                try:
+                    self._translations = json.loads(response.content.decode("utf-8"))
+                    self._title = "domoticz-{}".format(self._language)
+                except ValueError:
+                    pass
+                else:
+                    if cache_file is not None:
+                        json_save_file(cache_file, {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                            "translations": self._translations,
+                        })
+            elif cached is not None:
+                # Domoticz could not be reached, use the cached translations
+                self._translations = cached.get("translations", {})
                 self._title = "domoticz-{}".format(self._language)
-            except:
-                self._server._api._message = "Invalid call"
-                self._server._api._status = None
-                self._server._api._title = None
-            self._server._api._data = {}
-            self._server._api._payload = None
 
     # ..........................................................................
     # Properties
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests
+import threading
+import time
+
+
+class Transport:
+    """
+        Domoticz Transport class
+
+        The HTTP connections to Domoticz: one requests.Session with a pool of
+        keep-alive connections, retries with backoff and timeouts. All calls of
+        a server use the transport of the server. A transport can be shared by
+        several servers.
+
+        Domoticz also changes things with a GET, so only a failed connection is
+        retried for every request: the request did not reach Domoticz. A read
+        timeout or a 502/503/504 response is only retried for a GET with
+        retry=True, which the API does for the calls that only read.
+
+        Worst case a call blocks (retries + 1) x connect_timeout plus the backoff
+        when Domoticz can not be reached, about 22 seconds with the defaults. A
+        read that gets no answer blocks (retries + 1) x (connect_timeout + read_timeout)
+        plus the backoff, about 2.5 minutes with the defaults; other calls are not
+        retried after the connection is made and block at most about 50 seconds.
+    """
+
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_RETRIES = 3
+    DEFAULT_BACKOFF = 0.3
+    DEFAULT_CONNECT_TIMEOUT = 5
+    DEFAULT_READ_TIMEOUT = 30
+
+    # Retry these responses of a GET with retry=True, eg. while Domoticz is restarting behind a proxy
+    RETRY_STATUS = (502, 503, 504)
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT, keep_alive=True):
+        """
+        Args:
+            pool_size (:obj:`int`, optional): maximum number of connections kept for each host. Default = 10
+            retries (:obj:`int`, optional): number of retries of a failed connection,
+                and of a failed GET with retry=True. Default = 3
+            backoff (:obj:`float`, optional): backoff factor between retries, in seconds. Default = 0.3
+            connect_timeout (:obj:`float`, optional): seconds to wait for a connection. Default = 5
+            read_timeout (:obj:`float`, optional): seconds to wait for the response. None waits forever. Default = 30
+            keep_alive (:obj:`bool`, optional): keep the connections open for the next calls. Default = True
+        """
+        self._pool_size = pool_size
+        self._retries = retries
+        self._backoff = backoff
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._keep_alive = keep_alive
+        self._lock = threading.Lock()
+        self._session = None
+
+    def __str__(self):
+        return "{}(pool: {}, retries: {}, timeout: {})".format(self.__class__.__name__,
+                                                              self._pool_size,
+                                                              self._retries,
+                                                              self.timeout)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _retry(self):
+        # Only connection errors: the request was not sent, so retrying can't apply it twice
+        return Retry(total=self._retries,
+                     connect=self._retries,
+                     read=False,
+                     status=0,
+                     backoff_factor=self._backoff,
+                     raise_on_status=False)
+
+    def _sleep(self, attempt):
+        # Backoff before a retry, like urllib3: 0, 2 x backoff, 4 x backoff, ...
+        if attempt > 2:
+            time.sleep(self._backoff * (2 ** (attempt - 2)))
+
+    def _headers(self, headers):
+        if self._keep_alive:
+            return headers
+        result = dict(headers or {})
+        result["Connection"] = "close"
+        return result
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def close(self):
+        """Close all connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def get(self, url, auth=None, headers=None, stream=False, retry=False):
+        """GET the url
+
+        Args:
+            stream (:obj:`bool`, optional): return before the content is received,
+                to read it with iter_content. Close the response when done. Default = False
+            retry (:obj:`bool`, optional): also retry a read timeout and the responses in
+                Transport.RETRY_STATUS. Only for a GET that changes nothing. Default = False
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        attempts = self._retries + 1 if retry else 1
+        for attempt in range(1, attempts + 1):
+            self._sleep(attempt)
+            try:
+                response = self.session.get(url,
+                                            auth=auth,
+                                            headers=self._headers(headers),
+                                            stream=stream,
+                                            timeout=self.timeout,
+                                            verify=False)  # bad fix for invalid domoticz certificate
+            except requests.exceptions.ReadTimeout:
+                if attempt == attempts:
+                    raise
+                continue
+            if response.status_code not in self.RETRY_STATUS or attempt == attempts:
+                return response
+            response.close()
+
+    def post(self, url, data=None, auth=None, headers=None):
+        """POST data to the url. A POST is not retried.
+
+        Returns:
+            :obj:`requests.Response`
+        """
+        return self.session.post(url,
+                                 data=data,
+                                 auth=auth,
+                                 headers=self._headers(headers),
+                                 timeout=self.timeout,
+                                 verify=False)  # bad fix for invalid domoticz certificate
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def connect_timeout(self):
+        return self._connect_timeout
+
+    @property
+    def keep_alive(self):
+        return self._keep_alive
+
+    @property
+    def pool_size(self):
+        return self._pool_size
+
+    @property
+    def read_timeout(self):
+        return self._read_timeout
+
+    @property
+    def retries(self):
+        return self._retries
+
+    @property
+    def session(self):
+        """:obj:`requests.Session`, created at the first call"""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self._pool_size,
+                                      pool_maxsize=self._pool_size,
+                                      max_retries=self._retry())
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    @property
+    def timeout(self):
+        """(connect timeout, read timeout) in seconds"""
+        return (self._connect_timeout, self._read_timeout)
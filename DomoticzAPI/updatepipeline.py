@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from .device import Device
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+
+class UpdateStats:
+
+    def __init__(self):
+        """Throughput and failures of an :obj:`UpdatePipeline`"""
+        self._received = 0
+        self._coalesced = 0
+        self._sent = 0
+        self._failed = []
+        self._elapsed = 0.0
+
+    def __str__(self):
+        return "{}(received: {}, coalesced: {}, sent: {}, failed: {}, {:.1f} updates/s)".format(
+            self.__class__.__name__,
+            self._received,
+            self._coalesced,
+            self._sent,
+            len(self._failed),
+            self.throughput)
+
+    def _add(self, other):
+        self._received += other._received
+        self._coalesced += other._coalesced
+        self._sent += other._sent
+        self._failed.extend(other._failed)
+        self._elapsed += other._elapsed
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def coalesced(self):
+        """Updates replaced by a newer update of the same device before sending"""
+        return self._coalesced
+
+    @property
+    def elapsed(self):
+        """Seconds used for sending"""
+        return self._elapsed
+
+    @property
+    def failed(self):
+        """:obj:`list` of (idx, message) of the failed updates"""
+        return list(self._failed)
+
+    @property
+    def received(self):
+        """Updates given to the pipeline"""
+        return self._received
+
+    @property
+    def sent(self):
+        """Updates sent to Domoticz"""
+        return self._sent
+
+    @property
+    def throughput(self):
+        """Sent updates per second"""
+        return self._sent / self._elapsed if self._elapsed > 0 else 0.0
+
+
+class UpdatePipeline:
+    """
+        Domoticz UpdatePipeline class
+
+        Sends udevice updates for many devices, eg. the readings of virtual sensors.
+        Updates for the same device that are not sent yet are coalesced: only the
+        last values are sent. The updates are sent concurrently, using the
+        keep-alive connections of the server transport.
+
+            pipeline = server.update_pipeline()
+            stats = pipeline.send([(idx, nvalue, svalue), (idx, nvalue, svalue, battery, rssi), ...])
+
+        or, to coalesce the updates within a window of seconds:
+
+            pipeline = server.update_pipeline(window=10)
+            pipeline.start()
+            pipeline.put(idx, nvalue, svalue)
+            ...
+            pipeline.stop()
+    """
+
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, server, workers=DEFAULT_WORKERS, window=0):
+        """
+        Args:
+            server (:obj:`Server`): Domoticz server
+            workers (:obj:`int`, optional): maximum number of concurrent calls. Default = 8
+            window (:obj:`float`, optional): seconds to collect updates before sending them when started.
+                0 sends them as soon as they are added. Default = 0
+        """
+        self._server = server
+        self._workers = workers
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._pending_stats = UpdateStats()
+        self._stats = UpdateStats()
+        self._stop_event = threading.Event()
+        # Set when updates are added, the background thread waits for it
+        self._added = threading.Event()
+        self._thread = None
+
+    def __str__(self):
+        return "{}({}, {})".format(self.__class__.__name__, str(self._server), self._stats)
+
+    def __len__(self):
+        return len(self._pending)
+
+    # ..........................................................................
+    # Private methods
+    # ..........................................................................
+    def _run(self):
+        while not self._stop_event.is_set():
+            # Block until updates are added, then collect more during the window
+            self._added.wait()
+            if self._stop_event.wait(self._window):
+                break
+            self._added.clear()
+            self.flush()
+
+    def _send(self, item):
+        idx, querystring = item
+        response = self._server.api.call(querystring)
+        return idx, response
+
+    # ..........................................................................
+    # Public methods
+    # ..........................................................................
+    def flush(self):
+        """Send the pending updates
+
+        Returns:
+            :obj:`UpdateStats` of these updates
+        """
+        with self._lock:
+            pending = self._pending
+            stats = self._pending_stats
+            self._pending = {}
+            self._pending_stats = UpdateStats()
+        if pending:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, min(self._workers, len(pending)))) as executor:
+                for idx, response in executor.map(self._send, pending.items()):
+                    if response is not None and response.is_OK():
+                        stats._sent += 1
+                    else:
+                        stats._failed.append((idx, response.message if response is not None else None))
+            stats._elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats._add(stats)
+        return stats
+
+    def put(self, idx, nvalue, svalue, battery=None, rssi=None):
+        """Add an update. A pending update of the same device is replaced"""
+        querystring = Device._querystring_update(int(idx), nvalue, svalue, battery, rssi)
+        with self._lock:
+            self._pending_stats._received += 1
+            if int(idx) in self._pending:
+                self._pending_stats._coalesced += 1
+            self._pending[int(idx)] = querystring
+        self._added.set()
+
+    def put_many(self, rows):
+        """Add updates from an iterable of (idx, nvalue, svalue[, battery[, rssi]]) rows"""
+        for row in rows:
+            self.put(*row)
+
+    def send(self, rows):
+        """Add the updates and send all pending updates
+
+        Args:
+            rows: iterable of (idx, nvalue, svalue[, battery[, rssi]])
+
+        Returns:
+            :obj:`UpdateStats` of these updates
+        """
+        self.put_many(rows)
+        return self.flush()
+
+    def start(self):
+        """Send the added updates in a background thread, collected during window seconds"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            if not self._pending:
+                self._added.clear()
+            self._thread = threading.Thread(target=self._run,
+                                            name=self.__class__.__name__,
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and send the pending updates"""
+        self._stop_event.set()
+        # Wake the thread when it waits for updates
+        self._added.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self.flush()
+
+    # ..........................................................................
+    # Properties
+    # ..........................................................................
+    @property
+    def server(self):
+        """:obj:`Server`"""
+        return self._server
+
+    @property
+    def stats(self):
+        """:obj:`UpdateStats` of all sent updates"""
+        return self._stats
+
+    @property
+    def window(self):
+        """Seconds to collect updates before sending them when started"""
+        return self._window
+
+    @window.setter
+    def window(self, value):
+        self._window = value
+
+    @property
+    def workers(self):
+        """Maximum number of concurrent calls"""
+        return self._workers
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import base64
+import json
 import os
 import platform
 import subprocess
@@ -176,6 +177,37 @@ def int_2_bool(value):
         return False
 
 
+def json_load_file(path):
+    """ Read a json file
+
+    Returns:
+        The decoded content, or None if the file does not exist or is invalid
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def json_save_file(path, data):
+    """ Write data to a json file. The directory is created when required.
+
+    Returns:
+        True if the file is written
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write a temporary file first, so readers never see a partial file
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
 def kmh_2_ms(value):
     """Convert speed from km/h to m/s
 